@@ -2,6 +2,9 @@
 
 from .application_model import ApplicationModel
 from .application_state import ApplicationState
+from .bid_batch_error_model import BidBatchErrorModel
+from .bid_batch_request_model import BidBatchRequestModel
+from .bid_batch_response_model import BidBatchResponseModel
 from .bid_criteria import BidCriteria
 from .bid_request_model import BidRequestModel
 from .bid_response_model import BidResponseModel
@@ -12,6 +15,7 @@ from .metric import Metric
 from .metric_unit import MetricUnit
 from .metric_value import MetricValue
 from .namespaced_name_model import NamespacedNameModel
+from .placement_strategy import PlacementStrategy
 from .scheduling_entry import SchedulingEntry
 from .trace_log_row_model import TraceLogRowModel
 from .validation_error import ValidationError
@@ -19,6 +23,9 @@ from .validation_error import ValidationError
 __all__ = (
     "ApplicationModel",
     "ApplicationState",
+    "BidBatchErrorModel",
+    "BidBatchRequestModel",
+    "BidBatchResponseModel",
     "BidCriteria",
     "BidRequestModel",
     "BidResponseModel",
@@ -29,6 +36,7 @@ __all__ = (
     "MetricUnit",
     "MetricValue",
     "NamespacedNameModel",
+    "PlacementStrategy",
     "SchedulingEntry",
     "TraceLogRowModel",
     "ValidationError",
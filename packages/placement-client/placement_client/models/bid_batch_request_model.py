@@ -0,0 +1,74 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, TYPE_CHECKING
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+
+if TYPE_CHECKING:
+    from ..models.bid_request_model import BidRequestModel
+
+
+T = TypeVar("T", bound="BidBatchRequestModel")
+
+
+@_attrs_define
+class BidBatchRequestModel:
+    """
+    Attributes:
+        bids (list['BidRequestModel']):
+    """
+
+    bids: list["BidRequestModel"]
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        bids = []
+        for bids_item_data in self.bids:
+            bids_item = bids_item_data.to_dict()
+            bids.append(bids_item)
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "bids": bids,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.bid_request_model import BidRequestModel
+
+        d = dict(src_dict)
+        bids = []
+        _bids = d.pop("bids")
+        for bids_item_data in _bids:
+            bids_item = BidRequestModel.from_dict(bids_item_data)
+
+            bids.append(bids_item)
+
+        bid_batch_request_model = cls(
+            bids=bids,
+        )
+
+        bid_batch_request_model.additional_properties = d
+        return bid_batch_request_model
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,92 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, TYPE_CHECKING
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+
+if TYPE_CHECKING:
+    from ..models.bid_response_model import BidResponseModel
+    from ..models.bid_batch_error_model import BidBatchErrorModel
+
+
+T = TypeVar("T", bound="BidBatchResponseModel")
+
+
+@_attrs_define
+class BidBatchResponseModel:
+    """
+    Attributes:
+        responses (list['BidResponseModel']):
+        errors (list['BidBatchErrorModel']):
+    """
+
+    responses: list["BidResponseModel"]
+    errors: list["BidBatchErrorModel"]
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        responses = []
+        for responses_item_data in self.responses:
+            responses_item = responses_item_data.to_dict()
+            responses.append(responses_item)
+
+        errors = []
+        for errors_item_data in self.errors:
+            errors_item = errors_item_data.to_dict()
+            errors.append(errors_item)
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "responses": responses,
+                "errors": errors,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.bid_response_model import BidResponseModel
+        from ..models.bid_batch_error_model import BidBatchErrorModel
+
+        d = dict(src_dict)
+        responses = []
+        _responses = d.pop("responses")
+        for responses_item_data in _responses:
+            responses_item = BidResponseModel.from_dict(responses_item_data)
+
+            responses.append(responses_item)
+
+        errors = []
+        _errors = d.pop("errors")
+        for errors_item_data in _errors:
+            errors_item = BidBatchErrorModel.from_dict(errors_item_data)
+
+            errors.append(errors_item)
+
+        bid_batch_response_model = cls(
+            responses=responses,
+            errors=errors,
+        )
+
+        bid_batch_response_model.additional_properties = d
+        return bid_batch_response_model
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -4,9 +4,13 @@ from typing import Any, TypeVar, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import UNSET, Unset
 
 from ..models.bid_criteria import BidCriteria
 from ..models.metric import Metric
+from ..models.placement_strategy import PlacementStrategy
+from typing import cast
+from typing import Union
 
 if TYPE_CHECKING:
     from ..models.namespaced_name_model import NamespacedNameModel
@@ -21,16 +25,20 @@ class BidRequestModel:
     Attributes:
         id (str):
         name (NamespacedNameModel):
-        spec (str):
         bid_criteria (list[BidCriteria]):
         metrics (list[Metric]):
+        spec (Union[None, Unset, str]):
+        spec_digest (Union[None, Unset, str]):
+        strategy (Union[None, PlacementStrategy, Unset]):
     """
 
     id: str
     name: "NamespacedNameModel"
-    spec: str
     bid_criteria: list[BidCriteria]
     metrics: list[Metric]
+    spec: Union[None, Unset, str] = UNSET
+    spec_digest: Union[None, Unset, str] = UNSET
+    strategy: Union[None, PlacementStrategy, Unset] = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
@@ -38,8 +46,6 @@ class BidRequestModel:
 
         name = self.name.to_dict()
 
-        spec = self.spec
-
         bid_criteria = []
         for bid_criteria_item_data in self.bid_criteria:
             bid_criteria_item = bid_criteria_item_data.value
@@ -50,17 +56,42 @@ class BidRequestModel:
             metrics_item = metrics_item_data.value
             metrics.append(metrics_item)
 
+        spec: Union[None, Unset, str]
+        if isinstance(self.spec, Unset):
+            spec = UNSET
+        else:
+            spec = self.spec
+
+        spec_digest: Union[None, Unset, str]
+        if isinstance(self.spec_digest, Unset):
+            spec_digest = UNSET
+        else:
+            spec_digest = self.spec_digest
+
+        strategy: Union[None, Unset, str]
+        if isinstance(self.strategy, Unset):
+            strategy = UNSET
+        elif isinstance(self.strategy, PlacementStrategy):
+            strategy = self.strategy.value
+        else:
+            strategy = self.strategy
+
         field_dict: dict[str, Any] = {}
         field_dict.update(self.additional_properties)
         field_dict.update(
             {
                 "id": id,
                 "name": name,
-                "spec": spec,
                 "bid_criteria": bid_criteria,
                 "metrics": metrics,
             }
         )
+        if spec is not UNSET:
+            field_dict["spec"] = spec
+        if spec_digest is not UNSET:
+            field_dict["spec_digest"] = spec_digest
+        if strategy is not UNSET:
+            field_dict["strategy"] = strategy
 
         return field_dict
 
@@ -73,8 +104,6 @@ class BidRequestModel:
 
         name = NamespacedNameModel.from_dict(d.pop("name"))
 
-        spec = d.pop("spec")
-
         bid_criteria = []
         _bid_criteria = d.pop("bid_criteria")
         for bid_criteria_item_data in _bid_criteria:
@@ -89,12 +118,49 @@ class BidRequestModel:
 
             metrics.append(metrics_item)
 
+        def _parse_spec(data: object) -> Union[None, Unset, str]:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            return cast(Union[None, Unset, str], data)
+
+        spec = _parse_spec(d.pop("spec", UNSET))
+
+        def _parse_spec_digest(data: object) -> Union[None, Unset, str]:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            return cast(Union[None, Unset, str], data)
+
+        spec_digest = _parse_spec_digest(d.pop("spec_digest", UNSET))
+
+        def _parse_strategy(data: object) -> Union[None, PlacementStrategy, Unset]:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            try:
+                if not isinstance(data, str):
+                    raise TypeError()
+                strategy_type_0 = PlacementStrategy(data)
+
+                return strategy_type_0
+            except:  # noqa: E722
+                pass
+            return cast(Union[None, PlacementStrategy, Unset], data)
+
+        strategy = _parse_strategy(d.pop("strategy", UNSET))
+
         bid_request_model = cls(
             id=id,
             name=name,
-            spec=spec,
             bid_criteria=bid_criteria,
             metrics=metrics,
+            spec=spec,
+            spec_digest=spec_digest,
+            strategy=strategy,
         )
 
         bid_request_model.additional_properties = d
@@ -28,6 +28,7 @@ class BidResponseModel:
         trace (list['TraceLogRowModel']):
         reason (Union[None, Unset, str]):
         msg (Union[None, Unset, str]):
+        spec_digest (Union[None, Unset, str]):
     """
 
     id: str
@@ -36,6 +37,7 @@ class BidResponseModel:
     trace: list["TraceLogRowModel"]
     reason: Union[None, Unset, str] = UNSET
     msg: Union[None, Unset, str] = UNSET
+    spec_digest: Union[None, Unset, str] = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
@@ -65,6 +67,12 @@ class BidResponseModel:
         else:
             msg = self.msg
 
+        spec_digest: Union[None, Unset, str]
+        if isinstance(self.spec_digest, Unset):
+            spec_digest = UNSET
+        else:
+            spec_digest = self.spec_digest
+
         field_dict: dict[str, Any] = {}
         field_dict.update(self.additional_properties)
         field_dict.update(
@@ -79,6 +87,8 @@ class BidResponseModel:
             field_dict["reason"] = reason
         if msg is not UNSET:
             field_dict["msg"] = msg
+        if spec_digest is not UNSET:
+            field_dict["spec_digest"] = spec_digest
 
         return field_dict
 
@@ -124,6 +134,15 @@ class BidResponseModel:
 
         msg = _parse_msg(d.pop("msg", UNSET))
 
+        def _parse_spec_digest(data: object) -> Union[None, Unset, str]:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            return cast(Union[None, Unset, str], data)
+
+        spec_digest = _parse_spec_digest(d.pop("spec_digest", UNSET))
+
         bid_response_model = cls(
             id=id,
             status=status,
@@ -131,6 +150,7 @@ class BidResponseModel:
             trace=trace,
             reason=reason,
             msg=msg,
+            spec_digest=spec_digest,
         )
 
         bid_response_model.additional_properties = d
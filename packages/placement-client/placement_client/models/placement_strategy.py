@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class PlacementStrategy(str, Enum):
+    BEST_FIT = "best_fit"
+    FIRST_FIT_DECREASING = "first_fit_decreasing"
+    SPREAD = "spread"
+    WORST_FIT = "worst_fit"
+
+    def __str__(self) -> str:
+        return str(self.value)
@@ -17,12 +17,14 @@ class SchedulingEntry:
     """
     Attributes:
         seq_nr (int):
+        timestamp (int):
         state (str):
         msg (Union[None, str]):
         running_jobs (list[str]):
     """
 
     seq_nr: int
+    timestamp: int
     state: str
     msg: Union[None, str]
     running_jobs: list[str]
@@ -31,6 +33,8 @@ class SchedulingEntry:
     def to_dict(self) -> dict[str, Any]:
         seq_nr = self.seq_nr
 
+        timestamp = self.timestamp
+
         state = self.state
 
         msg: Union[None, str]
@@ -43,6 +47,7 @@ class SchedulingEntry:
         field_dict.update(
             {
                 "seq_nr": seq_nr,
+                "timestamp": timestamp,
                 "state": state,
                 "msg": msg,
                 "running_jobs": running_jobs,
@@ -56,6 +61,8 @@ class SchedulingEntry:
         d = dict(src_dict)
         seq_nr = d.pop("seq_nr")
 
+        timestamp = d.pop("timestamp")
+
         state = d.pop("state")
 
         def _parse_msg(data: object) -> Union[None, str]:
@@ -69,6 +76,7 @@ class SchedulingEntry:
 
         scheduling_entry = cls(
             seq_nr=seq_nr,
+            timestamp=timestamp,
             state=state,
             msg=msg,
             running_jobs=running_jobs,
@@ -1,12 +1,18 @@
 from typing import Any, Dict, List, Union
 
 from fastapi import Depends, FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import JSONResponse
 from uvicorn import Config, Server
 
+from placement_controller.api.encoding import DEFAULT_COMPRESSION_MIN_BYTES, RequestDecompressionMiddleware
 from placement_controller.api.model import (
     ApplicationModel,
     ApplicationState,
+    BidBatchErrorModel,
+    BidBatchRequestModel,
+    BidBatchResponseModel,
     BidRequestModel,
     BidResponseModel,
     ErrorResponse,
@@ -58,6 +64,8 @@ def create_app(applications: Applications, resource_management: ResourceManageme
 
 def create_api() -> PlacementFastAPI:
     app = PlacementFastAPI()
+    app.add_middleware(RequestDecompressionMiddleware)
+    app.add_middleware(GZipMiddleware, minimum_size=DEFAULT_COMPRESSION_MIN_BYTES)
 
     @app.get(path="/", operation_id="status", description="Get Application Status")
     async def root():
@@ -102,11 +110,37 @@ def create_api() -> PlacementFastAPI:
     )
     async def application_bid(
         bid: BidRequestModel, resource_management: ResourceManagement = Depends(lambda: get_resource_management(app))
-    ) -> Union[BidResponseModel, ErrorResponse]:
+    ) -> Union[BidResponseModel, JSONResponse]:
         try:
-            return resource_management.application_bid(bid)
+            response = resource_management.application_bid(bid)
         except Exception as e:
-            return ErrorResponse(status=500, code="INTERNAL_ERROR", msg=str(e))
+            response = ErrorResponse(status=500, code="INTERNAL_ERROR", msg=str(e))
+        if isinstance(response, ErrorResponse):
+            return error_response(response)
+        return response
+
+    @app.put(
+        "/bids/batch",
+        response_model=BidBatchResponseModel,
+        operation_id="application_bid_batch",
+        responses={500: {"model": ErrorResponse}, 200: {"model": BidBatchResponseModel}},
+    )
+    async def application_bid_batch(
+        batch: BidBatchRequestModel,
+        resource_management: ResourceManagement = Depends(lambda: get_resource_management(app)),
+    ) -> Union[BidBatchResponseModel, JSONResponse]:
+        try:
+            responses = resource_management.application_bids(batch.bids)
+            return BidBatchResponseModel(
+                responses=[response for response in responses if isinstance(response, BidResponseModel)],
+                errors=[
+                    BidBatchErrorModel(id=bid.id, error=response)
+                    for bid, response in zip(batch.bids, responses)
+                    if isinstance(response, ErrorResponse)
+                ],
+            )
+        except Exception as e:
+            return error_response(ErrorResponse(status=500, code="INTERNAL_ERROR", msg=str(e)))
 
     return app
 
@@ -114,6 +148,11 @@ def create_api() -> PlacementFastAPI:
 app = create_api()
 
 
+def error_response(error: ErrorResponse) -> JSONResponse:
+    # bid endpoints declare errors as status 500 responses
+    return JSONResponse(status_code=500, content=error.model_dump())
+
+
 def get_applications(app: FastAPI) -> Applications:
     return app.state.applications  # type: ignore
 
@@ -0,0 +1,134 @@
+from typing import List
+
+import gzip
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+GZIP: str = "gzip"
+
+# bodies below this size are not worth compressing
+DEFAULT_COMPRESSION_MIN_BYTES: int = 1024
+# zlib default, higher levels cost much more cpu for little gain on json
+COMPRESS_LEVEL: int = 6
+# limits of request bodies as received and after decompression
+DEFAULT_MAX_BODY_BYTES: int = 16 * 1024 * 1024
+DEFAULT_MAX_DECOMPRESSED_BYTES: int = 64 * 1024 * 1024
+# gzip header and trailer expected, see zlib.decompressobj
+GZIP_WBITS: int = 31
+
+
+class BodyTooLarge(Exception):
+    pass
+
+
+def compress(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=COMPRESS_LEVEL)
+
+
+class RequestDecompressionMiddleware:
+    """
+    Lets the json api accept gzip compressed request bodies.
+    Bodies above max_body_bytes, or inflating to more than max_decompressed_bytes, are rejected with 413.
+    Response compression is left to the GZipMiddleware.
+    """
+
+    app: ASGIApp
+    max_body_bytes: int
+    max_decompressed_bytes: int
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+        max_decompressed_bytes: int = DEFAULT_MAX_DECOMPRESSED_BYTES,
+    ):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+        self.max_decompressed_bytes = max_decompressed_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        is_compressed = headers.get("content-encoding", "") == GZIP
+        try:
+            content_length = int(headers.get("content-length", "0"))
+        except ValueError:
+            content_length = 0
+        if content_length > self.max_body_bytes:
+            await self.reject(413, "Request body too large", scope, receive, send)
+            return
+        # uncompressed bodies are buffered by the json api anyway
+        try:
+            body = await read_body(receive, self.max_body_bytes)
+            if is_compressed:
+                body = decompress(body, self.max_decompressed_bytes)
+        except BodyTooLarge as e:
+            await self.reject(413, str(e), scope, receive, send)
+            return
+        except Exception as e:
+            await self.reject(400, f"Malformed request body: {e}", scope, receive, send)
+            return
+
+        if is_compressed:
+            scope = dict(scope, headers=list(scope["headers"]))
+            request_headers = MutableHeaders(scope=scope)
+            del request_headers["content-encoding"]
+            request_headers["content-length"] = str(len(body))
+        await self.app(scope, replay_body(body, receive), send)
+
+    async def reject(self, status: int, msg: str, scope: Scope, receive: Receive, send: Send) -> None:
+        response = PlainTextResponse(msg, status_code=status)
+        await response(scope, receive, send)
+
+
+async def read_body(receive: Receive, max_bytes: int) -> bytes:
+    chunks: List[bytes] = []
+    size = 0
+    more_body = True
+    while more_body:
+        message = await receive()
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > max_bytes:
+            raise BodyTooLarge("Request body too large")
+        chunks.append(chunk)
+        more_body = message.get("more_body", False)
+    return b"".join(chunks)
+
+
+def decompress(body: bytes, max_bytes: int) -> bytes:
+    decompressor = zlib.decompressobj(wbits=GZIP_WBITS)
+    chunks: List[bytes] = []
+    size = 0
+    data = body
+    while data:
+        # never inflates more than one byte beyond the limit
+        chunk = decompressor.decompress(data, max_bytes - size + 1)
+        size += len(chunk)
+        if size > max_bytes:
+            raise BodyTooLarge("Decompressed request body too large")
+        chunks.append(chunk)
+        data = decompressor.unconsumed_tail
+    if not decompressor.eof:
+        raise ValueError("truncated gzip body")
+    return b"".join(chunks)
+
+
+def replay_body(body: bytes, receive: Receive) -> Receive:
+    sent = False
+
+    async def replay() -> Message:
+        nonlocal sent
+        if sent:
+            # later messages, e.g. the disconnect, come from the server
+            return await receive()
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return replay
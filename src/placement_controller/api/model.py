@@ -1,15 +1,21 @@
 from typing import List, Optional, Set
 
+import hashlib
+import sys
 from decimal import Decimal
 from enum import StrEnum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 
 from placement_controller.clients.k8s.client import NamespacedName
 from placement_controller.core.application import AnyApplication
 from placement_controller.resources.trace_log import TraceLogRow
 
 
+def spec_digest(spec: str) -> str:
+    return hashlib.sha256(spec.encode()).hexdigest()
+
+
 class ApplicationModel(BaseModel):
     name: str
     namespace: str
@@ -32,6 +38,17 @@ class BidCriteria(StrEnum):
     pvcStorage = "storage"
 
 
+class PlacementStrategy(StrEnum):
+    # pods in spec order, each replica on the node with the least free resources that fits
+    best_fit = "best_fit"
+    # pods in spec order, each replica on the node with the most free resources
+    worst_fit = "worst_fit"
+    # replicas of all pods sorted by decreasing size, each on the first fitting node in best-fit order
+    first_fit_decreasing = "first_fit_decreasing"
+    # replicas of a pod spread evenly over topology domains (nodes by default)
+    spread = "spread"
+
+
 class MetricUnit(StrEnum):
     core = "core"
     byte = "byte"
@@ -75,9 +92,30 @@ class NamespacedNameModel(BaseModel):
 class BidRequestModel(BaseModel):
     id: str
     name: NamespacedNameModel
-    spec: str
+    # application spec as json, omitted when the receiving zone holds the spec of spec_digest
+    spec: Optional[str] = None
+    # sha256 of spec
+    spec_digest: Optional[str] = None
     bid_criteria: List[BidCriteria]
     metrics: Set[Metric]
+    # overrides the placement strategy configured for the zone
+    strategy: Optional[PlacementStrategy] = None
+
+    @model_validator(mode="after")
+    def check_spec(self) -> "BidRequestModel":
+        if self.spec is None and self.spec_digest is None:
+            raise ValueError("spec or spec_digest is required")
+        return self
+
+    def get_spec_digest(self) -> str:
+        # a digest sent along with the spec is not trusted
+        if self.spec is not None:
+            return spec_digest(self.spec)
+        return self.spec_digest or ""
+
+    def without_spec(self) -> "BidRequestModel":
+        """The bid referencing its spec by digest only."""
+        return self.model_copy(update={"spec": None, "spec_digest": self.get_spec_digest()})
 
 
 class BidStatus(StrEnum):
@@ -111,7 +149,7 @@ class TraceLogRowModel(BaseModel):
     def to_domain(self) -> TraceLogRow:
         return TraceLogRow(
             timestamp=self.timestamp,
-            zone=self.zone,
+            zone=sys.intern(self.zone),
             name=NamespacedNameModel.to_domain(self.name),
             msg=self.msg,
             state=self.state,
@@ -125,6 +163,8 @@ class BidResponseModel(BaseModel):
     trace: List[TraceLogRowModel]
     reason: Optional[str] = None
     msg: Optional[str] = None
+    # digest of the bid spec if the zone holds it for later bids, zones without digest support leave it unset
+    spec_digest: Optional[str] = None
 
     def get_metric_value(self, metric: Metric) -> Optional[MetricValue]:
         found = [m for m in self.metrics if m.id == metric]
@@ -146,6 +186,10 @@ class BidResponseModel(BaseModel):
         return response_str
 
 
+# error code of bids referencing a spec the receiving zone does not hold
+SPEC_NOT_FOUND: str = "SPEC_NOT_FOUND"
+
+
 class ErrorResponse(BaseModel):
     status: int
     code: str
@@ -158,8 +202,24 @@ class ErrorResponse(BaseModel):
         return response_str
 
 
+class BidBatchRequestModel(BaseModel):
+    bids: List[BidRequestModel]
+
+
+class BidBatchErrorModel(BaseModel):
+    id: str
+    error: ErrorResponse
+
+
+class BidBatchResponseModel(BaseModel):
+    # every bid of the batch is either answered by a response or failed with an error
+    responses: List[BidResponseModel]
+    errors: List[BidBatchErrorModel]
+
+
 class SchedulingEntry(BaseModel):
     seq_nr: int
+    timestamp: int
     state: str
     msg: Optional[str]
     running_jobs: List[str]
@@ -0,0 +1,69 @@
+from typing import Any, Dict
+
+import gzip
+import json
+
+import httpx
+from fastapi import FastAPI
+
+from placement_controller.api.encoding import RequestDecompressionMiddleware
+from placement_controller.async_fixture import AsyncTestFixture
+
+
+class RequestDecompressionMiddlewareTest(AsyncTestFixture):
+    client: httpx.AsyncClient
+
+    def setUp(self) -> None:
+        super().setUp()
+        app = FastAPI()
+        app.add_middleware(RequestDecompressionMiddleware, max_body_bytes=1024, max_decompressed_bytes=4096)
+
+        @app.put("/echo")
+        async def echo(body: Dict[str, Any]) -> Dict[str, Any]:
+            return body
+
+        self.client = httpx.AsyncClient(transport=httpx.ASGITransport(app), base_url="http://api")
+
+    def tearDown(self) -> None:
+        self.loop.run_until_complete(self.client.aclose())
+        super().tearDown()
+
+    def put(self, body: bytes, compressed: bool) -> httpx.Response:
+        headers = {"content-type": "application/json"}
+        if compressed:
+            headers["content-encoding"] = "gzip"
+        return self.loop.run_until_complete(self.client.put("/echo", content=body, headers=headers))
+
+    def test_compressed_body_decoded(self) -> None:
+        body = {"spec": "x" * 2000}
+
+        response = self.put(gzip.compress(json.dumps(body).encode()), compressed=True)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(body, response.json())
+
+    def test_uncompressed_body_passed(self) -> None:
+        response = self.put(json.dumps({"a": 1}).encode(), compressed=False)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"a": 1}, response.json())
+
+    def test_body_too_large(self) -> None:
+        response = self.put(json.dumps({"spec": "x" * 2000}).encode(), compressed=False)
+
+        self.assertEqual(413, response.status_code)
+
+    def test_decompressed_body_too_large(self) -> None:
+        bomb = gzip.compress(json.dumps({"spec": "x" * 100_000}).encode())
+        self.assertLess(len(bomb), 1024)
+
+        response = self.put(bomb, compressed=True)
+
+        self.assertEqual(413, response.status_code)
+
+    def test_truncated_body_rejected(self) -> None:
+        body = gzip.compress(json.dumps({"a": 1}).encode())
+
+        response = self.put(body[:-8], compressed=True)
+
+        self.assertEqual(400, response.status_code)
@@ -98,6 +98,9 @@ class KubeClient:
     ) -> Optional[Dict[str, Any]]:
         raise NotImplementedError
 
+    async def close(self) -> None:
+        raise NotImplementedError
+
     @staticmethod
     def new_event(
         gvk: GroupVersionKind,
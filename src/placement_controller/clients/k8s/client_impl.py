@@ -1,12 +1,15 @@
 from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple, TypeVar, override
 
 import asyncio
+import time
 from dataclasses import dataclass
 
 from kubernetes_asyncio import client, config
 from kubernetes_asyncio.client import ApiClient, CoreV1Api, CustomObjectsApi
 from kubernetes_asyncio.client.configuration import Configuration
+from kubernetes_asyncio.client.exceptions import ApiException
 from kubernetes_asyncio.dynamic import DynamicClient
+from kubernetes_asyncio.dynamic.resource import Resource
 from kubernetes_asyncio.watch import Watch
 from loguru import logger
 
@@ -17,7 +20,28 @@ from placement_controller.core.async_queue import AsyncQueue
 
 T = TypeVar("T")
 
-DEFAULT_LIST_BATCH_LIMIT: int = 50
+MIN_LIST_PAGE_SIZE: int = 50
+
+
+@dataclass
+class WatchPosition:
+    # resourceVersion a restarted watch resumes from, None until listed and after the version expired
+    resource_version: Optional[str] = None
+
+
+@dataclass
+class PageSize:
+    """LIST page size of a watch, halved after slow pages and doubled after fast full pages."""
+
+    size: int
+    max_size: int
+    target_seconds: float
+
+    def adapt(self, items: int, elapsed_seconds: float) -> None:
+        if elapsed_seconds > self.target_seconds:
+            self.size = max(self.size // 2, MIN_LIST_PAGE_SIZE)
+        elif items >= self.size and elapsed_seconds < self.target_seconds / 2:
+            self.size = min(self.size * 2, self.max_size)
 
 
 @dataclass
@@ -33,12 +57,25 @@ class KubeClientImpl(KubeClient):
     subscriber_ids: SubscriberId
     loop: asyncio.AbstractEventLoop
 
+    # shared for the process lifetime, recreated only when the credentials are rejected
+    api_client: Optional[ApiClient]
+    dynamic_client: Optional[DynamicClient]
+    resource_apis: Dict[GroupVersionKind, Resource]
+    # requests and watches using a client, a replaced client is closed once its last user is done
+    client_users: Dict[ApiClient, int]
+    clients_lock: asyncio.Lock
+
     def __init__(self, settings: K8SSettings, loop: asyncio.AbstractEventLoop):
         self.settings = settings
         self.configuration = None
         self.subscriptions = {}
         self.subscriber_ids = 0
         self.loop = loop
+        self.api_client = None
+        self.dynamic_client = None
+        self.resource_apis = {}
+        self.client_users = {}
+        self.clients_lock = asyncio.Lock()
 
     @override
     def watch(
@@ -49,25 +86,37 @@ class KubeClientImpl(KubeClient):
         is_terminated: asyncio.Event,
     ) -> Tuple[SubscriberId, AsyncQueue[KubeEvent]]:
         queue = AsyncQueue[KubeEvent]()
+        position = WatchPosition()
+        page_size = PageSize(
+            size=self.settings.list_page_size,
+            max_size=self.settings.max_list_page_size,
+            target_seconds=self.settings.list_page_target_seconds,
+        )
 
-        async def watcher_func(api_client: ApiClient) -> None:
+        async def watch_once(api_client: ApiClient) -> None:
+            await KubeClientImpl.watch_internal(
+                Watch(),
+                KubeClientImpl.get_api_func(api_client, gvk, namespace),
+                gvk,
+                version_since,
+                self.settings.timeout_seconds,
+                queue,
+                position,
+                page_size,
+            )
+
+        async def watcher_func() -> None:
             while not is_terminated.is_set():
                 try:
-                    await KubeClientImpl.watch_internal(
-                        api_client,
-                        gvk,
-                        namespace,
-                        version_since,
-                        self.settings.timeout_seconds,
-                        queue,
-                    )
+                    # the client is looked up on every restart, so a recreated client is picked up
+                    await self.execute(watch_once, is_dynamic_client=False)  # type: ignore[arg-type]
                 except Exception as e:
                     if isinstance(e, TimeoutError):
                         logger.info("Timeout: watcher restarted")
                     else:
                         logger.error(f"watch exception {type(e)}: {e}")
 
-        task = self.loop.create_task(self.execute(watcher_func, is_dynamic_client=False))  # type: ignore[arg-type]
+        task = self.loop.create_task(watcher_func())
         subscription = Subscription(queue, task)
 
         self.subscriber_ids += 1
@@ -78,42 +127,63 @@ class KubeClientImpl(KubeClient):
 
     @staticmethod
     async def watch_internal(
-        api_client: ApiClient,
+        w: Watch,
+        api_func: Callable[..., Any],
         gvk: GroupVersionKind,
-        namespace: Optional[str],
         version_since: int,
         timeout_seconds: int,
         queue: AsyncQueue[KubeEvent],
+        position: WatchPosition,
+        page_size: PageSize,
     ) -> None:
-        w = Watch()
-        api_func = KubeClientImpl.get_api_func(api_client, gvk, namespace)
+        """
+        Watches from the position of the previous watch, the objects are listed only on the first watch and
+        once the position expired. Consumers reconcile every further snapshot with their state.
+        """
+        if position.resource_version is None:
+            count, max_version = await KubeClientImpl.stream_snapshot(api_func, version_since, page_size, queue)
+            position.resource_version = str(max_version)
+            logger.info(
+                f"{gvk.to_string()} initial snapshot size = {count}, version = {max_version}, "
+                f"page size = {page_size.size}"
+            )
+        else:
+            logger.info(f"{gvk.to_string()} watch resumed from version = {position.resource_version}")
+
+        try:
+            async for watch_event in w.stream(
+                api_func,
+                resource_version=position.resource_version,
+                timeout_seconds=timeout_seconds,
+                allow_watch_bookmarks=True,
+            ):
+                KubeClientImpl.handle_watch_event(gvk, watch_event, queue)
+                # bookmarks move the position without an event
+                version = (watch_event.get("raw_object") or {}).get("metadata", {}).get("resourceVersion")
+                if version:
+                    position.resource_version = str(version)
+        except ApiException as e:
+            if e.status != 410:
+                raise
+            logger.info(f"{gvk.to_string()} watch version {position.resource_version} expired, listing again")
+            position.resource_version = None
 
-        initial_snapshot, max_version = await KubeClientImpl.fetch_initial_snapshot(
-            api_func,
-            version_since,
-            DEFAULT_LIST_BATCH_LIMIT,
-        )
-        event = KubeEvent(event=EventType.SNAPSHOT, object=initial_snapshot, version=max_version)
-        queue.put_nowait(event)
-        logger.info(f"{gvk.to_string()} initial snapshot size = {len(initial_snapshot)}, version = {max_version} ")
-
-        async for watch_event in w.stream(
-            api_func,
-            resource_version=str(max_version),
-            timeout_seconds=timeout_seconds,
-        ):
-            if "type" not in watch_event:
-                raise Exception(f"unexpected event {watch_event}, for watch {str(gvk)}")
-
-            logger.info(f"incoming event {gvk.to_string()}: {watch_event['type']}")
-            try:
-                event_type = watch_event["type"]
-                object = watch_event["object"]
-                version = object["metadata"]["resourceVersion"]
-                event = KubeEvent(event=EventType[event_type], object=object, version=version)
-                queue.put_nowait(event)
-            except Exception as e:
-                logger.error("error parsing error {exception}", exception=str(e))
+    @staticmethod
+    def handle_watch_event(gvk: GroupVersionKind, watch_event: Dict[str, Any], queue: AsyncQueue[KubeEvent]) -> None:
+        if "type" not in watch_event:
+            raise Exception(f"unexpected event {watch_event}, for watch {str(gvk)}")
+        if watch_event["type"] == "BOOKMARK":
+            return
+
+        logger.info(f"incoming event {gvk.to_string()}: {watch_event['type']}")
+        try:
+            event_type = watch_event["type"]
+            object = watch_event["object"]
+            version = object["metadata"]["resourceVersion"]
+            event = KubeEvent(event=EventType[event_type], object=object, version=version)
+            queue.put_nowait(event)
+        except Exception as e:
+            logger.error("error parsing error {exception}", exception=str(e))
 
     @staticmethod
     def get_api_func(
@@ -174,40 +244,43 @@ class KubeClientImpl(KubeClient):
         return api_func
 
     @staticmethod
-    async def fetch_initial_snapshot(
-        func: Callable[..., Any], version_since: int, batch_size: int
-    ) -> Tuple[List[KubeObject], int]:
-        max_iterations: int = 100
-        iteration: int = 0
-        results: List[KubeObject] = []
+    async def stream_snapshot(
+        func: Callable[..., Any], version_since: int, page_size: PageSize, queue: AsyncQueue[KubeEvent]
+    ) -> Tuple[int, int]:
+        """
+        Lists the objects page by page, every page is sent as SNAPSHOT event as soon as it is received.
+        SNAPSHOT_END is sent once all pages are listed, a failed listing raises without it.
+        Returns the number of objects and the version of the listing.
+        """
+        queue.put_nowait(KubeEvent(event=EventType.SNAPSHOT_BEGIN, object=[], version=version_since))
+        count = 0
         max_version = 0
         continue_token = ""
-        batch_size = 10
-        while iteration < max_iterations:
-            try:
-                if len(continue_token) > 0:
-                    result = await func(limit=batch_size, resource_version=str(version_since), _continue=continue_token)
-                else:
-                    result = await func(limit=batch_size, resource_version=str(version_since))
-                if not isinstance(result, dict):
-                    result = result.to_dict()
-                metadata = result.get("metadata") or {}
-                if not isinstance(metadata, dict):
-                    metadata = metadata.to_dict()
-
-                continue_token = metadata.get("continue") or metadata.get("_continue") or ""
-                resource_version = metadata.get("resourceVersion") or metadata.get("resource_version") or "0"
-                max_version = max(int(resource_version), max_version)
-
-                results.extend(result.get("items") or [])
-
-                iteration += 1
-                if len(continue_token) == 0:
-                    break
-            except Exception as e:
-                logger.error(f"Exception while loading initial snapshot {e}")
+        while True:
+            started = time.monotonic()
+            if len(continue_token) > 0:
+                result = await func(limit=page_size.size, resource_version=str(version_since), _continue=continue_token)
+            else:
+                result = await func(limit=page_size.size, resource_version=str(version_since))
+            if not isinstance(result, dict):
+                result = result.to_dict()
+            metadata = result.get("metadata") or {}
+            if not isinstance(metadata, dict):
+                metadata = metadata.to_dict()
+
+            continue_token = metadata.get("continue") or metadata.get("_continue") or ""
+            resource_version = metadata.get("resourceVersion") or metadata.get("resource_version") or "0"
+            max_version = max(int(resource_version), max_version)
+
+            items: List[KubeObject] = result.get("items") or []
+            page_size.adapt(len(items), time.monotonic() - started)
+            queue.put_nowait(KubeEvent(event=EventType.SNAPSHOT, object=items, version=max_version))
+            count += len(items)
+
+            if len(continue_token) == 0:
                 break
-        return results, max_version
+        queue.put_nowait(KubeEvent(event=EventType.SNAPSHOT_END, object=[], version=max_version))
+        return count, max_version
 
     @override
     def stop_watch(self, subscriber_id: SubscriberId) -> None:
@@ -217,7 +290,7 @@ class KubeClientImpl(KubeClient):
     @override
     async def patch(self, gvk: GroupVersionKind, object: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         async def patch_internal(client: DynamicClient) -> Optional[Dict[str, Any]]:
-            api = await client.resources.get(group=gvk.group, api_version=gvk.version, kind=gvk.kind)
+            api = await self.get_resource_api(client, gvk)
             result = await api.patch(body=object, content_type="application/merge-patch+json")
             result_dict: Dict[str, Any] = result.to_dict()
             if result_dict.get("status") == "Failure" and result_dict.get("code") == 404:
@@ -231,7 +304,7 @@ class KubeClientImpl(KubeClient):
         self, gvk: GroupVersionKind, name: NamespacedName, status: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         async def patch_status_internal(client: DynamicClient) -> Optional[Dict[str, Any]]:
-            api = await client.resources.get(group=gvk.group, api_version=gvk.version, kind=gvk.kind)
+            api = await self.get_resource_api(client, gvk)
             result = await api.status.patch(  # type: ignore[attr-defined]
                 name=name.name, namespace=name.namespace, body=status, content_type="application/merge-patch+json"
             )
@@ -245,7 +318,7 @@ class KubeClientImpl(KubeClient):
     @override
     async def get(self, gvk: GroupVersionKind, name: NamespacedName) -> Optional[Dict[str, Any]]:
         async def get_internal(client: DynamicClient) -> Optional[Dict[str, Any]]:
-            api = await client.resources.get(group=gvk.group, api_version=gvk.version, kind=gvk.kind)
+            api = await self.get_resource_api(client, gvk)
             result = await api.get(name=name.name, namespace=name.namespace)
             result_dict: Dict[str, Any] = result.to_dict()
             if result_dict.get("status") == "Failure" and result_dict.get("code") == 404:
@@ -258,7 +331,7 @@ class KubeClientImpl(KubeClient):
     async def list(self, gvk: GroupVersionKind) -> List[Dict[str, Any]]:
         async def list_internal(client: DynamicClient) -> List[Dict[str, Any]]:
 
-            api = await client.resources.get(group=gvk.group, api_version=gvk.version, kind=gvk.kind)
+            api = await self.get_resource_api(client, gvk)
             result = await api.get()
             result_dict: Dict[str, Any] = result.to_dict()
             if result_dict.get("status") == "Failure" and result_dict.get("code") == 404:
@@ -270,7 +343,7 @@ class KubeClientImpl(KubeClient):
     @override
     async def delete(self, gvk: GroupVersionKind, name: NamespacedName) -> Optional[Dict[str, Any]]:
         async def delete_internal(client: DynamicClient) -> Optional[Dict[str, Any]]:
-            api = await client.resources.get(group=gvk.group, api_version=gvk.version, kind=gvk.kind)
+            api = await self.get_resource_api(client, gvk)
             result = await api.delete(name=name.name, namespace=name.namespace)
             result_dict: Dict[str, Any] = result.to_dict()
             if result_dict.get("status") == "Failure" and result_dict.get("code") == 404:
@@ -305,14 +378,82 @@ class KubeClientImpl(KubeClient):
     async def execute(
         self, func: Callable[[DynamicClient | ApiClient], Coroutine[Any, Any, T]], is_dynamic_client: bool = True
     ) -> T:
-        await self.init_configuration()
+        api_client, dynamic_client = await self.acquire_clients(is_dynamic_client)
+        try:
+            return await func(dynamic_client or api_client)
+        except ApiException as e:
+            if e.status != 401:
+                raise
+            logger.info("Kubernetes credentials are rejected, reloading configuration")
+        finally:
+            await self.release_clients(api_client)
+
+        await self.reset_clients(api_client)
+        api_client, dynamic_client = await self.acquire_clients(is_dynamic_client)
+        try:
+            return await func(dynamic_client or api_client)
+        finally:
+            await self.release_clients(api_client)
+
+    async def acquire_clients(self, is_dynamic_client: bool) -> Tuple[ApiClient, Optional[DynamicClient]]:
+        async with self.clients_lock:
+            await self.init_configuration()
+            if self.api_client is None:
+                self.api_client = self.new_api_client()
+            if is_dynamic_client and self.dynamic_client is None:
+                self.dynamic_client = await self.new_dynamic_client(self.api_client)
+            self.client_users[self.api_client] = self.client_users.get(self.api_client, 0) + 1
+            return self.api_client, self.dynamic_client if is_dynamic_client else None
+
+    async def release_clients(self, api_client: ApiClient) -> None:
+        async with self.clients_lock:
+            users = self.client_users.get(api_client)
+            if users is None:
+                # closed without draining
+                return
+            if users > 1:
+                self.client_users[api_client] = users - 1
+                return
+            del self.client_users[api_client]
+            if api_client is self.api_client:
+                return
+        # the last user of a replaced client
+        await api_client.close()
+
+    def new_api_client(self) -> ApiClient:
+        return ApiClient(configuration=self.configuration)
+
+    async def new_dynamic_client(self, api_client: ApiClient) -> DynamicClient:
+        dynamic_client: DynamicClient = await DynamicClient(api_client)
+        return dynamic_client
+
+    async def get_resource_api(self, client: DynamicClient, gvk: GroupVersionKind) -> Resource:
+        api = self.resource_apis.get(gvk)
+        if api is None:
+            api = await client.resources.get(group=gvk.group, api_version=gvk.version, kind=gvk.kind)
+            self.resource_apis[gvk] = api
+        return api
+
+    async def reset_clients(self, rejected: Optional[ApiClient] = None, drain: bool = True) -> None:
+        """Replaces the clients; the replaced client is closed once its in-flight requests and watches are done."""
+        async with self.clients_lock:
+            api_client = self.api_client
+            if api_client is None or (rejected is not None and api_client is not rejected):
+                # already recreated by a concurrent request
+                return
+            self.configuration = None
+            self.api_client = None
+            self.dynamic_client = None
+            self.resource_apis = {}
+            if drain and self.client_users.get(api_client, 0) > 0:
+                return
+            self.client_users.pop(api_client, None)
+        await api_client.close()
 
-        async with ApiClient(configuration=self.configuration) as client_api:
-            if is_dynamic_client:
-                async with DynamicClient(client_api) as dynamic_api:
-                    return await func(dynamic_api)
-            else:
-                return await func(client_api)
+    @override
+    async def close(self) -> None:
+        # watches and requests still running are stopped together with the client
+        await self.reset_clients(drain=False)
 
     async def init_configuration(self) -> None:
         if not self.configuration:
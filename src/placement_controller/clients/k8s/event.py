@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from dataclasses import dataclass
 from enum import StrEnum
@@ -8,9 +8,14 @@ class EventType(StrEnum):
     ADDED = "ADDED"
     MODIFIED = "MODIFIED"
     DELETED = "DELETED"
+    # a listing is sent as SNAPSHOT_BEGIN, SNAPSHOT events with one page of objects each and SNAPSHOT_END
+    SNAPSHOT_BEGIN = "SNAPSHOT_BEGIN"
     SNAPSHOT = "SNAPSHOT"
+    SNAPSHOT_END = "SNAPSHOT_END"
 
 
+SNAPSHOT_EVENTS = (EventType.SNAPSHOT_BEGIN, EventType.SNAPSHOT, EventType.SNAPSHOT_END)
+
 KubeObject = Dict[str, Any]
 
 
@@ -19,3 +24,10 @@ class KubeEvent:
     event: EventType
     version: int
     object: Union[KubeObject, List[KubeObject]]
+
+
+def resource_version(object: KubeObject) -> Optional[int]:
+    try:
+        return int(object["metadata"]["resourceVersion"])
+    except (KeyError, TypeError, ValueError):
+        return None
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from kubernetes_asyncio.client import ApiClient
 
 from placement_controller.clients.k8s.client import GroupVersionKind, KubeClient, NamespacedName, SubscriberId
-from placement_controller.clients.k8s.event import EventType, KubeEvent
+from placement_controller.clients.k8s.event import SNAPSHOT_EVENTS, EventType, KubeEvent
 from placement_controller.core.async_queue import AsyncQueue
 
 
@@ -63,8 +63,9 @@ class FakeClient(KubeClient):
             if is_namespace_match and is_gvk_match and is_version_since:
                 initial_snapshot.append(object)
                 max_version = max(max_version, version)
-        event = KubeEvent(event=EventType.SNAPSHOT, version=max_version, object=initial_snapshot)
-        subscription.queue.put_nowait(event)
+        subscription.queue.put_nowait(KubeEvent(event=EventType.SNAPSHOT_BEGIN, version=version_since, object=[]))
+        subscription.queue.put_nowait(KubeEvent(event=EventType.SNAPSHOT, version=max_version, object=initial_snapshot))
+        subscription.queue.put_nowait(KubeEvent(event=EventType.SNAPSHOT_END, version=max_version, object=[]))
 
     @override
     def stop_watch(self, subscriber_id: SubscriberId) -> None:
@@ -152,7 +153,7 @@ class FakeClient(KubeClient):
 
     def send_event(self, event: KubeEvent) -> None:
         self.events.append(event)
-        if isinstance(event.object, list) or event.event == EventType.SNAPSHOT:
+        if isinstance(event.object, list) or event.event in SNAPSHOT_EVENTS:
             raise Exception("Invalid use of send_event. Cannot send snapshot event via send event.")
 
         gvk = GroupVersionKind.from_event(event)
@@ -179,3 +180,7 @@ class FakeClient(KubeClient):
         event_gvk = GroupVersionKind("events.k8s.io", "v1", "Event")
         body = ApiClient().sanitize_for_serialization(event)
         return await self.patch(event_gvk, body)
+
+    @override
+    async def close(self) -> None:
+        pass
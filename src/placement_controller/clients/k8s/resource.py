@@ -1,6 +1,7 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from placement_controller.clients.k8s.client import NamespacedName
+from placement_controller.clients.k8s.event import resource_version
 
 
 class BaseResource:
@@ -16,3 +17,6 @@ class BaseResource:
 
     def get_labels(self) -> Dict[str, str]:
         return self.object["metadata"].get("labels", {})  # type: ignore
+
+    def get_resource_version(self) -> Optional[int]:
+        return resource_version(self.object)
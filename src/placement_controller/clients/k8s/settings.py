@@ -7,3 +7,7 @@ class K8SSettings(BaseSettings):
     incluster: bool
     context: Optional[str]
     timeout_seconds: int
+    # objects per LIST page, adapted between 50 and max_list_page_size to keep a page below the target time
+    list_page_size: int = 500
+    max_list_page_size: int = 5000
+    list_page_target_seconds: float = 1.0
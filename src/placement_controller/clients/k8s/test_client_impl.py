@@ -0,0 +1,291 @@
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union, cast
+
+import asyncio
+
+from kubernetes_asyncio.client import ApiClient
+from kubernetes_asyncio.client.configuration import Configuration
+from kubernetes_asyncio.client.exceptions import ApiException
+from kubernetes_asyncio.dynamic import DynamicClient
+from kubernetes_asyncio.watch import Watch
+
+from placement_controller.async_fixture import AsyncTestFixture
+from placement_controller.clients.k8s.client import GroupVersionKind
+from placement_controller.clients.k8s.client_impl import KubeClientImpl, PageSize, WatchPosition
+from placement_controller.clients.k8s.event import EventType, KubeEvent
+from placement_controller.clients.k8s.settings import K8SSettings
+from placement_controller.core.async_queue import AsyncQueue
+
+
+class FakeApiClient:
+    closed: bool
+
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeResources:
+    lookups: List[Dict[str, Any]]
+
+    def __init__(self) -> None:
+        self.lookups = []
+
+    async def get(self, **kwargs: Any) -> Any:
+        self.lookups.append(kwargs)
+        return object()
+
+
+class FakeDynamicClient:
+    resources: FakeResources
+
+    def __init__(self) -> None:
+        self.resources = FakeResources()
+
+
+class FakeWatch:
+    """Replays one script of watch events per stream, an exception in a script is raised by the stream."""
+
+    scripts: List[List[Union[Dict[str, Any], Exception]]]
+    resource_versions: List[Optional[str]]
+
+    def __init__(self, scripts: List[List[Union[Dict[str, Any], Exception]]]):
+        self.scripts = scripts
+        self.resource_versions = []
+
+    async def stream(self, func: Any, resource_version: Optional[str], **kwargs: Any) -> AsyncIterator[Dict[str, Any]]:
+        self.resource_versions.append(resource_version)
+        for event in self.scripts.pop(0):
+            if isinstance(event, Exception):
+                raise event
+            yield event
+
+
+def watch_event(event_type: str, name: str, version: str) -> Dict[str, Any]:
+    object = {"metadata": {"name": name, "resourceVersion": version}}
+    return {"type": event_type, "object": object, "raw_object": object}
+
+
+class FakeClientsKubeClient(KubeClientImpl):
+    """KubeClientImpl creating fake clients instead of connecting to a cluster."""
+
+    api_clients: List[FakeApiClient]
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        super().__init__(K8SSettings(incluster=False, context=None, timeout_seconds=1), loop)
+        self.api_clients = []
+
+    async def init_configuration(self) -> None:
+        if not self.configuration:
+            self.configuration = Configuration()
+
+    def new_api_client(self) -> ApiClient:
+        api_client = FakeApiClient()
+        self.api_clients.append(api_client)
+        return cast(ApiClient, api_client)
+
+    async def new_dynamic_client(self, api_client: ApiClient) -> DynamicClient:
+        return cast(DynamicClient, FakeDynamicClient())
+
+
+class KubeClientImplTest(AsyncTestFixture):
+
+    def test_snapshot_streamed_in_pages(self) -> None:
+        objects = [{"metadata": {"name": f"pod{i}", "resourceVersion": str(i)}} for i in range(5)]
+        limits: List[int] = []
+
+        async def list_func(limit: int, resource_version: str, _continue: str = "0") -> Dict[str, Any]:
+            limits.append(limit)
+            start = int(_continue)
+            end = start + limit
+            token = str(end) if end < len(objects) else ""
+            return {"metadata": {"continue": token, "resourceVersion": "7"}, "items": objects[start:end]}
+
+        queue = AsyncQueue[KubeEvent]()
+        page_size = PageSize(size=2, max_size=3, target_seconds=60)
+
+        count, version = self.loop.run_until_complete(KubeClientImpl.stream_snapshot(list_func, 0, page_size, queue))
+
+        events = []
+        while (event := queue.get_nowait()) is not None:
+            events.append(event)
+        self.assertEqual((5, 7), (count, version))
+        self.assertEqual(
+            [EventType.SNAPSHOT_BEGIN, EventType.SNAPSHOT, EventType.SNAPSHOT, EventType.SNAPSHOT_END],
+            [event.event for event in events],
+        )
+        self.assertEqual(objects, [object for event in events for object in event.object])
+        # fast full pages grow the page size up to the maximum
+        self.assertEqual([2, 3], limits)
+
+    def test_page_size_halved_on_slow_page(self) -> None:
+        page_size = PageSize(size=400, max_size=1000, target_seconds=1)
+
+        page_size.adapt(400, 2)
+        self.assertEqual(200, page_size.size)
+        page_size.adapt(10, 0.1)
+        self.assertEqual(200, page_size.size)
+
+    def test_clients_shared_across_requests(self) -> None:
+        kube_client = FakeClientsKubeClient(self.loop)
+        used: List[Any] = []
+
+        async def request(client: Any) -> None:
+            used.append(client)
+
+        self.loop.run_until_complete(kube_client.execute(request, is_dynamic_client=False))
+        self.loop.run_until_complete(kube_client.execute(request, is_dynamic_client=False))
+
+        self.assertEqual(1, len(kube_client.api_clients))
+        self.assertIs(used[0], used[1])
+        self.assertFalse(kube_client.api_clients[0].closed)
+
+    def test_resource_api_cached(self) -> None:
+        kube_client = FakeClientsKubeClient(self.loop)
+        gvk = GroupVersionKind(group="", version="v1", kind="Pod")
+        dynamic_client = FakeDynamicClient()
+
+        first = self.loop.run_until_complete(kube_client.get_resource_api(cast(DynamicClient, dynamic_client), gvk))
+        second = self.loop.run_until_complete(kube_client.get_resource_api(cast(DynamicClient, dynamic_client), gvk))
+
+        self.assertIs(first, second)
+        self.assertEqual(1, len(dynamic_client.resources.lookups))
+
+    def test_request_retried_once_with_new_client_on_401(self) -> None:
+        kube_client = FakeClientsKubeClient(self.loop)
+        used: List[Any] = []
+
+        async def request(client: Any) -> str:
+            used.append(client)
+            if len(used) == 1:
+                raise ApiException(status=401, reason="Unauthorized")
+            return "ok"
+
+        result = self.loop.run_until_complete(kube_client.execute(request, is_dynamic_client=False))
+
+        self.assertEqual("ok", result)
+        self.assertEqual(2, len(kube_client.api_clients))
+        self.assertEqual(kube_client.api_clients, used)
+        self.assertTrue(kube_client.api_clients[0].closed)
+        self.assertFalse(kube_client.api_clients[1].closed)
+
+    def test_second_401_raised(self) -> None:
+        kube_client = FakeClientsKubeClient(self.loop)
+
+        async def request(client: Any) -> None:
+            raise ApiException(status=401, reason="Unauthorized")
+
+        with self.assertRaises(ApiException):
+            self.loop.run_until_complete(kube_client.execute(request, is_dynamic_client=False))
+        self.assertEqual(2, len(kube_client.api_clients))
+
+    def test_stale_reset_ignored(self) -> None:
+        kube_client = FakeClientsKubeClient(self.loop)
+
+        async def request(client: Any) -> None:
+            pass
+
+        self.loop.run_until_complete(kube_client.execute(request, is_dynamic_client=False))
+        rejected = cast(ApiClient, kube_client.api_clients[0])
+        self.loop.run_until_complete(kube_client.reset_clients(rejected))
+        self.loop.run_until_complete(kube_client.execute(request, is_dynamic_client=False))
+
+        # a concurrent request rejected with the old client resets after the client was recreated
+        self.loop.run_until_complete(kube_client.reset_clients(rejected))
+
+        self.assertEqual(2, len(kube_client.api_clients))
+        self.assertIs(kube_client.api_client, kube_client.api_clients[1])
+        self.assertFalse(kube_client.api_clients[1].closed)
+
+    def test_replaced_client_closed_after_in_flight_requests(self) -> None:
+        kube_client = FakeClientsKubeClient(self.loop)
+        released = asyncio.Event()
+
+        async def watch(client: Any) -> None:
+            await released.wait()
+
+        task = self.loop.create_task(kube_client.execute(watch, is_dynamic_client=False))
+        self.loop.run_until_complete(asyncio.sleep(0))
+        old = kube_client.api_clients[0]
+
+        self.loop.run_until_complete(kube_client.reset_clients(cast(ApiClient, old)))
+
+        self.assertFalse(old.closed)
+        released.set()
+        self.loop.run_until_complete(task)
+        self.assertTrue(old.closed)
+
+    def test_close_does_not_wait_for_in_flight_requests(self) -> None:
+        kube_client = FakeClientsKubeClient(self.loop)
+        released = asyncio.Event()
+
+        async def watch(client: Any) -> None:
+            await released.wait()
+
+        task = self.loop.create_task(kube_client.execute(watch, is_dynamic_client=False))
+        self.loop.run_until_complete(asyncio.sleep(0))
+
+        self.loop.run_until_complete(kube_client.close())
+
+        self.assertTrue(kube_client.api_clients[0].closed)
+        released.set()
+        self.loop.run_until_complete(task)
+
+    def test_watch_resumed_without_listing(self) -> None:
+        lists: List[int] = []
+        w = FakeWatch([[watch_event("ADDED", "pod1", "8")], [watch_event("MODIFIED", "pod1", "9")]])
+
+        events, position = self.watch(w, lists, watches=2)
+
+        self.assertEqual(1, len(lists))
+        self.assertEqual(["7", "8"], w.resource_versions)
+        self.assertEqual("9", position.resource_version)
+        self.assertEqual(
+            [EventType.SNAPSHOT_BEGIN, EventType.SNAPSHOT, EventType.SNAPSHOT_END, EventType.ADDED, EventType.MODIFIED],
+            [event.event for event in events],
+        )
+
+    def test_watch_position_advanced_by_bookmark(self) -> None:
+        lists: List[int] = []
+        w = FakeWatch([[watch_event("BOOKMARK", "", "12")], []])
+
+        events, position = self.watch(w, lists, watches=2)
+
+        self.assertEqual(["7", "12"], w.resource_versions)
+        self.assertEqual("12", position.resource_version)
+        self.assertEqual(
+            [EventType.SNAPSHOT_BEGIN, EventType.SNAPSHOT, EventType.SNAPSHOT_END], [event.event for event in events]
+        )
+
+    def test_watch_lists_again_after_expired_version(self) -> None:
+        lists: List[int] = []
+        w = FakeWatch([[ApiException(status=410, reason="Gone")], []])
+
+        events, position = self.watch(w, lists, watches=2)
+
+        self.assertEqual(2, len(lists))
+        self.assertEqual(["7", "7"], w.resource_versions)
+        self.assertEqual(
+            [EventType.SNAPSHOT_BEGIN, EventType.SNAPSHOT, EventType.SNAPSHOT_END] * 2,
+            [event.event for event in events],
+        )
+
+    def watch(self, w: FakeWatch, lists: List[int], watches: int) -> Tuple[List[KubeEvent], WatchPosition]:
+        async def list_func(limit: int, resource_version: str, _continue: str = "") -> Dict[str, Any]:
+            lists.append(limit)
+            return {"metadata": {"continue": "", "resourceVersion": "7"}, "items": [{"metadata": {"name": "pod1"}}]}
+
+        queue = AsyncQueue[KubeEvent]()
+        position = WatchPosition()
+        page_size = PageSize(size=10, max_size=10, target_seconds=60)
+        gvk = GroupVersionKind(group="", version="v1", kind="Pod")
+        for _ in range(watches):
+            self.loop.run_until_complete(
+                KubeClientImpl.watch_internal(cast(Watch, w), list_func, gvk, 0, 1, queue, position, page_size)
+            )
+
+        events = []
+        while (event := queue.get_nowait()) is not None:
+            events.append(event)
+        return events, position
@@ -1,15 +1,17 @@
-from httpx import AsyncClient, Client
+from typing import List, Tuple
 
-from placement_controller.clients.metrics.types import MetricsClient
+import re
+
+from httpx import AsyncClient
+
+from placement_controller.clients.metrics.types import Labels, MetricsClient
 
 
 class PrometheusMetricsClient(MetricsClient):
     async_client: AsyncClient
-    sync_client: Client
 
     def __init__(self, endpoint: str):
         self.async_client = AsyncClient(base_url=endpoint, timeout=30.0)
-        self.sync_client = Client(base_url=endpoint, timeout=30.0)
 
     async def get_metric(
         self,
@@ -31,23 +33,25 @@ class PrometheusMetricsClient(MetricsClient):
 
         return {"value": float(result[0].get("value", [None, "0"])[1])}
 
-    def get_metric_sync(
+    async def get_series(
         self,
         name: str,
-        labels: dict[str, str] | None = None,
-    ) -> dict[str, float] | None:
-        query = f"{name}"
-        if labels:
-            label_str = ",".join(f'{k}="{v}"' for k, v in labels.items())
-            query = f"{name}{{{label_str}}}"
+        matchers: dict[str, List[str]],
+    ) -> List[Tuple[Labels, float]]:
+        query = name
+        if matchers:
+            matcher_str = ",".join(f'{k}=~"{regex_union(values)}"' for k, values in matchers.items())
+            query = f"{name}{{{matcher_str}}}"
 
-        response = self.sync_client.get("/api/v1/query", params={"query": query})
+        response = await self.async_client.get("/api/v1/query", params={"query": query})
         response.raise_for_status()
 
         data = response.json()
         result = data.get("data", {}).get("result", [])
+        return [(series.get("metric", {}), float(series.get("value", [None, "0"])[1])) for series in result]
 
-        if not result:
-            return None
 
-        return {"value": float(result[0].get("value", [None, "0"])[1])}
+def regex_union(values: List[str]) -> str:
+    # escaped for the regex and then for the PromQL string literal
+    regex = "|".join(re.escape(value) for value in values)
+    return regex.replace("\\", "\\\\").replace('"', '\\"')
@@ -1,6 +1,6 @@
-from typing import Dict
+from typing import Dict, List, Tuple
 
-from placement_controller.clients.metrics.types import MetricsClient
+from placement_controller.clients.metrics.types import Labels, MetricsClient
 
 
 class FakeMetricsClient(MetricsClient):
@@ -17,13 +17,25 @@ class FakeMetricsClient(MetricsClient):
         key = self._make_key(name, labels)
         return self.metrics.get(key)
 
-    def get_metric_sync(
+    async def get_series(
         self,
         name: str,
-        labels: Dict[str, str] | None = None,
-    ) -> Dict[str, float] | None:
-        key = self._make_key(name, labels)
-        return self.metrics.get(key)
+        matchers: Dict[str, List[str]],
+    ) -> List[Tuple[Labels, float]]:
+        series = []
+        for key, metric in self.metrics.items():
+            metric_name, labels = self._parse_key(key)
+            is_match = all(labels.get(label) in values for label, values in matchers.items())
+            if metric_name == name and is_match:
+                series.append((labels, metric["value"]))
+        return series
+
+    def _parse_key(self, key: str) -> Tuple[str, Labels]:
+        if "{" not in key:
+            return key, {}
+        name, label_str = key.rstrip("}").split("{", 1)
+        labels = dict(label.split("=", 1) for label in label_str.split(",") if label)
+        return name, labels
 
     def _make_key(self, name: str, labels: Dict[str, str] | None) -> str:
         if labels:
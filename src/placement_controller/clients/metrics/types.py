@@ -1,4 +1,6 @@
-from typing import Dict
+from typing import Dict, List, Tuple
+
+Labels = Dict[str, str]
 
 
 class MetricsClient:
@@ -9,9 +11,10 @@ class MetricsClient:
     ) -> Dict[str, float] | None:
         raise NotImplementedError
 
-    def get_metric_sync(
+    async def get_series(
         self,
         name: str,
-        labels: Dict[str, str] | None = None,
-    ) -> Dict[str, float] | None:
+        matchers: Dict[str, List[str]],
+    ) -> List[Tuple[Labels, float]]:
+        """All series of the metric whose label values are among the matcher values"""
         raise NotImplementedError
@@ -0,0 +1,107 @@
+from typing import List, Optional, Set, Tuple
+
+import asyncio
+
+from loguru import logger
+
+from placement_controller.api.model import BidRequestModel, ErrorResponse
+from placement_controller.clients.placement.types import BATCH_NOT_SUPPORTED, BidResponseOrError, PlacementClient
+
+PendingBid = Tuple[BidRequestModel, asyncio.Future[BidResponseOrError]]
+
+
+def is_batch_not_supported(responses: List[BidResponseOrError]) -> bool:
+    return len(responses) > 0 and all(
+        isinstance(response, ErrorResponse) and response.code == BATCH_NOT_SUPPORTED for response in responses
+    )
+
+
+class BatchingPlacementClient(PlacementClient):
+    """
+    Collects the bids sent to a zone within a short window and sends them as one batch.
+    A window with a single bid sends it as a plain bid. Zones without the batch api get the bids one by one.
+    """
+
+    client: PlacementClient
+    window_seconds: float
+    max_batch_size: int
+    pending: List[PendingBid]
+    flush_handle: Optional[asyncio.TimerHandle]
+    # batches in flight, referenced until they complete
+    sending: Set[asyncio.Task[None]]
+    batch_supported: bool
+
+    def __init__(self, client: PlacementClient, window_seconds: float, max_batch_size: int):
+        self.client = client
+        self.window_seconds = window_seconds
+        self.max_batch_size = max(max_batch_size, 1)
+        self.pending = []
+        self.flush_handle = None
+        self.sending = set()
+        self.batch_supported = True
+
+    async def bid(self, bid: BidRequestModel) -> BidResponseOrError:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[BidResponseOrError] = loop.create_future()
+        self.pending.append((bid, future))
+        if len(self.pending) >= self.max_batch_size:
+            self.flush()
+        elif self.flush_handle is None:
+            self.flush_handle = loop.call_later(self.window_seconds, self.flush)
+        return await future
+
+    async def bid_batch(self, bids: List[BidRequestModel]) -> List[BidResponseOrError]:
+        return await self.client.bid_batch(bids)
+
+    def flush(self) -> None:
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        batch = self.pending
+        self.pending = []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self.send(batch))
+        self.sending.add(task)
+        task.add_done_callback(self.sending.discard)
+
+    async def send(self, batch: List[PendingBid]) -> None:
+        # bids of cancelled actions are not sent
+        batch = [(bid, future) for bid, future in batch if not future.done()]
+        if not batch:
+            return
+        bids = [bid for bid, _ in batch]
+        responses: List[BidResponseOrError]
+        try:
+            if len(batch) == 1:
+                responses = [await self.client.bid(bids[0])]
+            elif not self.batch_supported:
+                responses = await self.send_each(bids)
+            else:
+                logger.info(f"sending batch of {len(batch)} bids")
+                responses = await self.client.bid_batch(bids)
+                if is_batch_not_supported(responses):
+                    logger.warning("zone does not serve the batch api, bids are sent one by one")
+                    self.batch_supported = False
+                    responses = await self.send_each(bids)
+        except Exception as e:
+            responses = [ErrorResponse(status=500, code="INTERNAL_ERROR", msg=str(e)) for _ in batch]
+        for (_, future), response in zip(batch, responses):
+            if not future.done():
+                future.set_result(response)
+
+    async def send_each(self, bids: List[BidRequestModel]) -> List[BidResponseOrError]:
+        results = await asyncio.gather(*[self.client.bid(bid) for bid in bids], return_exceptions=True)
+        responses: List[BidResponseOrError] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                responses.append(ErrorResponse(status=500, code="INTERNAL_ERROR", msg=str(result)))
+            else:
+                responses.append(result)
+        return responses
+
+    async def close(self) -> None:
+        self.flush()
+        if self.sending:
+            await asyncio.gather(*self.sending, return_exceptions=True)
+        await self.client.close()
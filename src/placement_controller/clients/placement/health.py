@@ -0,0 +1,63 @@
+from typing import Awaitable, Callable, List, TypeVar
+
+import asyncio
+import time
+
+from placement_controller.api.model import BidRequestModel, ErrorResponse
+from placement_controller.clients.placement.types import BidResponseOrError, PlacementClient
+from placement_controller.zone.zone_health import ZoneHealthRegistry, ZoneId
+
+T = TypeVar("T")
+
+# a request cancelled after this share of its timeout counts as timed out, the bid deadline
+# usually fires just before the timeout of a hanging zone
+CANCELLED_TIMEOUT_RATIO: float = 0.9
+
+
+def is_zone_failure(response: BidResponseOrError) -> bool:
+    # client errors are caused by the request, not by the zone
+    return isinstance(response, ErrorResponse) and response.status >= 500
+
+
+class HealthTrackingPlacementClient(PlacementClient):
+    """Records latency and outcome of every request to a zone, requests time out after the zone's adaptive timeout."""
+
+    zone: ZoneId
+    client: PlacementClient
+    registry: ZoneHealthRegistry
+
+    def __init__(self, zone: ZoneId, client: PlacementClient, registry: ZoneHealthRegistry):
+        self.zone = zone
+        self.client = client
+        self.registry = registry
+
+    async def bid(self, bid: BidRequestModel) -> BidResponseOrError:
+        return await self.track(self.client.bid(bid), is_zone_failure)
+
+    async def bid_batch(self, bids: List[BidRequestModel]) -> List[BidResponseOrError]:
+        # a failed batch request is reported as the same error for every bid
+        return await self.track(
+            self.client.bid_batch(bids), lambda responses: len(responses) > 0 and all(map(is_zone_failure, responses))
+        )
+
+    async def track(self, request: Awaitable[T], is_failure: Callable[[T], bool]) -> T:
+        started = time.monotonic()
+        timeout = self.registry.timeout_seconds(self.zone)
+        try:
+            result = await asyncio.wait_for(request, timeout=timeout)
+        except asyncio.CancelledError:
+            # requests cancelled early, e.g. once the quorum is reached, are neither successes nor failures
+            if time.monotonic() - started >= timeout * CANCELLED_TIMEOUT_RATIO:
+                self.registry.record_failure(self.zone)
+            raise
+        except Exception:
+            self.registry.record_failure(self.zone)
+            raise
+        if is_failure(result):
+            self.registry.record_failure(self.zone)
+        else:
+            self.registry.record_success(self.zone, time.monotonic() - started)
+        return result
+
+    async def close(self) -> None:
+        await self.client.close()
@@ -1,7 +1,7 @@
-from typing import Union
+from typing import List, Union
 
 from placement_controller.api.model import BidRequestModel, BidResponseModel, ErrorResponse
-from placement_controller.clients.placement.types import PlacementClient
+from placement_controller.clients.placement.types import BidResponseOrError, PlacementClient
 from placement_controller.resources.types import ResourceManagement
 
 
@@ -13,3 +13,6 @@ class LocalPlacementClient(PlacementClient):
 
     async def bid(self, bid: BidRequestModel) -> Union[BidResponseModel, ErrorResponse]:
         return self.resource_management.application_bid(bid)
+
+    async def bid_batch(self, bids: List[BidRequestModel]) -> List[BidResponseOrError]:
+        return self.resource_management.application_bids(bids)
@@ -1,12 +1,16 @@
-from typing import Union
+from typing import Dict, List, Union
 
+from collections import OrderedDict
 from decimal import Decimal
+from http import HTTPStatus
 
 from placement_client import models
-from placement_client.api.default import application_bid
+from placement_client.api.default import application_bid, application_bid_batch
 from placement_client.client import Client
+from placement_client.types import UNSET
 
 from placement_controller.api.model import (
+    SPEC_NOT_FOUND,
     BidRequestModel,
     BidResponseModel,
     BidStatus,
@@ -17,19 +21,95 @@ from placement_controller.api.model import (
     NamespacedNameModel,
     TraceLogRowModel,
 )
-from placement_controller.clients.placement.types import PlacementClient
+from placement_controller.clients.placement.types import BATCH_NOT_SUPPORTED, BidResponseOrError, PlacementClient
+
+DEFAULT_MAX_REFERENCED_SPECS: int = 1024
+VALIDATION_ERROR: str = "VALIDATION_ERROR"
 
 
 class RemotePlacementClient(PlacementClient):
+    """
+    Placement api of a remote zone.
+    A spec is sent in full until the zone confirms it holds the spec by echoing its digest, later bids
+    reference it by digest. Bids the zone rejects with SPEC_NOT_FOUND, as it dropped the spec meanwhile,
+    are sent again with the spec. A zone rejecting a bid without spec as invalid predates digests,
+    it gets every spec in full from then on.
+    """
+
     client: Client
+    max_referenced_specs: int
+    references_supported: bool
+    # digests of the specs the zone holds, least recently used first
+    referenced_specs: "OrderedDict[str, None]"
 
-    def __init__(self, client: Client):
+    def __init__(self, client: Client, max_referenced_specs: int = DEFAULT_MAX_REFERENCED_SPECS):
         self.client = client
+        self.max_referenced_specs = max_referenced_specs
+        self.references_supported = max_referenced_specs > 0
+        self.referenced_specs = OrderedDict()
+
+    async def close(self) -> None:
+        # get_async_httpx_client would create a client only to close it
+        if self.client._async_client is not None:
+            await self.client._async_client.aclose()
 
     async def bid(
         self,
         bid: BidRequestModel,
     ) -> Union[BidResponseModel, ErrorResponse]:
+        request = self.to_reference(bid)
+        response = await self.send_bid(request)
+        if self.is_spec_miss(request, response):
+            response = await self.send_bid(bid)
+        self.on_response(bid, response)
+        return response
+
+    async def bid_batch(self, bids: List[BidRequestModel]) -> List[BidResponseOrError]:
+        requests = [self.to_reference(bid) for bid in bids]
+        responses = await self.send_batch(requests)
+        misses = [
+            i for i, (request, response) in enumerate(zip(requests, responses)) if self.is_spec_miss(request, response)
+        ]
+        if misses:
+            resent = await self.send_batch([bids[i] for i in misses])
+            for i, response in zip(misses, resent):
+                responses[i] = response
+        for bid, response in zip(bids, responses):
+            self.on_response(bid, response)
+        return responses
+
+    def to_reference(self, bid: BidRequestModel) -> BidRequestModel:
+        if bid.spec is None or not self.references_supported:
+            return bid
+        digest = bid.get_spec_digest()
+        if digest in self.referenced_specs:
+            self.referenced_specs.move_to_end(digest)
+            return bid.without_spec()
+        return bid.model_copy(update={"spec_digest": digest})
+
+    def is_spec_miss(self, request: BidRequestModel, response: BidResponseOrError) -> bool:
+        if request.spec is not None or not isinstance(response, ErrorResponse):
+            return False
+        if response.code == VALIDATION_ERROR:
+            # the zone predates digests and requires the spec
+            self.references_supported = False
+            self.referenced_specs.clear()
+            return True
+        return response.code == SPEC_NOT_FOUND
+
+    def on_response(self, bid: BidRequestModel, response: BidResponseOrError) -> None:
+        if bid.spec is None or not self.references_supported:
+            return
+        digest = bid.get_spec_digest()
+        if isinstance(response, BidResponseModel) and response.spec_digest == digest:
+            self.referenced_specs[digest] = None
+            self.referenced_specs.move_to_end(digest)
+            while len(self.referenced_specs) > self.max_referenced_specs:
+                self.referenced_specs.popitem(last=False)
+        else:
+            self.referenced_specs.pop(digest, None)
+
+    async def send_bid(self, bid: BidRequestModel) -> BidResponseOrError:
         api_response = await application_bid.asyncio(
             client=self.client, body=RemotePlacementClient.to_client_request(bid)
         )
@@ -41,17 +121,46 @@ class RemotePlacementClient(PlacementClient):
         elif isinstance(api_response, models.ErrorResponse):
             response = ErrorResponse(status=api_response.status, code=api_response.code, msg=api_response.msg or None)
         elif isinstance(api_response, models.HTTPValidationError):
-            response = ErrorResponse(status=422, code="VALIDATION_ERROR", msg=str(api_response))
+            response = ErrorResponse(status=422, code=VALIDATION_ERROR, msg=str(api_response))
         return response
 
+    async def send_batch(self, bids: List[BidRequestModel]) -> List[BidResponseOrError]:
+        body = models.BidBatchRequestModel(bids=[RemotePlacementClient.to_client_request(bid) for bid in bids])
+        detailed = await application_bid_batch.asyncio_detailed(client=self.client, body=body)
+        api_response = detailed.parsed
+        error: ErrorResponse
+        if detailed.status_code in (HTTPStatus.NOT_FOUND, HTTPStatus.METHOD_NOT_ALLOWED):
+            error = ErrorResponse(
+                status=detailed.status_code, code=BATCH_NOT_SUPPORTED, msg="Zone does not serve the batch api"
+            )
+        elif not api_response:
+            error = ErrorResponse(status=500, code="INTERNAL_ERROR", msg="Received empty response")
+        elif isinstance(api_response, models.BidBatchResponseModel):
+            responses: Dict[str, BidResponseOrError] = dict()
+            for response in api_response.responses:
+                responses[response.id] = RemotePlacementClient.from_client_response(response)
+            for batch_error in api_response.errors:
+                responses[batch_error.id] = ErrorResponse(
+                    status=batch_error.error.status, code=batch_error.error.code, msg=batch_error.error.msg or None
+                )
+            missing = ErrorResponse(status=500, code="INTERNAL_ERROR", msg="Bid is missing in the batch response")
+            return [responses.get(bid.id, missing) for bid in bids]
+        elif isinstance(api_response, models.ErrorResponse):
+            error = ErrorResponse(status=api_response.status, code=api_response.code, msg=api_response.msg or None)
+        elif isinstance(api_response, models.HTTPValidationError):
+            error = ErrorResponse(status=422, code=VALIDATION_ERROR, msg=str(api_response))
+        return [error for _ in bids]
+
     @staticmethod
     def to_client_request(bid: BidRequestModel) -> models.BidRequestModel:
         return models.BidRequestModel(
             id=bid.id,
             name=models.NamespacedNameModel(name=bid.name.name, namespace=bid.name.namespace),
-            spec=bid.spec,
+            spec=bid.spec if bid.spec is not None else UNSET,
+            spec_digest=bid.spec_digest if bid.spec_digest is not None else UNSET,
             bid_criteria=[models.BidCriteria(criteria) for criteria in bid.bid_criteria],
             metrics=[models.Metric(metric) for metric in bid.metrics],
+            strategy=models.PlacementStrategy(bid.strategy) if bid.strategy else None,
         )
 
     @staticmethod
@@ -75,4 +184,5 @@ class RemotePlacementClient(PlacementClient):
             msg=bid_response.msg or None,
             trace=[to_trace_log_row(row) for row in bid_response.trace],
             metrics=[to_metric_value(m) for m in bid_response.metrics],
+            spec_digest=bid_response.spec_digest or None,
         )
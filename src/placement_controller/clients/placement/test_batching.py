@@ -0,0 +1,115 @@
+from typing import List
+
+import asyncio
+
+from placement_controller.api.model import (
+    BidCriteria,
+    BidRequestModel,
+    BidResponseModel,
+    BidStatus,
+    ErrorResponse,
+    NamespacedNameModel,
+)
+from placement_controller.async_fixture import AsyncTestFixture
+from placement_controller.clients.placement.batching import BatchingPlacementClient
+from placement_controller.clients.placement.types import BATCH_NOT_SUPPORTED, BidResponseOrError, PlacementClient
+
+
+class RecordingPlacementClient(PlacementClient):
+    bids: List[str]
+    batches: List[List[str]]
+    fail: bool
+    batch_supported: bool
+
+    def __init__(self) -> None:
+        self.bids = []
+        self.batches = []
+        self.fail = False
+        self.batch_supported = True
+
+    async def bid(self, bid: BidRequestModel) -> BidResponseOrError:
+        self.bids.append(bid.id)
+        return self.response(bid)
+
+    async def bid_batch(self, bids: List[BidRequestModel]) -> List[BidResponseOrError]:
+        self.batches.append([bid.id for bid in bids])
+        if self.fail:
+            raise RuntimeError("zone is not available")
+        if not self.batch_supported:
+            return [ErrorResponse(status=404, code=BATCH_NOT_SUPPORTED, msg="Not Found") for _ in bids]
+        return [self.response(bid) for bid in bids]
+
+    def response(self, bid: BidRequestModel) -> BidResponseOrError:
+        return BidResponseModel(id=bid.id, status=BidStatus.accepted, trace=[], metrics=[])
+
+
+class BatchingPlacementClientTest(AsyncTestFixture):
+    client: RecordingPlacementClient
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client = RecordingPlacementClient()
+
+    def make_bid(self, id: str) -> BidRequestModel:
+        return BidRequestModel(
+            id=id,
+            name=NamespacedNameModel(name=id, namespace="test"),
+            spec="{}",
+            bid_criteria=[BidCriteria.cpu],
+            metrics=set(),
+        )
+
+    def send(self, batching: BatchingPlacementClient, ids: List[str]) -> List[BidResponseOrError]:
+        async def run() -> List[BidResponseOrError]:
+            return await asyncio.gather(*[batching.bid(self.make_bid(id)) for id in ids])
+
+        return self.loop.run_until_complete(run())
+
+    def test_concurrent_bids_batched(self) -> None:
+        batching = BatchingPlacementClient(self.client, window_seconds=0.01, max_batch_size=10)
+
+        responses = self.send(batching, ["a", "b", "c"])
+
+        self.assertEqual([["a", "b", "c"]], self.client.batches)
+        self.assertEqual([], self.client.bids)
+        self.assertEqual(
+            ["a", "b", "c"], [response.id for response in responses if isinstance(response, BidResponseModel)]
+        )
+
+    def test_batches_split_at_max_size(self) -> None:
+        batching = BatchingPlacementClient(self.client, window_seconds=10, max_batch_size=2)
+
+        self.send(batching, ["a", "b", "c", "d"])
+
+        self.assertEqual([["a", "b"], ["c", "d"]], self.client.batches)
+
+    def test_single_bid_sent_alone(self) -> None:
+        batching = BatchingPlacementClient(self.client, window_seconds=0.01, max_batch_size=10)
+
+        self.send(batching, ["a"])
+
+        self.assertEqual(["a"], self.client.bids)
+        self.assertEqual([], self.client.batches)
+
+    def test_batch_failure_returned_per_bid(self) -> None:
+        self.client.fail = True
+        batching = BatchingPlacementClient(self.client, window_seconds=0.01, max_batch_size=10)
+
+        responses = self.send(batching, ["a", "b"])
+
+        self.assertEqual(2, len(responses))
+        for response in responses:
+            assert isinstance(response, ErrorResponse)
+            self.assertEqual("zone is not available", response.msg)
+
+    def test_bids_sent_one_by_one_without_batch_api(self) -> None:
+        self.client.batch_supported = False
+        batching = BatchingPlacementClient(self.client, window_seconds=0.01, max_batch_size=10)
+
+        responses = self.send(batching, ["a", "b"])
+        self.send(batching, ["c", "d"])
+
+        self.assertEqual(["a", "b"], [response.id for response in responses if isinstance(response, BidResponseModel)])
+        # the batch api is tried once only
+        self.assertEqual([["a", "b"]], self.client.batches)
+        self.assertEqual(["a", "b", "c", "d"], self.client.bids)
@@ -0,0 +1,191 @@
+from typing import List, Optional, Set, Union
+
+import httpx
+from fastapi import FastAPI
+from placement_client.client import Client
+from pydantic import BaseModel
+
+from placement_controller.api.app import create_api
+from placement_controller.api.model import (
+    SPEC_NOT_FOUND,
+    BidCriteria,
+    BidRequestModel,
+    BidResponseModel,
+    BidStatus,
+    ErrorResponse,
+    NamespacedNameModel,
+)
+from placement_controller.async_fixture import AsyncTestFixture
+from placement_controller.clients.placement.remote import RemotePlacementClient
+from placement_controller.clients.placement.transport import CompressingTransport
+from placement_controller.clients.placement.types import BATCH_NOT_SUPPORTED
+from placement_controller.resources.types import ResourceManagement
+
+
+class SpecHoldingResourceManagement(ResourceManagement):
+    """Accepts bids whose spec it holds, records whether bids carried their spec."""
+
+    digests: Set[str]
+    received: List[Optional[str]]
+    # zones predating spec digests neither hold specs nor echo digests
+    legacy: bool
+
+    def __init__(self) -> None:
+        self.digests = set()
+        self.received = []
+        self.legacy = False
+
+    def application_bid(self, bid: BidRequestModel) -> Union[BidResponseModel, ErrorResponse]:
+        self.received.append(bid.spec)
+        if self.legacy:
+            return BidResponseModel(id=bid.id, status=BidStatus.accepted, trace=[], metrics=[])
+        if bid.spec is not None:
+            self.digests.add(bid.get_spec_digest())
+        elif bid.get_spec_digest() not in self.digests:
+            return ErrorResponse(status=404, code=SPEC_NOT_FOUND, msg="Spec not found.")
+        return BidResponseModel(
+            id=bid.id, status=BidStatus.accepted, trace=[], metrics=[], spec_digest=bid.get_spec_digest()
+        )
+
+    def application_bids(self, bids: List[BidRequestModel]) -> List[Union[BidResponseModel, ErrorResponse]]:
+        return [self.application_bid(bid) for bid in bids]
+
+
+class RecordingTransport(httpx.ASGITransport):
+    headers: List[httpx.Headers]
+
+    def __init__(self, app: FastAPI) -> None:
+        super().__init__(app)
+        self.headers = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.headers.append(request.headers)
+        return await super().handle_async_request(request)
+
+
+class RemotePlacementClientTest(AsyncTestFixture):
+    resource_management: SpecHoldingResourceManagement
+    transport: RecordingTransport
+    client: RemotePlacementClient
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.resource_management = SpecHoldingResourceManagement()
+        app = create_api()
+        app.state.resource_management = self.resource_management
+        self.transport = RecordingTransport(app)
+        transport = CompressingTransport(self.transport, compression_min_bytes=0)
+        self.client = RemotePlacementClient(Client(base_url="http://zone", httpx_args={"transport": transport}))
+
+    def tearDown(self) -> None:
+        self.loop.run_until_complete(self.client.close())
+        super().tearDown()
+
+    def make_bid(self, id: str, spec: str = '{"resources": []}') -> BidRequestModel:
+        return BidRequestModel(
+            id=id,
+            name=NamespacedNameModel(name=id, namespace="test"),
+            spec=spec,
+            bid_criteria=[BidCriteria.cpu],
+            metrics=set(),
+        )
+
+    def test_spec_referenced_after_first_bid(self) -> None:
+        spec = '{"resources": []}'
+
+        first = self.loop.run_until_complete(self.client.bid(self.make_bid("a", spec)))
+        second = self.loop.run_until_complete(self.client.bid(self.make_bid("b", spec)))
+
+        self.assertIsInstance(first, BidResponseModel)
+        self.assertIsInstance(second, BidResponseModel)
+        self.assertEqual([spec, None], self.resource_management.received)
+
+    def test_spec_resent_on_miss(self) -> None:
+        self.loop.run_until_complete(self.client.bid(self.make_bid("a")))
+        self.resource_management.digests.clear()
+
+        response = self.loop.run_until_complete(self.client.bid(self.make_bid("b")))
+
+        self.assertIsInstance(response, BidResponseModel)
+        self.assertEqual(['{"resources": []}', None, '{"resources": []}'], self.resource_management.received)
+
+    def test_batch_resends_missed_specs_only(self) -> None:
+        self.loop.run_until_complete(self.client.bid(self.make_bid("a", "{}")))
+        self.loop.run_until_complete(self.client.bid(self.make_bid("b", "[]")))
+        self.resource_management.digests.remove(self.make_bid("b", "[]").get_spec_digest())
+        self.resource_management.received.clear()
+
+        responses = self.loop.run_until_complete(
+            self.client.bid_batch([self.make_bid("c", "{}"), self.make_bid("d", "[]")])
+        )
+
+        self.assertEqual(["c", "d"], [response.id for response in responses if isinstance(response, BidResponseModel)])
+        self.assertEqual([None, None, "[]"], self.resource_management.received)
+
+    def test_requests_compressed(self) -> None:
+        response = self.loop.run_until_complete(self.client.bid(self.make_bid("a")))
+
+        self.assertIsInstance(response, BidResponseModel)
+        self.assertEqual("gzip", self.transport.headers[0].get("content-encoding"))
+
+    def test_spec_not_referenced_without_confirmation(self) -> None:
+        self.resource_management.legacy = True
+        spec = '{"resources": []}'
+
+        self.loop.run_until_complete(self.client.bid(self.make_bid("a", spec)))
+        self.loop.run_until_complete(self.client.bid(self.make_bid("b", spec)))
+
+        self.assertEqual([spec, spec], self.resource_management.received)
+
+    def test_references_stopped_on_validation_error(self) -> None:
+        received: List[Optional[str]] = []
+
+        # api of a zone predating spec digests
+        class LegacyBidRequestModel(BaseModel):
+            id: str
+            spec: str
+
+        legacy = FastAPI()
+
+        @legacy.put("/bids/", response_model=BidResponseModel)
+        async def application_bid(bid: LegacyBidRequestModel) -> BidResponseModel:
+            received.append(bid.spec)
+            return BidResponseModel(id=bid.id, status=BidStatus.accepted, trace=[], metrics=[])
+
+        client = RemotePlacementClient(
+            Client(base_url="http://zone", httpx_args={"transport": httpx.ASGITransport(legacy)})
+        )
+        bid = self.make_bid("a")
+        # the digest was confirmed before the zone was rolled back
+        client.referenced_specs[bid.get_spec_digest()] = None
+
+        first = self.loop.run_until_complete(client.bid(bid))
+        second = self.loop.run_until_complete(client.bid(self.make_bid("b")))
+        self.loop.run_until_complete(client.close())
+
+        self.assertIsInstance(first, BidResponseModel)
+        self.assertIsInstance(second, BidResponseModel)
+        self.assertFalse(client.references_supported)
+        self.assertEqual([bid.spec, bid.spec], received)
+
+    def test_batch_not_supported(self) -> None:
+        # api of a zone predating the batch api
+        legacy = FastAPI()
+        client = RemotePlacementClient(
+            Client(base_url="http://zone", httpx_args={"transport": httpx.ASGITransport(legacy)})
+        )
+
+        responses = self.loop.run_until_complete(client.bid_batch([self.make_bid("a"), self.make_bid("b")]))
+        self.loop.run_until_complete(client.close())
+
+        self.assertEqual(
+            [BATCH_NOT_SUPPORTED, BATCH_NOT_SUPPORTED],
+            [response.code for response in responses if isinstance(response, ErrorResponse)],
+        )
+
+    def test_close_without_requests(self) -> None:
+        client = RemotePlacementClient(Client(base_url="http://zone"))
+
+        self.loop.run_until_complete(client.close())
+
+        self.assertIsNone(client.client._async_client)
@@ -0,0 +1,36 @@
+import httpx
+
+from placement_controller.api.encoding import GZIP, compress
+
+
+class CompressingTransport(httpx.AsyncBaseTransport):
+    """
+    Gzip compresses request bodies of the generated client from compression_min_bytes on.
+    Compressed responses are decoded by httpx.
+    """
+
+    transport: httpx.AsyncBaseTransport
+    compression_min_bytes: int
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, compression_min_bytes: int):
+        self.transport = transport
+        self.compression_min_bytes = compression_min_bytes
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.transport.handle_async_request(await self.compress_request(request))
+
+    async def compress_request(self, request: httpx.Request) -> httpx.Request:
+        if "content-encoding" in request.headers:
+            return request
+        body = await request.aread()
+        if len(body) == 0 or len(body) < self.compression_min_bytes:
+            return request
+
+        body = compress(body)
+        headers = request.headers.copy()
+        headers["content-encoding"] = GZIP
+        headers["content-length"] = str(len(body))
+        return httpx.Request(request.method, request.url, headers=headers, content=body, extensions=request.extensions)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -1,12 +1,24 @@
-from typing import Union
+from typing import List, Union
 
 from placement_controller.api.model import BidRequestModel, BidResponseModel, ErrorResponse
 
+BidResponseOrError = Union[BidResponseModel, ErrorResponse]
+
+# error code of bids sent in a batch to a zone without the batch api
+BATCH_NOT_SUPPORTED: str = "BATCH_NOT_SUPPORTED"
+
 
 class PlacementClient:
 
     async def bid(
         self,
         bid: BidRequestModel,
-    ) -> Union[BidResponseModel, ErrorResponse]:
+    ) -> BidResponseOrError:
         raise NotImplementedError
+
+    async def bid_batch(self, bids: List[BidRequestModel]) -> List[BidResponseOrError]:
+        """Responses in the order of the bids, clients without a batch api send the bids one by one."""
+        return [await self.bid(bid) for bid in bids]
+
+    async def close(self) -> None:
+        pass
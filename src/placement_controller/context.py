@@ -1,24 +1,31 @@
 from typing import Any, List, Optional
 
 import asyncio
+import multiprocessing
+from multiprocessing.context import SpawnProcess
 
 from application_client.client import Client
 from loguru import logger
 from prometheus_async.aio.web import start_http_server
+from prometheus_client import REGISTRY
 
 from placement_controller.api.app import start_fastapi
 from placement_controller.clients.k8s.client import KubeClient
 from placement_controller.clients.metrics.types import MetricsClient
 from placement_controller.clients.placement.local import LocalPlacementClient
 from placement_controller.core.applications import Applications
+from placement_controller.core.shards import MessageQueue, ShardDispatcher
+from placement_controller.jobs.spec_cache import SpecCache
 from placement_controller.jobs.types import ExecutorContext
 from placement_controller.resources.resource_managment import ResourceManagementImpl
 from placement_controller.resources.resource_metrics import DynamicResourceMetrics, ResourceMetricsImpl
 from placement_controller.resources.resource_tracking import ResourceTrackingImpl
 from placement_controller.settings import Settings
+from placement_controller.shard_worker import run_shard
 from placement_controller.store.types import DecisionStore
 from placement_controller.util.clock import Clock
 from placement_controller.zone.zone_api_factory import ZoneApiFactoryImpl
+from placement_controller.zone.zone_health import ZoneHealthCollector
 
 
 class Context:
@@ -32,7 +39,11 @@ class Context:
     resource_tracking: ResourceTrackingImpl
     resource_management: ResourceManagementImpl
     executor_context: ExecutorContext
+    zone_api_factory: ZoneApiFactoryImpl
+    kube_client: KubeClient
     applications: Applications
+    shard_workers: List[SpawnProcess]
+    zone_health_collector: ZoneHealthCollector
 
     def __init__(
         self,
@@ -50,14 +61,26 @@ class Context:
         self.loop = loop
         self.tasks = []
         self.prometheus_client = prometheus_client
+        self.kube_client = kube_client
 
         # Initialize resource metrics
         self._init_resource_metrics()
         self.resource_tracking = ResourceTrackingImpl(kube_client, self.terminated)
         self.resource_management = ResourceManagementImpl(
-            self.settings.placement.current_zone, clock, kube_client, self.resource_tracking, self.resource_metrics
+            self.settings.placement.current_zone,
+            clock,
+            kube_client,
+            self.resource_tracking,
+            self.resource_metrics,
+            self.settings.placement.placement_strategy,
+            self.settings.placement.bid_cache_size,
+            self.settings.placement.trace,
+            self.settings.placement.bid_spec_cache_size,
+            self.settings.placement.spread_topology_key,
         )
-        zone_api_factory.set_local_client(LocalPlacementClient(self.resource_management))
+        self.zone_api_factory = zone_api_factory
+        self.zone_api_factory.set_local_client(LocalPlacementClient(self.resource_management))
+        self.zone_health_collector = ZoneHealthCollector(self.zone_api_factory.health)
 
         self.executor_context = ExecutorContext(
             application_controller_client=app_client,
@@ -65,9 +88,43 @@ class Context:
             kube_client=kube_client,
             clock=clock,
             decision_store=decision_store,
+            spec_cache=SpecCache(
+                settings.placement.spec_cache_size, settings.placement.spec_cache_max_age_seconds, clock
+            ),
         )
 
-        self.applications = Applications(clock, self.executor_context, kube_client, self.terminated, settings.placement)
+        self.shard_workers = []
+        if settings.placement.shards > 1:
+            self._init_shards(clock)
+        else:
+            self.applications = Applications(
+                clock, self.executor_context, kube_client, self.terminated, settings.placement
+            )
+
+    def _init_shards(self, clock: Clock) -> None:
+        # workers are spawned, a forked child would inherit the running event loop
+        mp = multiprocessing.get_context("spawn")
+        inboxes: List[MessageQueue] = []
+        outboxes: List[MessageQueue] = []
+        for shard in range(self.settings.placement.shards):
+            inbox, outbox = mp.Queue(), mp.Queue()
+            inboxes.append(inbox)
+            outboxes.append(outbox)
+            self.shard_workers.append(
+                mp.Process(
+                    target=run_shard, args=(self.settings, shard, inbox, outbox), name=f"shard-{shard}", daemon=True
+                )
+            )
+        self.applications = ShardDispatcher(
+            inboxes,
+            outboxes,
+            clock,
+            self.executor_context,
+            self.kube_client,
+            self.terminated,
+            self.settings.placement,
+            self.shard_workers,
+        )
 
     def _init_resource_metrics(self) -> None:
         if self.settings.metrics.prometheus_metrics and self.prometheus_client:
@@ -88,6 +145,8 @@ class Context:
         self.loop.run_until_complete(self.run_tasks())
 
     async def run_tasks(self) -> None:
+        for worker in self.shard_workers:
+            worker.start()
         self.tasks.append(self.loop.create_task(self.resource_tracking.start()))
         self.tasks.append(self.loop.create_task(self.applications.run()))
         self.tasks.append(
@@ -96,13 +155,21 @@ class Context:
         if isinstance(self.resource_metrics, DynamicResourceMetrics):
             self.tasks.append(self.loop.create_task(self.resource_metrics.prometheus_update_loop()))
 
+        REGISTRY.register(self.zone_health_collector)
         self.prometheus_server = await start_http_server(port=self.settings.prometheus.endpoint_port)
 
     def stop(self) -> None:
         self.terminated.set()
         for task in self.tasks:
             task.cancel()
+        for worker in self.shard_workers:
+            worker.terminate()
+        for worker in self.shard_workers:
+            worker.join()
         self.loop.run_until_complete(self.prometheus_server.close())
+        REGISTRY.unregister(self.zone_health_collector)
+        self.loop.run_until_complete(self.zone_api_factory.close())
+        self.loop.run_until_complete(self.kube_client.close())
 
     def wait_for_termination(self) -> None:
         self.loop.run_until_complete(self.terminated.wait())
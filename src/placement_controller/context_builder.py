@@ -6,7 +6,6 @@ from argparse import Namespace
 from io import StringIO
 
 from application_client.client import Client
-from orchestrationlib_client.client import Client as OrchestrationLibClient
 
 from placement_controller.clients.k8s.client_impl import KubeClientImpl
 from placement_controller.clients.metrics.client import PrometheusMetricsClient
@@ -15,9 +14,7 @@ from placement_controller.clients.placement.types import PlacementClient
 from placement_controller.context import Context
 from placement_controller.pydantic_yaml import from_yaml
 from placement_controller.settings import Settings
-from placement_controller.store.decision_store import DecisionStoreImpl
-from placement_controller.store.fake_decision_store import FakeDecisionStore
-from placement_controller.store.types import DecisionStore
+from placement_controller.store.factory import new_decision_store
 from placement_controller.util.clock_impl import ClockImpl
 from placement_controller.zone.zone_api_factory import ZoneApiFactoryImpl
 
@@ -69,14 +66,9 @@ class ContextBuilder:
         kube_client = KubeClientImpl(self.settings.k8s, loop)
 
         app_client = Client(base_url=self.settings.placement.application_controller_endpoint)
-        zone_api_factory = ZoneApiFactoryImpl(self.settings.placement, PlacementClient())
+        zone_api_factory = ZoneApiFactoryImpl(self.settings.placement, PlacementClient(), clock)
 
-        decision_store: DecisionStore
-        if self.settings.orchestrationlib.enabled:
-            orchestrationlib_client = OrchestrationLibClient(base_url=self.settings.orchestrationlib.base_url)
-            decision_store = DecisionStoreImpl(orchestrationlib_client)
-        else:
-            decision_store = FakeDecisionStore()
+        decision_store = new_decision_store(self.settings.orchestrationlib)
 
         prometheus_client: Optional[MetricsClient] = None
         if self.settings.metrics.prometheus_metrics:
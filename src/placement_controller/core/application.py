@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from enum import StrEnum
 
 from placement_controller.clients.k8s.client import GroupVersionKind, NamespacedName
+from placement_controller.clients.k8s.event import resource_version
 
 
 class GlobalState(StrEnum):
@@ -151,4 +152,9 @@ class AnyApplication:
             raise Exception(msg)
 
     def get_resource_version(self) -> Optional[int]:
-        return 0
+        return resource_version(self.object)
+
+    def get_generation(self) -> Optional[int]:
+        """Version of the application spec, status updates do not change it."""
+        generation = (self.object.get("metadata") or {}).get("generation")
+        return generation if isinstance(generation, int) else None
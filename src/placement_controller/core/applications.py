@@ -9,7 +9,9 @@ from placement_controller.clients.k8s.client import KubeClient, NamespacedName
 from placement_controller.clients.k8s.event import EventType, KubeEvent
 from placement_controller.core.application import AnyApplication
 from placement_controller.core.async_queue import AsyncQueue
+from placement_controller.core.event_coalescer import EventCoalescer
 from placement_controller.core.scheduling_queue import SchedulingQueue
+from placement_controller.jobs.action_queue import ActionQueue
 from placement_controller.jobs.executor import JobExecutor
 from placement_controller.jobs.types import Action, ActionResult, ExecutorContext
 from placement_controller.membership.types import Membership, PlacementZone
@@ -27,10 +29,14 @@ class Applications:
     is_terminated: asyncio.Event
     membership_watcher: MembershipWatcher
     tick_interval_seconds: float
+    # longest sleep of the ticker without due contexts
+    max_tick_interval_seconds: float
+    tick_requested: asyncio.Event
     initialized: bool
 
+    coalescer: EventCoalescer
     scheduling_queue: SchedulingQueue
-    actions: AsyncQueue[Action[ActionResult]]
+    actions: ActionQueue
     results: AsyncQueue[ActionResult]
 
     def __init__(
@@ -45,14 +51,24 @@ class Applications:
         self.client = client
         self.settings = settings
         self.tick_interval_seconds = 1.0
+        self.max_tick_interval_seconds = 60.0
+        self.tick_requested = asyncio.Event()
         self.is_terminated = is_terminated
         self.initialized = False
 
-        self.actions = AsyncQueue[Action[ActionResult]]()
+        self.coalescer = EventCoalescer(settings.watch_events)
+        self.actions = ActionQueue(clock, settings.executor.queue)
         self.results = AsyncQueue[ActionResult]()
-        self.scheduling_queue = SchedulingQueue(clock, settings.current_zone)
+        self.scheduling_queue = SchedulingQueue(
+            clock,
+            settings.current_zone,
+            settings.history_depth,
+            settings.trace,
+            settings.bids,
+            executor_context.spec_cache,
+        )
         self.membership_watcher = MembershipWatcher(client, self.is_terminated, self.on_membership_change)
-        self.executor = JobExecutor(executor_context, self.actions, self.results, self.is_terminated)
+        self.executor = JobExecutor(executor_context, self.actions, self.results, self.is_terminated, settings.executor)
 
         logger.info(f"owner zone '{settings.current_zone}'")
         # this needs to be loaded separately from kubernetes on boot
@@ -78,16 +94,36 @@ class Applications:
         subscriber_id, queue = self.client.watch(AnyApplication.GVK, self.settings.namespace, 0, self.is_terminated)
         self.initialized = True
         while not self.is_terminated.is_set():
-            event = await queue.get()
+            if self.coalescer.has_pending():
+                # rest of a capped batch, other tasks run first
+                await asyncio.sleep(0)
+            else:
+                self.coalescer.add(await queue.get())
+                # events arriving within the window are handled in the same batch
+                await asyncio.sleep(self.settings.watch_events.window_seconds)
+            # events arriving while the previous batch was handled are coalesced too
+            while (event := queue.get_nowait()) is not None:
+                self.coalescer.add(event)
+            await self.handle_batch(self.coalescer.take_batch())
+        self.client.stop_watch(subscriber_id)
+
+    async def handle_batch(self, batch: List[KubeEvent]) -> None:
+        logger.info(
+            f"{AnyApplication.GVK.to_string()} incoming events {len(batch)}, coalesced {self.coalescer.dropped}"
+        )
+        self.coalescer.dropped = 0
+        for event in batch:
             try:
-                logger.info(f"{AnyApplication.GVK.to_string()} incoming event {event.event}")
                 await self.handle_event(event)
             except Exception as e:
                 logger.error(f"{AnyApplication.GVK.to_string()} error while handling event {e}")
-        self.client.stop_watch(subscriber_id)
+        self.tick_requested.set()
 
     async def handle_event(self, event: KubeEvent) -> None:
-        if event.event == EventType.SNAPSHOT:
+        if event.event == EventType.SNAPSHOT_BEGIN:
+            self.scheduling_queue.on_snapshot_begin()
+
+        elif event.event == EventType.SNAPSHOT:
             if not isinstance(event.object, list):
                 logger.warning(f"{AnyApplication.GVK.to_string()} Skipping Snapshot event. List expected.")
                 return
@@ -96,6 +132,9 @@ class Applications:
             action_result = self.scheduling_queue.load_state(applications)
             self.handle_actions(action_result)
 
+        elif event.event == EventType.SNAPSHOT_END:
+            self.handle_actions(self.scheduling_queue.on_snapshot_end())
+
         elif event.event == EventType.ADDED or event.event == EventType.MODIFIED:
             if not isinstance(event.object, dict):
                 logger.warning(f"{AnyApplication.GVK.to_string()} Skipping Update event. Dict expected.")
@@ -126,6 +165,7 @@ class Applications:
                     f"{action_result.get_application_name().to_string()}: action result {type(action_result).__name__}"
                 )
                 self.handle_result(action_result)
+                self.tick_requested.set()
             except Exception as e:
                 logger.error(f"error while handling result {e}")
 
@@ -136,17 +176,33 @@ class Applications:
     def on_membership_change(self, membership: Membership) -> None:
         actions = self.scheduling_queue.on_membership_update(membership, self.clock.now_seconds())
         self.handle_actions(actions)
+        self.tick_requested.set()
 
     async def ticker(self) -> None:
         logger.info("Ticker started.")
         try:
             while not self.is_terminated.is_set():
+                self.tick_requested.clear()
                 actions = self.scheduling_queue.on_tick(self.clock.now_seconds())
                 self.handle_actions(actions)
                 await asyncio.sleep(self.tick_interval_seconds)
+                await self.wait_for_next_tick()
         except Exception as e:
             logger.error(f"Ticker loop error: {e}")
 
+    async def wait_for_next_tick(self) -> None:
+        """Sleeps until the next scheduling deadline or until contexts changed."""
+        deadline = self.scheduling_queue.next_deadline()
+        delay = self.max_tick_interval_seconds
+        if deadline is not None:
+            delay = min(delay, deadline - self.clock.now_seconds())
+        if delay <= 0 or self.tick_requested.is_set():
+            return
+        try:
+            await asyncio.wait_for(self.tick_requested.wait(), timeout=delay)
+        except TimeoutError:
+            pass
+
     async def list(self) -> List[AnyApplication]:
         applications = await self.client.list(AnyApplication.GVK)
         return [AnyApplication(app) for app in applications]
@@ -1,16 +1,16 @@
 from typing import Dict, List, Mapping, Optional, Type
 
-import copy
 from dataclasses import dataclass, field
 
 from application_client import models
 from loguru import logger
 
 from placement_controller.clients.k8s.client import NamespacedName
+from placement_controller.clients.placement.types import BidResponseOrError
 from placement_controller.core.application import AnyApplication
+from placement_controller.core.history import HistoryEntry, SchedulingHistory
 from placement_controller.core.scheduling_state import FSMOperation, SchedulingState
 from placement_controller.core.types import SchedulingStep
-from placement_controller.jobs.bid_action import BidResponseOrError
 from placement_controller.jobs.types import Action, ActionId, ActionResult
 from placement_controller.membership.types import PlacementZone
 from placement_controller.resources.trace_log import TraceLog
@@ -21,6 +21,12 @@ DEFAULT_MAX_ACTION_ATTEMPTS: int = 3
 
 @dataclass
 class SchedulingContext:
+    """
+    Scheduling state of an application.
+    Transitions share all unchanged values with the previous context, which must therefore be replaced
+    instead of mutated: only inprogress_actions is copied, as it is modified in place.
+    """
+
     name: NamespacedName
     seq_nr: int
     action_nr: int
@@ -42,8 +48,8 @@ class SchedulingContext:
     bid_responses: Optional[Mapping[str, BidResponseOrError]] = field(default=None)
     decision: Optional[List[PlacementZone]] = field(default=None)
 
-    # history tracking
-    previous: Optional["SchedulingContext"] = field(default=None)
+    # snapshots of the previous contexts
+    history: SchedulingHistory = field(default_factory=SchedulingHistory)
 
     @staticmethod
     def new(
@@ -53,6 +59,7 @@ class SchedulingContext:
         name: NamespacedName,
         current_zone: str,
         available_zones: List[PlacementZone],
+        history: Optional[SchedulingHistory] = None,
     ) -> "SchedulingContext":
         return SchedulingContext(
             name=name,
@@ -64,6 +71,7 @@ class SchedulingContext:
             current_zone=current_zone,
             available_zones=available_zones,
             application=application,
+            history=history or SchedulingHistory(),
         )
 
     def start_operation(self, operation: FSMOperation, timestamp: int) -> "SchedulingContext":
@@ -88,6 +96,7 @@ class SchedulingContext:
     ) -> "SchedulingContext":
         logger.info(f"{self.name.to_string()}: state={state}, msg='{msg}', ts={timestamp}")
         self.trace.log_state(msg or "", str(state))
+        self.history.append(self.snapshot())
         return SchedulingContext(
             name=self.name,
             seq_nr=self.seq_nr + 1,
@@ -95,17 +104,26 @@ class SchedulingContext:
             timestamp=timestamp,
             state=state,
             current_zone=self.current_zone,
-            available_zones=copy.deepcopy(self.available_zones),
+            available_zones=self.available_zones,
             retry_attempt=self.retry_attempt,
             msg=msg,
-            inprogress_actions=copy.deepcopy(self.inprogress_actions),
-            application=copy.deepcopy(application) if application else self.application,
-            application_spec=copy.deepcopy(self.application_spec),
-            bid_responses=copy.deepcopy(self.bid_responses),
-            decision=copy.deepcopy(self.decision),
+            inprogress_actions=dict(self.inprogress_actions),
+            application=application or self.application,
+            application_spec=self.application_spec,
+            bid_responses=self.bid_responses,
+            decision=self.decision,
             reason=self.reason,
             trace=self.trace,
-            previous=self,
+            history=self.history,
+        )
+
+    def snapshot(self) -> HistoryEntry:
+        return HistoryEntry(
+            seq_nr=self.seq_nr,
+            timestamp=self.timestamp,
+            state=str(self.state),
+            msg=self.msg,
+            running_jobs=tuple(type(action).__name__ for action in self.inprogress_actions.values()),
         )
 
     def update_timestamp(self, expires_at: int) -> "SchedulingContext":
@@ -178,8 +196,6 @@ class SchedulingContext:
         self.reason = None
         self.inprogress_actions = dict()
 
-        self.previous = None
-
     def is_attempts_exhausted(self) -> bool:
         return self.retry_attempt >= DEFAULT_MAX_ACTION_ATTEMPTS
 
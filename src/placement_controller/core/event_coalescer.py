@@ -0,0 +1,86 @@
+from typing import Dict, List
+
+from pydantic_settings import BaseSettings
+
+from placement_controller.clients.k8s.client import NamespacedName
+from placement_controller.clients.k8s.event import SNAPSHOT_EVENTS, EventType, KubeEvent, resource_version
+
+
+class EventCoalescingSettings(BaseSettings):
+    # time to collect further events after the first one of a batch
+    window_seconds: float = 0.1
+    # applications handled per batch, the rest is handled with the next batch
+    max_batch_size: int = 500
+
+
+class EventCoalescer:
+    """
+    Collects watch events between two batches and keeps only the latest event per application.
+    Events not newer than the latest version accepted for an application are dropped, a snapshot
+    supersedes all events collected before it. Snapshot events are passed on in order.
+    """
+
+    max_batch_size: int
+    snapshot: List[KubeEvent]
+    pending: Dict[NamespacedName, KubeEvent]
+    # malformed events, passed on to the event handler
+    invalid: List[KubeEvent]
+    versions: Dict[NamespacedName, int]
+    dropped: int
+
+    def __init__(self, settings: EventCoalescingSettings = EventCoalescingSettings()):
+        self.max_batch_size = max(settings.max_batch_size, 1)
+        self.snapshot = []
+        self.pending = dict()
+        self.invalid = []
+        self.versions = dict()
+        self.dropped = 0
+
+    def add(self, event: KubeEvent) -> None:
+        if event.event == EventType.SNAPSHOT_BEGIN:
+            self.dropped += len(self.pending)
+            self.pending = dict()
+            self.versions = dict()
+        if event.event in SNAPSHOT_EVENTS:
+            self.snapshot.append(event)
+            self.add_versions(event)
+            return
+        if not isinstance(event.object, dict):
+            self.invalid.append(event)
+            return
+
+        name = NamespacedName.get_name(event.object)
+        version = resource_version(event.object)
+        if version is not None:
+            if version <= self.versions.get(name, -1):
+                self.dropped += 1
+                return
+            self.versions[name] = version
+        if name in self.pending:
+            self.dropped += 1
+        # a replaced event keeps its position, so a busy application does not delay the others
+        self.pending[name] = event
+
+    def add_versions(self, snapshot: KubeEvent) -> None:
+        if isinstance(snapshot.object, list):
+            for object in snapshot.object:
+                version = resource_version(object)
+                if version is not None:
+                    self.versions[NamespacedName.get_name(object)] = version
+
+    def take_batch(self) -> List[KubeEvent]:
+        batch: List[KubeEvent] = []
+        batch.extend(self.snapshot)
+        self.snapshot = []
+        batch.extend(self.invalid)
+        self.invalid = []
+        for name in list(self.pending.keys())[: self.max_batch_size]:
+            event = self.pending.pop(name)
+            if event.event == EventType.DELETED:
+                # the watch delivers no older events after a delete, the version is not needed anymore
+                self.versions.pop(name, None)
+            batch.append(event)
+        return batch
+
+    def has_pending(self) -> bool:
+        return len(self.snapshot) > 0 or len(self.invalid) > 0 or len(self.pending) > 0
@@ -1,21 +1,23 @@
-from typing import List, Mapping
+from typing import List, Mapping, Optional
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from application_client import models
 
 from placement_controller.api.model import BidCriteria, BidRequestModel, ErrorResponse, Metric, NamespacedNameModel
 from placement_controller.clients.k8s.client import NamespacedName
+from placement_controller.clients.placement.types import BidResponseOrError
 from placement_controller.core.application import AnyApplication, GlobalState, PlacementStrategy
 from placement_controller.core.context import SchedulingContext
 from placement_controller.core.next_state_result import NextStateResult
 from placement_controller.core.scheduling_state import FSMOperation, ScaleDirection, SchedulingState
 from placement_controller.core.types import SchedulingStep
-from placement_controller.jobs.bid_action import BidAction, BidActionResult, BidResponseOrError, ZoneId
+from placement_controller.jobs.bid_action import BidAction, BidActionResult, BidCollectionSettings, ZoneId
 from placement_controller.jobs.decision_action import DecisionAction, DecisionActionResult
 from placement_controller.jobs.get_spec_action import GetSpecAction, GetSpecResult
 from placement_controller.jobs.placement_action import PlacementDecision, SetPlacementAction, SetPlacementActionResult
+from placement_controller.jobs.spec_cache import SpecCache
 from placement_controller.jobs.types import Action, ActionResult
 from placement_controller.membership.types import PlacementZone
 from placement_controller.resources.trace_log import TraceLogRow
@@ -25,22 +27,27 @@ from placement_controller.resources.trace_log import TraceLogRow
 class FSMOptions:
     reschedule_default_delay_seconds: int
     reschedule_failure_delay_seconds: int
+    bids: BidCollectionSettings = field(default_factory=BidCollectionSettings)
 
 
 class FSM:
     ctx: SchedulingContext
     options: FSMOptions
     timestamp: int
+    # specs fetched by previous operations, read only
+    spec_cache: Optional[SpecCache]
 
     def __init__(
         self,
         ctx: SchedulingContext,
         timestamp: int,
         options: FSMOptions,
+        spec_cache: Optional[SpecCache] = None,
     ):
         self.ctx = ctx
         self.timestamp = timestamp
         self.options = options
+        self.spec_cache = spec_cache
 
     def on_tick(self) -> NextStateResult:
         # unmanaged state should never expire, therefore we just ignore it
@@ -151,10 +158,21 @@ class FSM:
         return NextStateResult()
 
     def new_get_spec(self, application: AnyApplication) -> NextStateResult:
+        name = application.get_namespaced_name()
+        version = application.get_generation()
+        if self.spec_cache is not None and version is not None:
+            spec = self.spec_cache.get(name, version)
+            if spec is not None:
+                msg = "Application spec unchanged, using the cached spec."
+                self.ctx = self.ctx.to_next_with_app(self.ctx.state, application, self.timestamp, msg)
+                self.ctx.application_spec = spec
+                return self.new_bid_action(spec, name, "Starting bidding...")
 
         next_action: Action[ActionResult] = GetSpecAction(
-            application.get_namespaced_name(),
+            name,
             self.ctx.gen_action_id(),
+            self.direction(),
+            version,
         )  # type: ignore
 
         msg = "Getting application specification..."
@@ -198,7 +216,7 @@ class FSM:
             metrics=metrics,
         )
 
-        next_action: Action[ActionResult] = BidAction(operation, bid, name)  # type: ignore
+        next_action: Action[ActionResult] = BidAction(operation, bid, name, self.options.bids)  # type: ignore
         next_context = self.ctx.to_next(SchedulingStep.BID_COLLECTION, self.timestamp, msg).with_action(next_action)
 
         return NextStateResult(actions=[next_action], context=next_context)
@@ -273,7 +291,9 @@ class FSM:
             reason=self.ctx.reason or "reason is not set",
             trace=local_traces,
         )
-        next_action: Action[ActionResult] = SetPlacementAction(decision, name, self.ctx.gen_action_id())  # type: ignore
+        next_action: Action[ActionResult] = SetPlacementAction(
+            decision, name, self.ctx.gen_action_id(), self.direction()
+        )  # type: ignore
         next_context = self.ctx.to_next(SchedulingStep.SET_PLACEMENT, self.timestamp, msg).with_action(next_action)
         return NextStateResult(actions=[next_action], context=next_context)
 
@@ -296,6 +316,10 @@ class FSM:
             error: ErrorResponse = result.result
             return self.retry(f"Failure while receiving bids specification. {error.msg} ")
 
+    def direction(self) -> Optional[ScaleDirection]:
+        operation = self.ctx.state.operation
+        return operation.direction if operation else None
+
     def retry(self, msg: str) -> NextStateResult:
         if not self.ctx.is_attempts_exhausted():
             next_context = self.ctx.retry(self.timestamp, msg + "Retrying...")
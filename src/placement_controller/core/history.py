@@ -0,0 +1,36 @@
+from typing import Deque, List, Optional, Tuple
+
+from collections import deque
+from dataclasses import dataclass
+
+DEFAULT_HISTORY_DEPTH: int = 32
+
+
+@dataclass(frozen=True)
+class HistoryEntry:
+    seq_nr: int
+    timestamp: int
+    state: str
+    msg: Optional[str]
+    running_jobs: Tuple[str, ...]
+
+
+class SchedulingHistory:
+    """
+    Fixed capacity ring buffer of the latest scheduling context snapshots of an application.
+    It is shared by all contexts of the application, the oldest entries are dropped once it is full.
+    """
+
+    entries: Deque[HistoryEntry]
+
+    def __init__(self, depth: int = DEFAULT_HISTORY_DEPTH):
+        self.entries = deque(maxlen=max(depth, 0))
+
+    def append(self, entry: HistoryEntry) -> None:
+        self.entries.append(entry)
+
+    def latest_first(self) -> List[HistoryEntry]:
+        return list(reversed(self.entries))
+
+    def reset(self) -> None:
+        self.entries.clear()
@@ -1,4 +1,7 @@
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
+
+import heapq
+import sys
 
 from loguru import logger
 
@@ -7,55 +10,120 @@ from placement_controller.clients.k8s.client import NamespacedName
 from placement_controller.core.application import AnyApplication
 from placement_controller.core.context import SchedulingContext
 from placement_controller.core.fsm import FSM, FSMOptions
+from placement_controller.core.history import DEFAULT_HISTORY_DEPTH, SchedulingHistory
 from placement_controller.core.next_state_result import NextStateResult
 from placement_controller.core.scheduling_state import DEFAULT_FAILURE_DELAY_SECONDS, DEFAULT_RESCHEDULE_DELAY_SECONDS
+from placement_controller.jobs.bid_action import BidCollectionSettings
+from placement_controller.jobs.spec_cache import SpecCache
 from placement_controller.jobs.types import Action, ActionResult
 from placement_controller.membership.types import Membership, PlacementZone
-from placement_controller.resources.trace_log import TraceLog
+from placement_controller.resources.trace_log import TraceLog, TraceSettings
 from placement_controller.util.clock import Clock
 
+Deadline = int
+
 
 class SchedulingQueue:
+    """
+    Scheduling contexts of all applications.
+    Ticks only evaluate contexts whose deadline has passed. A context is due on the next tick after it changed,
+    otherwise once its state expires, since a tick cannot change an unchanged context before that.
+    """
+
     clock: Clock
     contexts: Dict[NamespacedName, SchedulingContext]
     zones: Set[PlacementZone]
     current_zone: str
     initialized: bool
+    # applications listed by the snapshot in progress
+    snapshot_names: Optional[Set[NamespacedName]]
+    # previous contexts kept per application
+    history_depth: int
+    trace_settings: TraceSettings
+    bid_settings: BidCollectionSettings
+    spec_cache: Optional[SpecCache]
 
-    def __init__(self, clock: Clock, current_zone: str):
+    # min-heap of (deadline, sequence, name); entries not matching the scheduled deadline are stale and skipped
+    deadlines: List[Tuple[Deadline, int, NamespacedName]]
+    scheduled: Dict[NamespacedName, Deadline]
+    sequence: int
+
+    def __init__(
+        self,
+        clock: Clock,
+        current_zone: str,
+        history_depth: int = DEFAULT_HISTORY_DEPTH,
+        trace_settings: Optional[TraceSettings] = None,
+        bid_settings: Optional[BidCollectionSettings] = None,
+        spec_cache: Optional[SpecCache] = None,
+    ):
         self.contexts = dict()
+        self.deadlines = []
+        self.scheduled = dict()
+        self.sequence = 0
         self.zones = set()
         self.clock = clock
         self.current_zone = current_zone
         self.initialized = False
+        self.snapshot_names = None
+        self.history_depth = history_depth
+        self.trace_settings = trace_settings or TraceSettings()
+        self.bid_settings = bid_settings or BidCollectionSettings()
+        self.spec_cache = spec_cache
+
+    def on_snapshot_begin(self) -> None:
+        self.snapshot_names = set()
 
     def load_state(self, applications: List[AnyApplication]) -> List[Action[ActionResult]]:
-        if self.initialized:
-            return []
+        """Loads a page of a snapshot, after the first snapshot only applications changed since are updated."""
         timestamp = self.clock.now_seconds()
         actions = []
         for application in applications:
             name = application.get_namespaced_name()
+            if self.snapshot_names is not None:
+                self.snapshot_names.add(name)
+            if self.initialized:
+                context = self.contexts.get(name)
+                if context is None or context.application.get_resource_version() != application.get_resource_version():
+                    actions.extend(self.on_application_update(application, timestamp))
+                continue
+
             context = self.get_or_create_context(name, timestamp, application)
             self.contexts[name] = context
 
             next_state = self.new_fsm(context, timestamp).on_update(application)
 
-            self.apply_next_state(name, next_state)
+            self.apply_next_state(name, next_state, timestamp)
 
             if next_state.actions:
                 actions.extend(next_state.actions)
+        return actions
 
+    def on_snapshot_end(self) -> List[Action[ActionResult]]:
+        """Completes a snapshot, contexts of applications missing in a re-listed snapshot are deleted."""
+        timestamp = self.clock.now_seconds()
+        actions = []
+        if self.initialized and self.snapshot_names is not None:
+            names = self.snapshot_names
+            for name in [name for name in self.contexts.keys() if name not in names]:
+                actions.extend(self.on_application_delete(self.contexts[name].application, timestamp))
+        self.snapshot_names = None
         self.initialized = True
         return actions
 
     def on_tick(self, timestamp: int) -> List[Action[ActionResult]]:
         actions = []
-        for name in self.contexts.keys():
-            context = self.contexts[name]
+        for name in self.pop_due(timestamp):
+            context = self.contexts.get(name)
+            if context is None:
+                continue
             next_state = self.new_fsm(context, timestamp).on_tick()
 
-            self.apply_next_state(name, next_state)
+            if next_state.context is None and not next_state.actions and not next_state.remove_and_drop_context:
+                self.schedule(name, self.expiry_deadline(context))
+                continue
+
+            self.apply_next_state(name, next_state, timestamp)
 
             if next_state.actions:
                 actions.extend(next_state.actions)
@@ -64,12 +132,14 @@ class SchedulingQueue:
 
     def on_membership_update(self, membership: Membership, timestamp: int) -> List[Action[ActionResult]]:
         self.zones = membership.zones
+        # contexts share the zone list
+        zones = list(self.zones)
 
         actions = []
         for name in self.contexts.keys():
             context = self.contexts[name]
-            next_state = self.new_fsm(context, timestamp).on_membership_change(list(self.zones))
-            self.apply_next_state(name, next_state)
+            next_state = self.new_fsm(context, timestamp).on_membership_change(zones)
+            self.apply_next_state(name, next_state, timestamp)
 
             if next_state.actions:
                 actions.extend(next_state.actions)
@@ -80,12 +150,14 @@ class SchedulingQueue:
         name = application.get_namespaced_name()
         context = self.get_or_create_context(name, timestamp, application)
         next_state = self.new_fsm(context, timestamp).on_update(application)
-        self.apply_next_state(name, next_state)
+        self.apply_next_state(name, next_state, timestamp)
         return next_state.actions
 
     def on_application_delete(self, application: AnyApplication, timestamp: int) -> List[Action[ActionResult]]:
         name = application.get_namespaced_name()
-        del self.contexts[name]
+        # an application added and deleted within one event batch has no context
+        self.contexts.pop(name, None)
+        self.scheduled.pop(name, None)
         return []
 
     def on_action_result(self, result: ActionResult, timestamp: int) -> List[Action[ActionResult]]:
@@ -93,7 +165,7 @@ class SchedulingQueue:
         context = self.get_context(name)
         if context:
             next_state = self.new_fsm(context, timestamp).on_action_result(result)
-            self.apply_next_state(name, next_state)
+            self.apply_next_state(name, next_state, timestamp)
             return next_state.actions
         else:
             logger.info(f"{name}: no context found while handling action result {type(result).__name__}. Ignoring.")
@@ -103,8 +175,9 @@ class SchedulingQueue:
         options = FSMOptions(
             reschedule_default_delay_seconds=DEFAULT_RESCHEDULE_DELAY_SECONDS,
             reschedule_failure_delay_seconds=DEFAULT_FAILURE_DELAY_SECONDS,
+            bids=self.bid_settings,
         )
-        return FSM(context, timestamp, options)
+        return FSM(context, timestamp, options, self.spec_cache)
 
     def get_or_create_context(
         self,
@@ -113,9 +186,15 @@ class SchedulingQueue:
         application: AnyApplication,
     ) -> SchedulingContext:
         if name not in self.contexts:
-            trace = TraceLog(self.current_zone, name, self.clock)
+            trace = TraceLog.from_settings(self.current_zone, name, self.clock, self.trace_settings)
             self.contexts[name] = SchedulingContext.new(
-                application, trace, timestamp, name, self.current_zone, list(self.zones)
+                application,
+                trace,
+                timestamp,
+                name,
+                self.current_zone,
+                list(self.zones),
+                SchedulingHistory(self.history_depth),
             )
 
         return self.contexts[name]
@@ -123,26 +202,64 @@ class SchedulingQueue:
     def get_context(self, name: NamespacedName) -> Optional[SchedulingContext]:
         return self.contexts.get(name)
 
-    def apply_next_state(self, name: NamespacedName, next_state: NextStateResult) -> None:
+    def apply_next_state(self, name: NamespacedName, next_state: NextStateResult, timestamp: int) -> None:
         if next_state.remove_and_drop_context:
             del self.contexts[name]
+            self.scheduled.pop(name, None)
         if next_state.context:
             self.contexts[name] = next_state.context
+        # the state machine may also change the context in place, therefore it is evaluated on the next tick
+        if name in self.contexts:
+            self.schedule(name, timestamp)
+
+    def expiry_deadline(self, context: SchedulingContext) -> Optional[Deadline]:
+        # expiry is checked with expires_at < now
+        expires_at = context.state.expires_at
+        return expires_at + 1 if expires_at < sys.maxsize else None
+
+    def schedule(self, name: NamespacedName, deadline: Optional[Deadline]) -> None:
+        if deadline is None:
+            self.scheduled.pop(name, None)
+            return
+        if self.scheduled.get(name) == deadline:
+            return
+        self.scheduled[name] = deadline
+        self.sequence += 1
+        heapq.heappush(self.deadlines, (deadline, self.sequence, name))
+        if len(self.deadlines) > 2 * len(self.scheduled) + 64:
+            self.deadlines = [(deadline, i, name) for i, (name, deadline) in enumerate(self.scheduled.items())]
+            heapq.heapify(self.deadlines)
+
+    def pop_due(self, timestamp: int) -> List[NamespacedName]:
+        due = []
+        while len(self.deadlines) > 0 and self.deadlines[0][0] <= timestamp:
+            deadline, _, name = heapq.heappop(self.deadlines)
+            if self.scheduled.get(name) == deadline:
+                del self.scheduled[name]
+                due.append(name)
+        return due
+
+    def next_deadline(self) -> Optional[Deadline]:
+        while len(self.deadlines) > 0:
+            deadline, _, name = self.deadlines[0]
+            if self.scheduled.get(name) == deadline:
+                return deadline
+            heapq.heappop(self.deadlines)
+        return None
 
     def get_scheduling_states(self) -> List[ApplicationState]:
         results = []
         for name, context in self.contexts.items():
-            history = []
-            ctx: Optional[SchedulingContext] = context
-            while ctx:
-                entry = SchedulingEntry(
-                    seq_nr=ctx.seq_nr,
-                    state=str(ctx.state),
-                    msg=ctx.msg,
-                    running_jobs=[type(action).__name__ for action in ctx.inprogress_actions.values()],
+            history = [
+                SchedulingEntry(
+                    seq_nr=snapshot.seq_nr,
+                    timestamp=snapshot.timestamp,
+                    state=snapshot.state,
+                    msg=snapshot.msg,
+                    running_jobs=list(snapshot.running_jobs),
                 )
-                history.append(entry)
-                ctx = ctx.previous
+                for snapshot in [context.snapshot()] + context.history.latest_first()
+            ]
 
             app_state = ApplicationState(
                 name=name.name,
@@ -0,0 +1,255 @@
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Set, Tuple
+
+import asyncio
+import bisect
+import hashlib
+import queue
+import threading
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from loguru import logger
+
+from placement_controller.api.model import ApplicationState
+from placement_controller.clients.k8s.client import KubeClient, NamespacedName
+from placement_controller.clients.k8s.event import EventType, KubeEvent, KubeObject
+from placement_controller.core.applications import Applications
+from placement_controller.jobs.types import ExecutorContext
+from placement_controller.membership.types import Membership
+from placement_controller.settings import PlacementSettings
+from placement_controller.util.clock import Clock
+
+ShardId = int
+
+DEFAULT_VIRTUAL_NODES: int = 64
+STATES_TIMEOUT_SECONDS: float = 5.0
+INBOX_POLL_SECONDS: float = 1.0
+SUPERVISE_INTERVAL_SECONDS: float = 1.0
+
+
+def stable_hash(key: str) -> int:
+    # the builtin hash is salted per process, shards need the same value in every process
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class ShardRing:
+    """
+    Consistent hash ring mapping applications to shards.
+    Every shard owns several virtual points of the ring, which evens out the share of each shard.
+    """
+
+    points: List[int]
+    shards: List[ShardId]
+
+    def __init__(self, shards: int, virtual_nodes: int = DEFAULT_VIRTUAL_NODES):
+        ring = sorted(
+            (stable_hash(f"shard-{shard}-{point}"), shard) for shard in range(shards) for point in range(virtual_nodes)
+        )
+        self.points = [point for point, _ in ring]
+        self.shards = [shard for _, shard in ring]
+
+    def shard_of(self, name: NamespacedName) -> ShardId:
+        index = bisect.bisect(self.points, stable_hash(name.to_string()))
+        return self.shards[index % len(self.shards)]
+
+
+class MessageQueue(Protocol):
+    def put(self, obj: Any) -> None: ...
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any: ...
+
+
+class ShardWorker(Protocol):
+    """Process running a shard, e.g. multiprocessing.Process."""
+
+    @property
+    def exitcode(self) -> Optional[int]: ...
+
+    def is_alive(self) -> bool: ...
+
+
+class ShardMessageType(StrEnum):
+    EVENT = "event"
+    MEMBERSHIP = "membership"
+    STATES = "states"
+
+
+@dataclass
+class ShardMessage:
+    type: ShardMessageType
+    event: Optional[KubeEvent] = field(default=None)
+    membership: Optional[Membership] = field(default=None)
+    request_id: int = field(default=0)
+
+
+class ShardDispatcher(Applications):
+    """
+    Routes application events to the shard owning the application and membership changes to all shards.
+    Scheduling runs in the shard workers, the dispatcher keeps the watches and the application api.
+    A worker that exits terminates the controller, the applications of its shard would not be scheduled.
+    """
+
+    ring: ShardRing
+    inboxes: List[MessageQueue]
+    outboxes: List[MessageQueue]
+    workers: Sequence[ShardWorker]
+    failed_shards: Set[ShardId]
+    states_lock: threading.Lock
+    request_id: int
+
+    def __init__(
+        self,
+        inboxes: List[MessageQueue],
+        outboxes: List[MessageQueue],
+        clock: Clock,
+        executor_context: ExecutorContext,
+        client: KubeClient,
+        is_terminated: asyncio.Event,
+        settings: PlacementSettings,
+        workers: Optional[Sequence[ShardWorker]] = None,
+    ):
+        super().__init__(clock, executor_context, client, is_terminated, settings)
+        self.ring = ShardRing(len(inboxes))
+        self.inboxes = inboxes
+        self.outboxes = outboxes
+        self.workers = workers or []
+        self.failed_shards = set()
+        self.states_lock = threading.Lock()
+        self.request_id = 0
+
+    async def run(self) -> None:
+        await asyncio.gather(self.run_kube_watch(), self.membership_watcher.start(), self.supervise())
+
+    async def supervise(self) -> None:
+        while not self.is_terminated.is_set():
+            self.check_workers()
+            try:
+                await asyncio.wait_for(self.is_terminated.wait(), timeout=SUPERVISE_INTERVAL_SECONDS)
+            except TimeoutError:
+                pass
+
+    def check_workers(self) -> None:
+        for shard, worker in enumerate(self.workers):
+            if shard in self.failed_shards or worker.is_alive():
+                continue
+            logger.error(f"Shard {shard}: worker exited with code {worker.exitcode}, terminating.")
+            self.failed_shards.add(shard)
+            self.is_terminated.set()
+
+    def shard_of(self, object: KubeObject) -> ShardId:
+        return self.ring.shard_of(NamespacedName.get_name(object))
+
+    async def handle_event(self, event: KubeEvent) -> None:
+        if event.event == EventType.SNAPSHOT_BEGIN or event.event == EventType.SNAPSHOT_END:
+            # every shard takes part in every snapshot
+            for shard in range(len(self.inboxes)):
+                self.send(shard, ShardMessage(ShardMessageType.EVENT, event))
+        elif event.event == EventType.SNAPSHOT:
+            if not isinstance(event.object, list):
+                logger.warning(f"Shard dispatcher: skipping {event.event} event. List expected.")
+                return
+            objects: Dict[ShardId, List[KubeObject]] = dict()
+            for object in event.object:
+                objects.setdefault(self.shard_of(object), []).append(object)
+            for shard, shard_objects in objects.items():
+                self.send(
+                    shard, ShardMessage(ShardMessageType.EVENT, KubeEvent(event.event, event.version, shard_objects))
+                )
+        else:
+            if not isinstance(event.object, dict):
+                logger.warning(f"Shard dispatcher: skipping {event.event} event. Dict expected.")
+                return
+            self.send(self.shard_of(event.object), ShardMessage(ShardMessageType.EVENT, event))
+
+    def on_membership_change(self, membership: Membership) -> None:
+        for shard in range(len(self.inboxes)):
+            self.send(shard, ShardMessage(ShardMessageType.MEMBERSHIP, membership=membership))
+
+    def send(self, shard: ShardId, message: ShardMessage) -> None:
+        # nobody reads the inbox of a failed shard
+        if shard not in self.failed_shards:
+            self.inboxes[shard].put(message)
+
+    def list_scheduling_state(self) -> List[ApplicationState]:
+        # called from the api thread pool, requests are serialized to match the replies
+        with self.states_lock:
+            self.request_id += 1
+            for shard in range(len(self.inboxes)):
+                self.send(shard, ShardMessage(ShardMessageType.STATES, request_id=self.request_id))
+            states = []
+            for shard, outbox in enumerate(self.outboxes):
+                if shard not in self.failed_shards:
+                    states.extend(self.receive_states(shard, outbox))
+            return states
+
+    def receive_states(self, shard: ShardId, outbox: MessageQueue) -> List[ApplicationState]:
+        while True:
+            try:
+                request_id, states = outbox.get(timeout=STATES_TIMEOUT_SECONDS)
+            except queue.Empty:
+                logger.warning(f"Shard {shard}: scheduling state is not available.")
+                return []
+            # replies to timed out requests are skipped
+            if request_id == self.request_id:
+                return states  # type: ignore
+
+
+class ShardApplications(Applications):
+    """Applications of one shard, fed by the dispatcher instead of the application and membership watches."""
+
+    shard: ShardId
+    inbox: MessageQueue
+    outbox: MessageQueue
+
+    def __init__(
+        self,
+        shard: ShardId,
+        inbox: MessageQueue,
+        outbox: MessageQueue,
+        clock: Clock,
+        executor_context: ExecutorContext,
+        client: KubeClient,
+        is_terminated: asyncio.Event,
+        settings: PlacementSettings,
+    ):
+        super().__init__(clock, executor_context, client, is_terminated, settings)
+        self.shard = shard
+        self.inbox = inbox
+        self.outbox = outbox
+
+    async def run(self) -> None:
+        self.initialized = True
+        await asyncio.gather(
+            self.run_inbox(),
+            self.run_result_listener(),
+            self.executor.run(),
+            self.ticker(),
+        )
+
+    async def run_inbox(self) -> None:
+        logger.info(f"Shard {self.shard} started.")
+        loop = asyncio.get_running_loop()
+        while not self.is_terminated.is_set():
+            message = await loop.run_in_executor(None, self.poll_inbox)
+            if message is None:
+                continue
+            try:
+                await self.handle_message(message)
+                self.tick_requested.set()
+            except Exception as e:
+                logger.error(f"Shard {self.shard}: error while handling message {message.type}: {e}")
+
+    def poll_inbox(self) -> Optional[ShardMessage]:
+        try:
+            return self.inbox.get(timeout=INBOX_POLL_SECONDS)  # type: ignore
+        except queue.Empty:
+            return None
+
+    async def handle_message(self, message: ShardMessage) -> None:
+        if message.type == ShardMessageType.EVENT and message.event is not None:
+            await self.handle_event(message.event)
+        elif message.type == ShardMessageType.MEMBERSHIP and message.membership is not None:
+            self.on_membership_change(message.membership)
+        elif message.type == ShardMessageType.STATES:
+            reply: Tuple[int, List[ApplicationState]] = (message.request_id, self.list_scheduling_state())
+            self.outbox.put(reply)
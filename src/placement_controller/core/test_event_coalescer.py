@@ -0,0 +1,98 @@
+from typing import Any, Dict, List
+
+import unittest
+
+from placement_controller.clients.k8s.event import EventType, KubeEvent
+from placement_controller.core.event_coalescer import EventCoalescer, EventCoalescingSettings
+from placement_controller.resource_fixture import ResourceTestFixture
+
+
+class EventCoalescerTest(unittest.TestCase, ResourceTestFixture):
+    coalescer: EventCoalescer
+
+    def setUp(self) -> None:
+        self.coalescer = EventCoalescer()
+
+    def make_event(self, name: str, version: int, event_type: EventType = EventType.MODIFIED) -> KubeEvent:
+        object = self.make_anyapp(name, 1)
+        object["metadata"]["resourceVersion"] = str(version)
+        return KubeEvent(event_type, version, object)
+
+    def describe(self, batch: List[KubeEvent]) -> List[Any]:
+        result: List[Any] = []
+        for event in batch:
+            if isinstance(event.object, list):
+                result.append((event.event, len(event.object)))
+            else:
+                object: Dict[str, Any] = event.object
+                result.append((event.event, object["metadata"]["name"], int(object["metadata"]["resourceVersion"])))
+        return result
+
+    def test_latest_event_per_application(self) -> None:
+        self.coalescer.add(self.make_event("app1", 1))
+        self.coalescer.add(self.make_event("app2", 2))
+        self.coalescer.add(self.make_event("app1", 3))
+        self.coalescer.add(self.make_event("app1", 4, EventType.DELETED))
+
+        self.assertEqual(
+            [(EventType.DELETED, "app1", 4), (EventType.MODIFIED, "app2", 2)],
+            self.describe(self.coalescer.take_batch()),
+        )
+        self.assertEqual(2, self.coalescer.dropped)
+        self.assertFalse(self.coalescer.has_pending())
+
+    def test_added_and_deleted_coalesced_to_delete(self) -> None:
+        self.coalescer.add(self.make_event("app1", 1, EventType.ADDED))
+        self.coalescer.add(self.make_event("app1", 2, EventType.DELETED))
+
+        self.assertEqual([(EventType.DELETED, "app1", 2)], self.describe(self.coalescer.take_batch()))
+
+    def test_outdated_events_dropped(self) -> None:
+        self.coalescer.add(self.make_event("app1", 5))
+        self.coalescer.take_batch()
+
+        self.coalescer.add(self.make_event("app1", 5))
+        self.coalescer.add(self.make_event("app1", 4))
+
+        self.assertEqual([], self.coalescer.take_batch())
+        self.assertEqual(2, self.coalescer.dropped)
+
+    def test_versions_of_deleted_applications_dropped(self) -> None:
+        self.coalescer.add(self.make_event("app1", 1))
+        self.coalescer.add(self.make_event("app2", 2))
+        self.coalescer.add(self.make_event("app1", 3, EventType.DELETED))
+
+        self.assertEqual(
+            [(EventType.DELETED, "app1", 3), (EventType.MODIFIED, "app2", 2)],
+            self.describe(self.coalescer.take_batch()),
+        )
+        self.assertEqual(["app2"], [name.name for name in self.coalescer.versions])
+
+    def test_snapshot_supersedes_collected_events(self) -> None:
+        self.coalescer.add(self.make_event("app1", 1))
+        self.coalescer.add(KubeEvent(EventType.SNAPSHOT_BEGIN, 0, []))
+        self.coalescer.add(KubeEvent(EventType.SNAPSHOT, 3, [self.make_event("app1", 3).object]))  # type: ignore
+        self.coalescer.add(KubeEvent(EventType.SNAPSHOT, 3, [self.make_event("app2", 2).object]))  # type: ignore
+        self.coalescer.add(KubeEvent(EventType.SNAPSHOT_END, 3, []))
+        self.coalescer.add(self.make_event("app1", 2))
+        self.coalescer.add(self.make_event("app2", 6))
+
+        self.assertEqual(
+            [
+                (EventType.SNAPSHOT_BEGIN, 0),
+                (EventType.SNAPSHOT, 1),
+                (EventType.SNAPSHOT, 1),
+                (EventType.SNAPSHOT_END, 0),
+                (EventType.MODIFIED, "app2", 6),
+            ],
+            self.describe(self.coalescer.take_batch()),
+        )
+
+    def test_batch_size_capped(self) -> None:
+        self.coalescer = EventCoalescer(EventCoalescingSettings(max_batch_size=2))
+        for i in range(3):
+            self.coalescer.add(self.make_event(f"app{i}", i + 1))
+
+        self.assertEqual(["app0", "app1"], [name for _, name, _ in self.describe(self.coalescer.take_batch())])
+        self.assertTrue(self.coalescer.has_pending())
+        self.assertEqual(["app2"], [name for _, name, _ in self.describe(self.coalescer.take_batch())])
@@ -6,6 +6,9 @@ from placement_controller.core.fsm import FSM
 from placement_controller.core.scheduling_state import FSMOperation, ScaleDirection, SchedulingState
 from placement_controller.core.test_fsm_base import FSMTestBase
 from placement_controller.core.types import SchedulingStep
+from placement_controller.jobs.bid_action import BidAction
+from placement_controller.jobs.get_spec_action import GetSpecAction
+from placement_controller.jobs.spec_cache import SpecCache
 from placement_controller.membership.types import PlacementZone
 
 
@@ -284,3 +287,38 @@ class FSMScaleTest(FSMTestBase):
         result = FSM(context, self.now, self.options).on_tick()
         self.assertIsNone(result.context)
         self.assertEqual(result.actions, [])
+
+    def test_optimize_with_cached_spec(self) -> None:
+        anyapp = self.make_anyapp(self.name.name, 1) | self.make_anyapp_status("Placement", "zone1", ["zone1"])
+        anyapp["metadata"]["generation"] = 3
+        self.application = AnyApplication(anyapp)
+        spec_cache = SpecCache()
+        spec_cache.put(self.name, 3, self.spec)
+
+        context = SchedulingContext.new(
+            self.application,
+            self.trace,
+            self.now,
+            self.name,
+            "zone1",
+            [PlacementZone(id="zone1"), PlacementZone(id="zone2")],
+        )
+        context.state = SchedulingState(SchedulingStep.PENDING, 0, None)
+
+        result = FSM(context, self.now + 1, self.options, spec_cache).on_tick()
+
+        if not result.context:
+            raise self.fail("context expected")
+        self.assertEqual(result.context.state.step, SchedulingStep.BID_COLLECTION)
+        self.assertEqual(result.context.application_spec, self.spec)
+        self.assertIsInstance(result.actions[0], BidAction)
+
+        # a new generation fetches the spec again
+        anyapp["metadata"]["generation"] = 4
+        context.application = AnyApplication(anyapp)
+
+        result = FSM(context, self.now + 1, self.options, spec_cache).on_tick()
+
+        get_spec = result.actions[0]
+        assert isinstance(get_spec, GetSpecAction)
+        self.assertEqual(get_spec.version, 4)
@@ -1,20 +1,131 @@
+from typing import List
+
 import unittest
 
 from placement_controller.clients.k8s.client import NamespacedName
+from placement_controller.core.application import AnyApplication
 from placement_controller.core.scheduling_queue import SchedulingQueue
+from placement_controller.core.types import SchedulingStep
+from placement_controller.jobs.get_spec_action import GetSpecAction
+from placement_controller.jobs.types import Action, ActionResult
+from placement_controller.membership.types import Membership, PlacementZone
+from placement_controller.resource_fixture import ResourceTestFixture
 from placement_controller.util.mock_clock import MockClock
 
 
-class SchedulingQueueTest(unittest.TestCase):
+class SchedulingQueueTest(unittest.TestCase, ResourceTestFixture):
     clock: MockClock
     queue: SchedulingQueue
     name: NamespacedName
+    application: AnyApplication
 
     def setUp(self) -> None:
-        self.name = NamespacedName(name="test", namespace="testns")
+        self.name = NamespacedName(name="test", namespace="test")
         self.clock = MockClock()
         self.queue = SchedulingQueue(self.clock, "zone1")
+        self.queue.on_membership_update(Membership({PlacementZone(id="zone1")}), 0)
+        self.application = AnyApplication(
+            self.make_anyapp(self.name.name, 1) | self.make_anyapp_status("Placement", "zone1", ["zone1"])
+        )
+
+    def test_context_due_until_unchanged(self) -> None:
+        application = AnyApplication(
+            self.make_anyapp(self.name.name, 1) | self.make_anyapp_status("Placement", "zone1", [])
+        )
+        actions = self.queue.on_application_update(application, 0)
+        context = self.queue.get_context(self.name)
+        assert context is not None
+        self.assertIsInstance(actions[0], GetSpecAction)
+        self.assertEqual(SchedulingStep.FETCH_APPLICATION_SPEC, context.state.step)
+        self.assertEqual(0, self.queue.next_deadline())
+
+        self.assertEqual([], self.queue.on_tick(0))
+
+        expiry_deadline = context.state.expires_at + 1
+        self.assertEqual(expiry_deadline, self.queue.next_deadline())
+        self.assertEqual([], self.queue.on_tick(expiry_deadline - 1))
+
+        # the expired step is retried and the changed context is due on the next tick
+        self.assertEqual(actions, self.queue.on_tick(expiry_deadline))
+        self.assertEqual(expiry_deadline, self.queue.next_deadline())
+
+    def test_deleted_context_is_not_scheduled(self) -> None:
+        self.queue.on_application_update(self.application, 0)
+        self.queue.on_application_delete(self.application, 0)
+
+        self.assertIsNone(self.queue.next_deadline())
+        self.assertEqual([], self.queue.on_tick(0))
+
+    def test_delete_without_context(self) -> None:
+        self.assertEqual([], self.queue.on_application_delete(self.application, 0))
+
+        self.assertIsNone(self.queue.get_context(self.name))
+        self.assertIsNone(self.queue.next_deadline())
+
+    def test_unmanaged_context_has_no_deadline(self) -> None:
+        application = AnyApplication(
+            self.make_anyapp(self.name.name, 1) | self.make_anyapp_status("Placement", "zone2", ["zone1"])
+        )
+        self.queue.on_application_update(application, 0)
+        self.queue.on_tick(0)
+
+        self.assertIsNone(self.queue.next_deadline())
+
+    def test_scheduling_states_history(self) -> None:
+        application = AnyApplication(
+            self.make_anyapp(self.name.name, 1) | self.make_anyapp_status("Placement", "zone1", [])
+        )
+        self.queue.on_application_update(application, 0)
+        context = self.queue.get_context(self.name)
+        assert context is not None
+
+        states = self.queue.get_scheduling_states()
+
+        self.assertEqual(1, len(states))
+        history = states[0].history
+        self.assertEqual(list(range(context.seq_nr, -1, -1)), [entry.seq_nr for entry in history])
+        self.assertEqual(["GetSpecAction"], history[0].running_jobs)
+        self.assertEqual(context.msg, history[0].msg)
+        self.assertEqual([], history[1].running_jobs)
+        # transitions share unchanged values instead of copying them
+        self.assertIs(application, context.application)
+
+    def test_scheduling_history_depth(self) -> None:
+        self.queue = SchedulingQueue(self.clock, "zone1", history_depth=1)
+        self.queue.on_membership_update(Membership({PlacementZone(id="zone1")}), 0)
+        application = AnyApplication(
+            self.make_anyapp(self.name.name, 1) | self.make_anyapp_status("Placement", "zone1", [])
+        )
+        self.queue.on_application_update(application, 0)
+        context = self.queue.get_context(self.name)
+        assert context is not None
+        self.assertGreater(context.seq_nr, 1)
+
+        history = self.queue.get_scheduling_states()[0].history
+
+        self.assertEqual([context.seq_nr, context.seq_nr - 1], [entry.seq_nr for entry in history])
+
+    def load_snapshot(self, applications: List[AnyApplication]) -> List[Action[ActionResult]]:
+        self.queue.on_snapshot_begin()
+        actions = self.queue.load_state(applications)
+        return actions + self.queue.on_snapshot_end()
+
+    def test_snapshot_reconciled(self) -> None:
+        other = AnyApplication(self.make_anyapp("other", 1) | self.make_anyapp_status("Placement", "zone1", ["zone1"]))
+        self.application.object["metadata"]["resourceVersion"] = "1"
+        self.load_snapshot([self.application, other])
+        context = self.queue.get_context(self.name)
+
+        # unchanged applications keep their context, missing ones are deleted
+        self.load_snapshot([self.application])
+
+        self.assertIs(context, self.queue.get_context(self.name))
+        self.assertIsNone(self.queue.get_context(other.get_namespaced_name()))
+
+        changed = AnyApplication(
+            self.make_anyapp(self.name.name, 1) | self.make_anyapp_status("Placement", "zone1", [])
+        )
+        changed.object["metadata"]["resourceVersion"] = "2"
 
-    def test_schedule(self) -> None:
-        # TODO tests
-        pass
+        # the changed application has no zone yet
+        self.assertIsInstance(self.load_snapshot([changed])[0], GetSpecAction)
@@ -0,0 +1,183 @@
+from typing import Any, Dict, List, Optional
+
+import queue
+from collections import Counter
+
+from application_client.client import Client
+
+from placement_controller.async_fixture import AsyncTestFixture
+from placement_controller.clients.k8s.client import NamespacedName
+from placement_controller.clients.k8s.event import EventType, KubeEvent
+from placement_controller.clients.k8s.fake_client import FakeClient
+from placement_controller.clients.placement.types import PlacementClient
+from placement_controller.core.shards import (
+    ShardApplications,
+    ShardDispatcher,
+    ShardMessage,
+    ShardMessageType,
+    ShardRing,
+)
+from placement_controller.jobs.types import ExecutorContext
+from placement_controller.membership.types import Membership, PlacementZone
+from placement_controller.resource_fixture import ResourceTestFixture
+from placement_controller.settings import PlacementSettings
+from placement_controller.store.fake_decision_store import FakeDecisionStore
+from placement_controller.util.mock_clock import MockClock
+from placement_controller.zone.zone_api_factory import ZoneApiFactoryImpl
+
+
+class FakeShardWorker:
+    alive: bool
+    exitcode: Optional[int]
+
+    def __init__(self) -> None:
+        self.alive = True
+        self.exitcode = None
+
+    def is_alive(self) -> bool:
+        return self.alive
+
+
+class ShardsTest(AsyncTestFixture, ResourceTestFixture):
+    clock: MockClock
+    client: FakeClient
+    settings: PlacementSettings
+    executor_context: ExecutorContext
+    inboxes: List["queue.Queue[Any]"]
+    outboxes: List["queue.Queue[Any]"]
+    dispatcher: ShardDispatcher
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.clock = MockClock()
+        self.client = FakeClient()
+        self.settings = PlacementSettings(
+            namespace="test",
+            available_zones=["zone1"],
+            current_zone="zone1",
+            application_controller_endpoint="http://127.0.0.1/",
+            static_controller_endpoints={},
+            shards=3,
+        )
+        self.executor_context = ExecutorContext(
+            application_controller_client=Client(base_url="http://127.0.0.1/"),
+            zone_api_factory=ZoneApiFactoryImpl(self.settings, PlacementClient()),
+            kube_client=self.client,
+            clock=self.clock,
+            decision_store=FakeDecisionStore(),
+        )
+        self.inboxes = [queue.Queue() for _ in range(self.settings.shards)]
+        self.outboxes = [queue.Queue() for _ in range(self.settings.shards)]
+        self.dispatcher = ShardDispatcher(
+            self.inboxes,  # type: ignore
+            self.outboxes,  # type: ignore
+            self.clock,
+            self.executor_context,
+            self.client,
+            self.terminated,
+            self.settings,
+        )
+
+    def make_shard(self, shard: int) -> ShardApplications:
+        return ShardApplications(
+            shard,
+            self.inboxes[shard],
+            self.outboxes[shard],
+            self.clock,
+            self.executor_context,
+            self.client,
+            self.terminated,
+            self.settings,
+        )
+
+    def received(self, shard: int) -> List[ShardMessage]:
+        messages = []
+        while not self.inboxes[shard].empty():
+            messages.append(self.inboxes[shard].get_nowait())
+        return messages
+
+    def test_ring_stable_and_balanced(self) -> None:
+        ring = ShardRing(4)
+        names = [NamespacedName(name=f"app{i}", namespace="test") for i in range(1000)]
+
+        shards = [ring.shard_of(name) for name in names]
+
+        self.assertEqual(shards, [ShardRing(4).shard_of(name) for name in names])
+        for count in Counter(shards).values():
+            self.assertGreater(count, 150)
+        # a new shard takes applications from the others only
+        grown = ShardRing(5)
+        for name, shard in zip(names, shards):
+            self.assertIn(grown.shard_of(name), (shard, 4))
+
+    def test_snapshot_split_and_events_routed(self) -> None:
+        apps: List[Dict[str, Any]] = [self.make_anyapp(f"app{i}", 1) for i in range(20)]
+        events = [
+            KubeEvent(EventType.SNAPSHOT_BEGIN, 0, []),
+            KubeEvent(EventType.SNAPSHOT, 1, apps),
+            KubeEvent(EventType.SNAPSHOT_END, 1, []),
+            KubeEvent(EventType.MODIFIED, 2, apps[0]),
+        ]
+        for event in events:
+            self.loop.run_until_complete(self.dispatcher.handle_event(event))
+        self.dispatcher.on_membership_change(Membership({PlacementZone(id="zone1")}))
+
+        owner = self.dispatcher.shard_of(apps[0])
+        names = set()
+        for shard in range(self.settings.shards):
+            messages = self.received(shard)
+            snapshot = messages[1].event
+            assert snapshot is not None and isinstance(snapshot.object, list)
+            for app in snapshot.object:
+                self.assertEqual(shard, self.dispatcher.shard_of(app))
+                names.add(app["metadata"]["name"])
+            event_types = [message.event.event if message.event else message.type for message in messages]
+            expected = [EventType.SNAPSHOT_BEGIN, EventType.SNAPSHOT, EventType.SNAPSHOT_END]
+            if shard == owner:
+                expected.append(EventType.MODIFIED)
+            self.assertEqual(expected + [ShardMessageType.MEMBERSHIP], event_types)
+        self.assertEqual(20, len(names))
+
+    def test_scheduling_states_collected(self) -> None:
+        app = self.make_anyapp("app", 1) | self.make_anyapp_status("Placement", "zone1", ["zone1"])
+        owner = self.dispatcher.shard_of(app)
+        shards = [self.make_shard(shard) for shard in range(self.settings.shards)]
+        for event in [
+            KubeEvent(EventType.SNAPSHOT_BEGIN, 0, []),
+            KubeEvent(EventType.SNAPSHOT, 1, [app]),
+            KubeEvent(EventType.SNAPSHOT_END, 1, []),
+        ]:
+            self.loop.run_until_complete(shards[owner].handle_message(ShardMessage(ShardMessageType.EVENT, event)))
+        self.loop.run_until_complete(shards[owner].handle_message(ShardMessage(ShardMessageType.STATES, request_id=1)))
+        for shard in range(self.settings.shards):
+            # a late reply to an earlier request is skipped
+            self.outboxes[shard].put((0, []))
+            if shard != owner:
+                self.outboxes[shard].put((1, []))
+
+        states = self.dispatcher.list_scheduling_state()
+
+        self.assertEqual(["app"], [state.name for state in states])
+
+    def test_failed_worker_terminates(self) -> None:
+        workers = [FakeShardWorker() for _ in range(self.settings.shards)]
+        self.dispatcher.workers = workers
+        app = self.make_anyapp("app", 1)
+        owner = self.dispatcher.shard_of(app)
+
+        self.dispatcher.check_workers()
+        self.assertFalse(self.terminated.is_set())
+
+        workers[owner].alive = False
+        workers[owner].exitcode = -9
+        self.dispatcher.check_workers()
+
+        self.assertTrue(self.terminated.is_set())
+        self.assertEqual({owner}, self.dispatcher.failed_shards)
+        # events of the failed shard are dropped, its scheduling state is not waited for
+        self.loop.run_until_complete(self.dispatcher.handle_event(KubeEvent(EventType.MODIFIED, 2, app)))
+        self.assertEqual([], self.received(owner))
+        for shard in range(self.settings.shards):
+            if shard != owner:
+                self.outboxes[shard].put((1, []))
+        self.assertEqual([], self.dispatcher.list_scheduling_state())
@@ -0,0 +1,138 @@
+from typing import Callable, Dict, List, Optional, Tuple
+
+import asyncio
+import heapq
+from dataclasses import dataclass, field
+
+from pydantic_settings import BaseSettings
+
+from placement_controller.clients.k8s.client import NamespacedName
+from placement_controller.core.scheduling_state import ScaleDirection
+from placement_controller.jobs.types import Action, ActionResult
+from placement_controller.util.clock import Clock
+
+ActionType = str
+
+DIRECTION_PRIORITY: Dict[Optional[ScaleDirection], int] = {
+    ScaleDirection.UPSCALE: 0,
+    ScaleDirection.DOWNSCALE: 1,
+    ScaleDirection.NONE: 2,
+    None: 2,
+}
+
+
+class ActionQueueSettings(BaseSettings):
+    # lower runs first; actions finishing an operation go before actions starting one
+    action_type_priority: Dict[ActionType, int] = {
+        "SetPlacementAction": 0,
+        "DecisionAction": 1,
+        "BidAction": 2,
+        "GetSpecAction": 3,
+    }
+    # waiting time that raises an action by one priority level
+    aging_seconds: float = 10.0
+    # delay added to each further queued action of a namespace with the same direction
+    namespace_share_seconds: float = 1.0
+
+
+def action_type(action: Action[ActionResult]) -> ActionType:
+    return type(action).__name__
+
+
+@dataclass(order=True)
+class QueuedAction:
+    # priority level in aging units plus the namespace fair share time, lower runs first
+    key: float
+    sequence: int
+    action: Action[ActionResult] = field(compare=False)
+    removed: bool = field(default=False, compare=False)
+
+
+class ActionQueue:
+    """
+    Priority queue of actions waiting for execution.
+    Actions are ordered by the direction of their operation (upscale, downscale, optimize), then by action type.
+    Waiting raises the priority of an action by one level every aging_seconds, so nothing starves,
+    and namespaces with many queued actions of the same direction are interleaved with the others.
+
+    Pending actions are kept in one heap per action type, which lets the executor skip types at their
+    concurrency limit. A new action replaces the pending action of the same application and type.
+    """
+
+    settings: ActionQueueSettings
+    clock: Clock
+    heaps: Dict[ActionType, List[QueuedAction]]
+    pending: Dict[Tuple[NamespacedName, ActionType], QueuedAction]
+    # fair share time of the next action per namespace and direction level
+    namespace_times: Dict[Tuple[str, int], float]
+    sequence: int
+    changed: asyncio.Event
+
+    def __init__(self, clock: Clock, settings: Optional[ActionQueueSettings] = None):
+        self.settings = settings or ActionQueueSettings()
+        self.clock = clock
+        self.heaps = dict()
+        self.pending = dict()
+        self.namespace_times = dict()
+        self.sequence = 0
+        self.changed = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def priority_level(self, action: Action[ActionResult]) -> int:
+        type_priority = self.settings.action_type_priority
+        type_levels = max(type_priority.values(), default=0) + 2
+        type_level = type_priority.get(action_type(action), type_levels - 1)
+        return DIRECTION_PRIORITY[action.get_direction()] * type_levels + type_level
+
+    def put_nowait(self, action: Action[ActionResult]) -> None:
+        now = self.clock.now_millis() / 1000
+        direction_level = DIRECTION_PRIORITY[action.get_direction()]
+        share_key = (action.get_application_name().namespace, direction_level)
+        share_time = max(now, self.namespace_times.get(share_key, now))
+        self.namespace_times[share_key] = share_time + self.settings.namespace_share_seconds
+
+        kind = action_type(action)
+        previous = self.pending.get((action.get_application_name(), kind))
+        if previous is not None:
+            previous.removed = True
+
+        self.sequence += 1
+        entry = QueuedAction(
+            key=self.priority_level(action) * self.settings.aging_seconds + share_time,
+            sequence=self.sequence,
+            action=action,
+        )
+        self.pending[(action.get_application_name(), kind)] = entry
+        heapq.heappush(self.heaps.setdefault(kind, []), entry)
+        self.notify()
+
+    def get_nowait(self, is_ready: Callable[[ActionType], bool] = lambda _: True) -> Optional[Action[ActionResult]]:
+        best: Optional[List[QueuedAction]] = None
+        for kind, heap in self.heaps.items():
+            while len(heap) > 0 and heap[0].removed:
+                heapq.heappop(heap)
+            if len(heap) > 0 and is_ready(kind) and (best is None or heap[0] < best[0]):
+                best = heap
+        if best is None:
+            return None
+
+        entry = heapq.heappop(best)
+        del self.pending[(entry.action.get_application_name(), action_type(entry.action))]
+        if len(self.pending) == 0:
+            self.heaps.clear()
+            self.namespace_times.clear()
+        return entry.action
+
+    async def get(self, is_ready: Callable[[ActionType], bool] = lambda _: True) -> Action[ActionResult]:
+        while True:
+            action = self.get_nowait(is_ready)
+            if action is not None:
+                return action
+            self.changed.clear()
+            await self.changed.wait()
+
+    def notify(self) -> None:
+        """Wakes up waiting consumers, e.g. once an action type is ready again."""
+        self.changed.set()
@@ -1,23 +1,34 @@
-from typing import Mapping, Set, Union
+from typing import Dict, List, Mapping, Optional, Set, Tuple
 
 import asyncio
 
 from loguru import logger
+from pydantic_settings import BaseSettings
 
 from placement_controller.api.model import (
     BidRequestModel,
     BidResponseModel,
+    BidStatus,
     ErrorResponse,
 )
 from placement_controller.clients.k8s.client import NamespacedName
-from placement_controller.clients.placement.types import PlacementClient
+from placement_controller.clients.placement.types import BidResponseOrError, PlacementClient
 from placement_controller.core.scheduling_state import FSMOperation, ScaleDirection
 from placement_controller.jobs.types import Action, ActionId, ActionResult, ExecutorContext
 
-BidResponseOrError = Union[BidResponseModel, ErrorResponse]
 ZoneId = str
 
 
+class BidCollectionSettings(BaseSettings):
+    # decide on the bids received so far once enough are accepted or the deadline passes,
+    # otherwise the decision waits for every zone
+    early_decision: bool = True
+    # accepted bids collected on top of the zones an upscale needs, so the decision still has a choice
+    quorum_margin: int = 1
+    # bids not received by then are cancelled
+    deadline_seconds: float = 5.0
+
+
 class BidActionResult(ActionResult):
     response: Mapping[ZoneId, BidResponseOrError]
 
@@ -32,28 +43,42 @@ class BidActionResult(ActionResult):
 class BidAction(Action[BidActionResult]):
     operation: FSMOperation
     request: BidRequestModel
+    settings: BidCollectionSettings
 
     def __init__(
         self,
         operation: FSMOperation,
         request: BidRequestModel,
         name: NamespacedName,
+        settings: BidCollectionSettings = BidCollectionSettings(),
     ):
-        super().__init__(name, request.id)
+        super().__init__(name, request.id, operation.direction)
         self.request = request
         self.operation = operation
+        self.settings = settings
 
     async def run(self, context: ExecutorContext) -> BidActionResult:
 
         bid_zones = self.determine_bid_zones()
+        unavailable_zones = {zone for zone in bid_zones if not context.zone_api_factory.is_available(zone)}
+        if unavailable_zones:
+            logger.info(f"{self.name.to_string()}: skipping zones with open circuit: {unavailable_zones}")
+            bid_zones = bid_zones - unavailable_zones
 
         logger.info(f"{self.name.to_string()}: sending bid request to zones: {bid_zones}")
 
         zone_to_client = [(zone, context.zone_api_factory.create(zone)) for zone in bid_zones]
-        queries = [self.query_one(client) for (_, client) in zone_to_client]
-        responses = await asyncio.gather(*queries)
-
-        zone_to_response = {zone: response for ((zone, _), response) in zip(zone_to_client, responses)}
+        zone_to_response: Dict[ZoneId, BidResponseOrError]
+        if self.settings.early_decision:
+            zone_to_response = await self.collect(zone_to_client)
+        else:
+            queries = [self.query_one(client) for (_, client) in zone_to_client]
+            responses = await asyncio.gather(*queries)
+            zone_to_response = {zone: response for ((zone, _), response) in zip(zone_to_client, responses)}
+        for zone in unavailable_zones:
+            zone_to_response[zone] = ErrorResponse(
+                status=503, code="ZONE_UNAVAILABLE", msg="Bid skipped, the circuit of the zone is open."
+            )
 
         logger.info(f"{self.name.to_string()}: received responses {len(zone_to_response)}")
         for zone, response in zone_to_response.items():
@@ -61,6 +86,51 @@ class BidAction(Action[BidActionResult]):
 
         return BidActionResult(zone_to_response, self.name, self.action_id)
 
+    async def collect(self, zone_to_client: List[Tuple[ZoneId, PlacementClient]]) -> Dict[ZoneId, BidResponseOrError]:
+        """
+        Collects responses as they arrive until the quorum of accepted bids is reached or the deadline passes.
+        Bids still in flight are cancelled and reported as errors.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.settings.deadline_seconds
+        quorum = self.determine_quorum()
+        tasks = {loop.create_task(self.query_one(client)): zone for zone, client in zone_to_client}
+        pending = set(tasks.keys())
+        zone_to_response: Dict[ZoneId, BidResponseOrError] = dict()
+        accepted = 0
+        try:
+            while pending and (quorum is None or accepted < quorum):
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    response = task.result()
+                    zone_to_response[tasks[task]] = response
+                    if isinstance(response, BidResponseModel) and response.status == BidStatus.accepted:
+                        accepted += 1
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if pending:
+            reason = "quorum reached" if quorum is not None and accepted >= quorum else "deadline passed"
+            zones = sorted(tasks[task] for task in pending)
+            logger.info(f"{self.name.to_string()}: {reason}, bids to zones {zones} cancelled")
+            for zone in zones:
+                zone_to_response[zone] = ErrorResponse(
+                    status=504, code="BID_CANCELLED", msg=f"Bid cancelled, {reason}."
+                )
+        return zone_to_response
+
+    def determine_quorum(self) -> Optional[int]:
+        """Accepted bids an upscale decision needs, downscale and optimization compare all zones."""
+        if self.operation.direction != ScaleDirection.UPSCALE:
+            return None
+        current_zones = self.operation.current_zones & self.operation.available_zones
+        upscale_replica = self.operation.required_replica - len(current_zones)
+        return max(upscale_replica, 1) + max(self.settings.quorum_margin, 0)
+
     def determine_bid_zones(self) -> Set[str]:
         if self.operation.direction == ScaleDirection.UPSCALE:
             return self.operation.available_zones - self.operation.current_zones
@@ -6,8 +6,9 @@ from loguru import logger
 
 from placement_controller.api.model import BidResponseModel, BidStatus, ErrorResponse, Metric
 from placement_controller.clients.k8s.client import NamespacedName
+from placement_controller.clients.placement.types import BidResponseOrError
 from placement_controller.core.scheduling_state import FSMOperation, ScaleDirection
-from placement_controller.jobs.bid_action import BidResponseOrError, ZoneId
+from placement_controller.jobs.bid_action import ZoneId
 from placement_controller.jobs.types import Action, ActionId, ActionResult, ExecutorContext
 from placement_controller.membership.types import PlacementZone
 from placement_controller.resources.trace_log import TraceLogRow
@@ -44,7 +45,7 @@ class DecisionAction(Action[DecisionActionResult]):
         name: NamespacedName,
         action_id: ActionId,
     ):
-        super().__init__(name, action_id)
+        super().__init__(name, action_id, operation.direction)
         self.bids = bids
         self.operation = operation
         self.criteria_priority = [Metric.cost, Metric.energy]
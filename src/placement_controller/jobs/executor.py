@@ -1,13 +1,23 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import asyncio
 from dataclasses import dataclass
 
 from loguru import logger
+from pydantic_settings import BaseSettings
 
 from placement_controller.clients.k8s.client import NamespacedName
 from placement_controller.core.async_queue import AsyncQueue
-from placement_controller.jobs.types import Action, ActionResult, ExecutorContext
+from placement_controller.jobs.action_queue import ActionQueue, ActionQueueSettings, ActionType, action_type
+from placement_controller.jobs.types import Action, ActionId, ActionResult, ExecutorContext
+
+
+class ExecutorSettings(BaseSettings):
+    # actions running at the same time
+    max_workers: int = 32
+    # limits per action class name on top of max_workers
+    action_concurrency: Dict[ActionType, int] = {"BidAction": 8}
+    queue: ActionQueueSettings = ActionQueueSettings()
 
 
 @dataclass
@@ -16,42 +26,128 @@ class InProgressAction:
     task: Optional[asyncio.Task[None]] = None
 
 
+def is_superseded(previous: Action[ActionResult], action: Action[ActionResult]) -> bool:
+    return (
+        previous.get_application_name() == action.get_application_name()
+        and previous is not action
+        and (previous.get_id() == action.get_id() or action_type(previous) == action_type(action))
+    )
+
+
 class JobExecutor:
-    incoming: AsyncQueue[Action[ActionResult]]
+    """
+    Runs up to max_workers actions at a time, each bounded by its timeout.
+    Actions are taken from the priority queue, skipping action types at their concurrency limit.
+    A new action of an application cancels its running action of the same id or type.
+    Timed out and cancelled actions produce no result, the state machine retries them once their step expires.
+    """
+
+    incoming: ActionQueue
     outgoing: AsyncQueue[ActionResult]
-    in_progress: Dict[NamespacedName, InProgressAction]
+    in_progress: Dict[NamespacedName, Dict[ActionId, InProgressAction]]
     context: ExecutorContext
+    settings: ExecutorSettings
+
+    running: int
+    running_by_type: Dict[ActionType, int]
+    capacity: asyncio.Event
 
     def __init__(
         self,
         executor_context: ExecutorContext,
-        incoming: AsyncQueue[Action[ActionResult]],
+        incoming: ActionQueue,
         outgoing: AsyncQueue[ActionResult],
         is_terminated: asyncio.Event,
+        settings: Optional[ExecutorSettings] = None,
     ):
         self.incoming = incoming
         self.outgoing = outgoing
         self.in_progress = dict()
         self.is_terminated = is_terminated
         self.context = executor_context
+        self.settings = settings or ExecutorSettings()
+        self.running = 0
+        self.running_by_type = dict()
+        self.capacity = asyncio.Event()
 
     async def run(self) -> None:
-        logger.info("JobExecutor started.")
+        logger.info(f"JobExecutor started with {self.settings.max_workers} workers.")
         while not self.is_terminated.is_set():
-            action = await self.incoming.get()
+            await self.wait_for_capacity()
+            action = await self.incoming.get(self.has_type_capacity)
             try:
                 logger.info(f"{action.get_application_name().to_string()}: received action {type(action).__name__}")
                 self.handle_action(action)
             except Exception as e:
                 logger.error(f"error while handling action {e}")
 
+    async def wait_for_capacity(self) -> None:
+        while self.running >= max(self.settings.max_workers, 1):
+            self.capacity.clear()
+            await self.capacity.wait()
+
+    def has_type_capacity(self, kind: ActionType) -> bool:
+        limit = self.settings.action_concurrency.get(kind)
+        return limit is None or self.running_by_type.get(kind, 0) < max(limit, 1)
+
     def handle_action(self, action: Action[ActionResult]) -> None:
-        name = action.get_application_name()
+        self.cancel_superseded(action)
+        self.start(action)
+
+    def start(self, action: Action[ActionResult]) -> None:
+        kind = action_type(action)
+        self.running += 1
+        self.running_by_type[kind] = self.running_by_type.get(kind, 0) + 1
+
         inprogress_action = InProgressAction(action=action)
-        self.in_progress[name] = inprogress_action
         task = asyncio.create_task(self.run_action(action))
         inprogress_action.task = task
+        self.in_progress.setdefault(action.get_application_name(), dict())[action.get_id()] = inprogress_action
+        task.add_done_callback(lambda _: self.on_done(inprogress_action))
+
+    def on_done(self, inprogress_action: InProgressAction) -> None:
+        action = inprogress_action.action
+        kind = action_type(action)
+        self.running -= 1
+        self.running_by_type[kind] -= 1
+        self.reap(inprogress_action)
+        self.capacity.set()
+        self.incoming.notify()
+
+    def cancel_superseded(self, action: Action[ActionResult]) -> None:
+        name = action.get_application_name()
+        for inprogress_action in list(self.in_progress.get(name, {}).values()):
+            previous = inprogress_action.action
+            if is_superseded(previous, action) and inprogress_action.task is not None:
+                logger.info(f"{name.to_string()}: action {action_type(previous)} {previous.get_id()} is superseded")
+                inprogress_action.task.cancel()
+
+    def reap(self, inprogress_action: InProgressAction) -> None:
+        action = inprogress_action.action
+        name = action.get_application_name()
+        running = self.in_progress.get(name)
+        if running is None:
+            return
+        # a superseding action with the same id may have taken the entry already
+        if running.get(action.get_id()) is inprogress_action:
+            del running[action.get_id()]
+        if len(running) == 0:
+            del self.in_progress[name]
 
     async def run_action(self, action: Action[ActionResult]) -> None:
-        result = await action.run(self.context)
-        self.outgoing.put_nowait(result)
+        try:
+            result = await asyncio.wait_for(action.run(self.context), timeout=action.get_timeout_seconds())
+            self.outgoing.put_nowait(result)
+        except TimeoutError:
+            logger.warning(
+                f"{action.get_application_name().to_string()}: action {action_type(action)} {action.get_id()} "
+                + f"timed out after {action.get_timeout_seconds()}s"
+            )
+        except Exception as e:
+            logger.error(
+                f"{action.get_application_name().to_string()}: action {action_type(action)} {action.get_id()} "
+                + f"failed {e}"
+            )
+
+    def list_in_progress(self) -> List[Action[ActionResult]]:
+        return [inprogress.action for running in self.in_progress.values() for inprogress in running.values()]
@@ -1,6 +1,8 @@
 from typing import Union
 
+import asyncio
 import json
+import time
 
 from fastapi import Depends, FastAPI, Request, Response
 from placement_client import models
@@ -12,19 +14,39 @@ class FakePlacementController(FakeServer):
 
     mocked_bid_response: Union[models.BidResponseModel, models.ErrorResponse]
     status: int
+    # response delay of bid requests
+    delay_seconds: float
 
     def __init__(self, host: str):
         app = FastAPI()
         self.mocked_spec = models.ErrorResponse(status=500, code="INTERNAL_ERROR", msg="mocked bid response is not set")
         self.status = 500
+        self.delay_seconds = 0
 
         @app.put("/bids/", response_model=None)
         def application_bid(
             body: Request,
             server: FakePlacementController = Depends(lambda: self),
         ) -> Response:
+            time.sleep(server.delay_seconds)
             return Response(content=json.dumps(server.mocked_bid_response.to_dict()), status_code=server.status)
 
+        @app.put("/bids/batch", response_model=None)
+        async def application_bid_batch(
+            body: Request,
+            server: FakePlacementController = Depends(lambda: self),
+        ) -> Response:
+            await asyncio.sleep(server.delay_seconds)
+            if server.status != 200 or not isinstance(server.mocked_bid_response, models.BidResponseModel):
+                return Response(content=json.dumps(server.mocked_bid_response.to_dict()), status_code=server.status)
+            bids = (await body.json())["bids"]
+            responses = []
+            for bid in bids:
+                response = server.mocked_bid_response.to_dict()
+                response["id"] = bid["id"]
+                responses.append(response)
+            return Response(content=json.dumps({"responses": responses, "errors": []}), status_code=200)
+
         super().__init__(host, app)
 
     def mock_response(self, response: Union[models.BidResponseModel, models.ErrorResponse]) -> None:
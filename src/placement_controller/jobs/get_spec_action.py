@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Optional, Union
 
 from application_client import models
 from application_client.api.default import get_application_spec
@@ -6,6 +6,8 @@ from loguru import logger
 
 from placement_controller.api.model import ErrorResponse
 from placement_controller.clients.k8s.client import NamespacedName
+from placement_controller.core.scheduling_state import ScaleDirection
+from placement_controller.jobs.spec_cache import SpecOrError, SpecVersion
 from placement_controller.jobs.types import Action, ActionId, ActionResult, ExecutorContext
 
 
@@ -23,15 +25,33 @@ class GetSpecResult(ActionResult):
 
 
 class GetSpecAction(Action[GetSpecResult]):
+    # application version the spec is fetched for, specs of unknown versions are not cached
+    version: Optional[SpecVersion]
 
-    def __init__(self, name: NamespacedName, action_id: ActionId):
-        super().__init__(name, action_id)
+    def __init__(
+        self,
+        name: NamespacedName,
+        action_id: ActionId,
+        direction: Optional[ScaleDirection] = None,
+        version: Optional[SpecVersion] = None,
+    ):
+        super().__init__(name, action_id, direction)
+        self.version = version
 
     async def run(self, ctx: ExecutorContext) -> GetSpecResult:
+        response: SpecOrError
+        if self.version is None:
+            response = await self.fetch(ctx)
+        else:
+            response = await ctx.spec_cache.fetch(self.name, self.version, lambda: self.fetch(ctx))
+        return GetSpecResult(response, self.name, self.action_id)
+
+    async def fetch(self, ctx: ExecutorContext) -> SpecOrError:
         logger.info(f"{self.name.to_string()}: Getting application specification")
         api_response = await get_application_spec.asyncio(
             namespace=self.name.namespace, name=self.name.name, client=ctx.application_controller_client
         )
+        response: SpecOrError
         if not api_response:
             logger.error(f"{self.name.to_string()}: Getting application specification failure. Received empty response")
             response = ErrorResponse(status=500, code="INTERNAL_ERROR", msg="Received empty response")
@@ -40,7 +60,8 @@ class GetSpecAction(Action[GetSpecResult]):
             response = ErrorResponse(status=api_response.status, code=api_response.code, msg=api_response.message)
         elif isinstance(api_response, models.ApplicationSpec):
             logger.info(
-                f"{self.name.to_string()}: Getting application specification succeeded. spec: {api_response.to_dict()}"
+                f"{self.name.to_string()}: Getting application specification succeeded. "
+                + f"resources: {len(api_response.resources)}"
             )
-            response = api_response  # type: ignore
-        return GetSpecResult(response, self.name, self.action_id)
+            response = api_response
+        return response
@@ -7,6 +7,7 @@ from loguru import logger
 from placement_controller.api.model import ErrorResponse
 from placement_controller.clients.k8s.client import KubeClient, NamespacedName
 from placement_controller.core.application import AnyApplication
+from placement_controller.core.scheduling_state import ScaleDirection
 from placement_controller.jobs.types import Action, ActionId, ActionResult, ExecutorContext
 from placement_controller.membership.types import PlacementZone
 from placement_controller.resources.trace_log import TraceLogRow
@@ -41,8 +42,9 @@ class SetPlacementAction(Action[SetPlacementActionResult]):
         decision: PlacementDecision,
         name: NamespacedName,
         action_id: ActionId,
+        direction: Optional[ScaleDirection] = None,
     ):
-        super().__init__(name, action_id)
+        super().__init__(name, action_id, direction)
         self.decision = decision
 
     async def run(self, ctx: ExecutorContext) -> SetPlacementActionResult:
@@ -0,0 +1,90 @@
+from typing import Awaitable, Callable, Dict, Optional, Tuple, Union
+
+import asyncio
+from collections import OrderedDict
+
+from application_client import models
+
+from placement_controller.api.model import ErrorResponse
+from placement_controller.clients.k8s.client import NamespacedName
+from placement_controller.util.clock import Clock
+from placement_controller.util.clock_impl import ClockImpl
+
+# generation of the application the spec was fetched for
+SpecVersion = int
+SpecOrError = Union[models.ApplicationSpec, ErrorResponse]
+
+DEFAULT_SPEC_CACHE_SIZE: int = 1024
+DEFAULT_SPEC_MAX_AGE_SECONDS: float = 60.0
+
+
+class SpecCache:
+    """
+    LRU cache of application specs.
+    An entry is valid for the application version it was fetched for, and for max_age_seconds at most:
+    the workloads behind a spec may change without a new application generation. Concurrent fetches of
+    the same version share one request, which completes even if the callers waiting for it are cancelled.
+    """
+
+    max_size: int
+    max_age_seconds: float
+    clock: Clock
+    # version, spec and fetch time in millis
+    entries: "OrderedDict[NamespacedName, Tuple[SpecVersion, models.ApplicationSpec, int]]"
+    in_flight: Dict[Tuple[NamespacedName, SpecVersion], asyncio.Task[SpecOrError]]
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_SPEC_CACHE_SIZE,
+        max_age_seconds: float = DEFAULT_SPEC_MAX_AGE_SECONDS,
+        clock: Optional[Clock] = None,
+    ):
+        self.max_size = max_size
+        self.max_age_seconds = max_age_seconds
+        self.clock = clock or ClockImpl()
+        self.entries = OrderedDict()
+        self.in_flight = dict()
+
+    def get(self, name: NamespacedName, version: SpecVersion) -> Optional[models.ApplicationSpec]:
+        entry = self.entries.get(name)
+        if entry is None:
+            return None
+        cached_version, spec, fetched_at = entry
+        if cached_version != version or self.is_expired(fetched_at):
+            del self.entries[name]
+            return None
+        self.entries.move_to_end(name)
+        return spec
+
+    def is_expired(self, fetched_at: int) -> bool:
+        return self.max_age_seconds > 0 and self.clock.now_millis() - fetched_at >= self.max_age_seconds * 1000
+
+    def put(self, name: NamespacedName, version: SpecVersion, spec: models.ApplicationSpec) -> None:
+        if self.max_size <= 0:
+            return
+        self.entries[name] = (version, spec, self.clock.now_millis())
+        self.entries.move_to_end(name)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    async def fetch(
+        self, name: NamespacedName, version: SpecVersion, load: Callable[[], Awaitable[SpecOrError]]
+    ) -> SpecOrError:
+        spec = self.get(name, version)
+        if spec is not None:
+            return spec
+        key = (name, version)
+        task = self.in_flight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self.load(name, version, load))
+            self.in_flight[key] = task
+            task.add_done_callback(lambda _: self.in_flight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def load(
+        self, name: NamespacedName, version: SpecVersion, load: Callable[[], Awaitable[SpecOrError]]
+    ) -> SpecOrError:
+        response = await load()
+        if isinstance(response, models.ApplicationSpec):
+            self.put(name, version, response)
+        return response
@@ -0,0 +1,93 @@
+from typing import List, Optional
+
+import unittest
+
+from placement_controller.clients.k8s.client import NamespacedName
+from placement_controller.core.scheduling_state import ScaleDirection
+from placement_controller.jobs.action_queue import ActionQueue, ActionQueueSettings
+from placement_controller.jobs.get_spec_action import GetSpecAction
+from placement_controller.jobs.placement_action import PlacementDecision, SetPlacementAction
+from placement_controller.jobs.types import Action, ActionResult
+from placement_controller.util.mock_clock import MockClock
+
+
+def get_spec(name: str, direction: Optional[ScaleDirection], namespace: str = "ns") -> Action[ActionResult]:
+    action = GetSpecAction(NamespacedName(name=name, namespace=namespace), f"{namespace}/{name}", direction)
+    return action  # type: ignore
+
+
+def set_placement(name: str, direction: Optional[ScaleDirection], namespace: str = "ns") -> Action[ActionResult]:
+    decision = PlacementDecision(spec="{}", placements=[], reason="test", trace=[])
+    return SetPlacementAction(
+        decision, NamespacedName(name=name, namespace=namespace), f"{namespace}/{name}", direction
+    )  # type: ignore
+
+
+class ActionQueueTest(unittest.TestCase):
+    clock: MockClock
+    queue: ActionQueue
+
+    def setUp(self) -> None:
+        self.clock = MockClock()
+        self.queue = ActionQueue(self.clock, ActionQueueSettings(aging_seconds=10, namespace_share_seconds=1))
+
+    def drain(self) -> List[str]:
+        names = []
+        while (action := self.queue.get_nowait()) is not None:
+            names.append(action.get_application_name().name)
+        return names
+
+    def test_upscale_before_downscale_before_optimize(self) -> None:
+        self.queue.put_nowait(get_spec("optimize", ScaleDirection.NONE))
+        self.queue.put_nowait(get_spec("downscale", ScaleDirection.DOWNSCALE))
+        self.queue.put_nowait(get_spec("upscale", ScaleDirection.UPSCALE))
+
+        self.assertEqual(["upscale", "downscale", "optimize"], self.drain())
+
+    def test_action_type_order_within_direction(self) -> None:
+        self.queue.put_nowait(get_spec("app1", ScaleDirection.UPSCALE))
+        self.queue.put_nowait(set_placement("app2", ScaleDirection.UPSCALE))
+
+        self.assertEqual(["app2", "app1"], self.drain())
+
+    def test_waiting_actions_age(self) -> None:
+        self.queue.put_nowait(get_spec("optimize", ScaleDirection.NONE, "ns1"))
+        # two direction levels of five type levels each, 10 seconds per level
+        self.clock.set_seconds(self.clock.now_seconds() + 101)
+        self.queue.put_nowait(get_spec("upscale", ScaleDirection.UPSCALE, "ns2"))
+
+        self.assertEqual(["optimize", "upscale"], self.drain())
+
+    def test_namespaces_share_the_queue(self) -> None:
+        for i in range(3):
+            self.queue.put_nowait(get_spec(f"bulk{i}", ScaleDirection.NONE, "bulk"))
+        self.queue.put_nowait(get_spec("other", ScaleDirection.NONE, "other"))
+
+        self.assertEqual(["bulk0", "other", "bulk1", "bulk2"], self.drain())
+
+    def test_namespace_share_is_per_direction(self) -> None:
+        for i in range(3):
+            self.queue.put_nowait(get_spec(f"bulk{i}", ScaleDirection.NONE))
+        self.queue.put_nowait(get_spec("upscale", ScaleDirection.UPSCALE))
+
+        self.assertEqual("upscale", self.drain()[0])
+
+    def test_new_action_replaces_pending_one(self) -> None:
+        first = get_spec("app", ScaleDirection.NONE)
+        second = get_spec("app", ScaleDirection.UPSCALE)
+        self.queue.put_nowait(first)
+        self.queue.put_nowait(second)
+
+        self.assertEqual(1, len(self.queue))
+        self.assertIs(second, self.queue.get_nowait())
+        self.assertIsNone(self.queue.get_nowait())
+
+    def test_skips_types_that_are_not_ready(self) -> None:
+        self.queue.put_nowait(set_placement("app1", ScaleDirection.UPSCALE))
+        self.queue.put_nowait(get_spec("app2", ScaleDirection.NONE))
+
+        action = self.queue.get_nowait(lambda kind: kind != "SetPlacementAction")
+
+        self.assertIsNotNone(action)
+        self.assertEqual("app2", action.get_application_name().name)  # type: ignore
+        self.assertEqual(["app1"], self.drain())
@@ -1,4 +1,5 @@
 import json
+import time
 from decimal import Decimal
 
 from application_client.client import Client
@@ -10,6 +11,7 @@ from placement_controller.api.model import (
     BidRequestModel,
     BidResponseModel,
     BidStatus,
+    ErrorResponse,
     Metric,
     MetricUnit,
     MetricValue,
@@ -20,15 +22,16 @@ from placement_controller.clients.k8s.client import NamespacedName
 from placement_controller.clients.k8s.fake_client import FakeClient
 from placement_controller.clients.placement.local import LocalPlacementClient
 from placement_controller.core.scheduling_state import FSMOperation, ScaleDirection
-from placement_controller.jobs.bid_action import BidAction
+from placement_controller.jobs.bid_action import BidAction, BidCollectionSettings
 from placement_controller.jobs.fake_placement_server import FakePlacementController
 from placement_controller.jobs.types import ExecutorContext
 from placement_controller.resource_fixture import ResourceTestFixture
 from placement_controller.resources.fake_resource_management import FakeResourceManagement
-from placement_controller.settings import PlacementSettings
+from placement_controller.settings import PlacementSettings, ZoneClientSettings
 from placement_controller.store.fake_decision_store import FakeDecisionStore
 from placement_controller.util.mock_clock import MockClock
 from placement_controller.zone.zone_api_factory import ZoneApiFactoryImpl
+from placement_controller.zone.zone_health import CircuitState
 
 
 class BidActionTest(AsyncTestFixture, ResourceTestFixture):
@@ -123,6 +126,7 @@ class BidActionTest(AsyncTestFixture, ResourceTestFixture):
         self.wait_for_condition(2, lambda: self.server1.is_available() and self.server2.is_available())
 
     def tearDown(self) -> None:
+        self.loop.run_until_complete(self.api_factory.close())
         super().tearDown()
         self.server1.stop()
         self.server2.stop()
@@ -134,10 +138,10 @@ class BidActionTest(AsyncTestFixture, ResourceTestFixture):
             current_zones=set(),
             available_zones={"zone1", "zone2", "zone3"},
         )
-        action = BidAction(operation, self.request, self.name)
+        # the quorum covers every zone
+        action = BidAction(operation, self.request, self.name, BidCollectionSettings(quorum_margin=2))
 
         result = self.loop.run_until_complete(action.run(self.context))
-        print(result.response)
         self.assertEqual(
             result.response,
             {
@@ -240,3 +244,114 @@ class BidActionTest(AsyncTestFixture, ResourceTestFixture):
                 ),
             },
         )
+
+    def test_zone_clients_reused(self) -> None:
+        operation = FSMOperation(
+            direction=ScaleDirection.DOWNSCALE,
+            required_replica=2,
+            current_zones={"zone1", "zone2"},
+            available_zones={"zone1", "zone2", "zone3"},
+        )
+        client = self.api_factory.create("zone1")
+
+        for _ in range(2):
+            result = self.loop.run_until_complete(BidAction(operation, self.request, self.name).run(self.context))
+            self.assertTrue(result.is_success())
+
+        self.assertIs(self.api_factory.create("zone1"), client)
+        self.assertEqual(set(self.api_factory.remote_clients.keys()), {"zone1", "zone2"})
+
+        self.loop.run_until_complete(self.api_factory.close())
+
+        self.assertEqual(self.api_factory.remote_clients, {})
+        self.assertIsNot(self.api_factory.create("zone1"), client)
+
+    def test_bid_upscale_decided_on_quorum(self) -> None:
+        self.server2.delay_seconds = 2
+        operation = FSMOperation(
+            direction=ScaleDirection.UPSCALE,
+            required_replica=1,
+            current_zones=set(),
+            available_zones={"zone1", "zone2", "zone3"},
+        )
+        action = BidAction(operation, self.request, self.name, BidCollectionSettings(quorum_margin=1))
+
+        started = time.monotonic()
+        result = self.loop.run_until_complete(action.run(self.context))
+
+        self.assertLess(time.monotonic() - started, 1.5)
+        self.assertTrue(result.is_success())
+        self.assertIsInstance(result.response["zone1"], BidResponseModel)
+        self.assertIsInstance(result.response["zone3"], BidResponseModel)
+        cancelled = result.response["zone2"]
+        assert isinstance(cancelled, ErrorResponse)
+        self.assertEqual("BID_CANCELLED", cancelled.code)
+
+    def test_bid_downscale_decided_on_deadline(self) -> None:
+        self.server2.delay_seconds = 2
+        operation = FSMOperation(
+            direction=ScaleDirection.DOWNSCALE,
+            required_replica=1,
+            current_zones={"zone1", "zone2"},
+            available_zones={"zone1", "zone2", "zone3"},
+        )
+        action = BidAction(operation, self.request, self.name, BidCollectionSettings(deadline_seconds=0.5))
+
+        started = time.monotonic()
+        result = self.loop.run_until_complete(action.run(self.context))
+
+        self.assertLess(time.monotonic() - started, 1.5)
+        self.assertIsInstance(result.response["zone1"], BidResponseModel)
+        cancelled = result.response["zone2"]
+        assert isinstance(cancelled, ErrorResponse)
+        self.assertEqual("Bid cancelled, deadline passed.", cancelled.msg)
+
+    def test_bid_skips_zone_with_open_circuit(self) -> None:
+        for _ in range(self.settings.zone_health.failure_threshold):
+            self.api_factory.health.record_failure("zone2")
+        operation = FSMOperation(
+            direction=ScaleDirection.DOWNSCALE,
+            required_replica=1,
+            current_zones={"zone1", "zone2"},
+            available_zones={"zone1", "zone2", "zone3"},
+        )
+
+        result = self.loop.run_until_complete(BidAction(operation, self.request, self.name).run(self.context))
+
+        self.assertIsInstance(result.response["zone1"], BidResponseModel)
+        skipped = result.response["zone2"]
+        assert isinstance(skipped, ErrorResponse)
+        self.assertEqual("ZONE_UNAVAILABLE", skipped.code)
+        self.assertNotIn("zone2", self.api_factory.remote_clients)
+
+    def test_hanging_zone_opens_circuit_without_batching(self) -> None:
+        self.server2.delay_seconds = 1
+        # the bid deadline fires together with the zone timeout
+        settings = self.settings.model_copy(
+            update={"zone_client": ZoneClientSettings(timeout_seconds=0.3, bid_batch_window_seconds=0)}
+        )
+        api_factory = ZoneApiFactoryImpl(settings, LocalPlacementClient(self.resource_management))
+        context = ExecutorContext(
+            zone_api_factory=api_factory,
+            application_controller_client=Client(base_url=""),
+            kube_client=FakeClient(),
+            clock=self.clock,
+            decision_store=self.decision_store,
+        )
+        operation = FSMOperation(
+            direction=ScaleDirection.DOWNSCALE,
+            required_replica=1,
+            current_zones={"zone1", "zone2"},
+            available_zones={"zone1", "zone2", "zone3"},
+        )
+        action = BidAction(operation, self.request, self.name, BidCollectionSettings(deadline_seconds=0.3))
+
+        for _ in range(settings.zone_health.failure_threshold):
+            result = self.loop.run_until_complete(action.run(context))
+            cancelled = result.response["zone2"]
+            assert isinstance(cancelled, ErrorResponse)
+            self.assertEqual("BID_CANCELLED", cancelled.code)
+        self.loop.run_until_complete(api_factory.close())
+
+        self.assertEqual(CircuitState.OPEN, api_factory.health.state("zone2"))
+        self.assertEqual(CircuitState.CLOSED, api_factory.health.state("zone1"))
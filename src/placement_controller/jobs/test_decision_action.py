@@ -6,8 +6,9 @@ from placement_controller.api.model import BidResponseModel, BidStatus, ErrorRes
 from placement_controller.async_fixture import AsyncTestFixture
 from placement_controller.clients.k8s.client import NamespacedName
 from placement_controller.clients.k8s.fake_client import FakeClient
+from placement_controller.clients.placement.types import BidResponseOrError
 from placement_controller.core.scheduling_state import FSMOperation, ScaleDirection
-from placement_controller.jobs.bid_action import BidResponseOrError, ZoneId
+from placement_controller.jobs.bid_action import ZoneId
 from placement_controller.jobs.decision_action import DecisionAction
 from placement_controller.jobs.types import ExecutorContext
 from placement_controller.membership.types import PlacementZone
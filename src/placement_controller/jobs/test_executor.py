@@ -4,7 +4,8 @@ from placement_controller.async_fixture import AsyncTestFixture
 from placement_controller.clients.k8s.client import NamespacedName
 from placement_controller.clients.k8s.fake_client import FakeClient
 from placement_controller.core.async_queue import AsyncQueue
-from placement_controller.jobs.executor import JobExecutor
+from placement_controller.jobs.action_queue import ActionQueue
+from placement_controller.jobs.executor import ExecutorSettings, JobExecutor
 from placement_controller.jobs.types import Action, ActionId, ActionResult, ExecutorContext
 from placement_controller.store.fake_decision_store import FakeDecisionStore
 from placement_controller.util.mock_clock import MockClock
@@ -29,9 +30,29 @@ class FakeAction(Action[FakeActionResult]):
         return FakeActionResult(self.result, self.name, self.action_id)
 
 
+class SlowAction(FakeAction):
+    started: asyncio.Event
+    release: asyncio.Event
+    timeout_seconds: int
+
+    def __init__(self, result: int, name: NamespacedName, action_id: ActionId, timeout_seconds: int = 10):
+        super().__init__(result, name, action_id)
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.timeout_seconds = timeout_seconds
+
+    def get_timeout_seconds(self) -> int:
+        return self.timeout_seconds
+
+    async def run(self, context: ExecutorContext) -> FakeActionResult:
+        self.started.set()
+        await self.release.wait()
+        return await super().run(context)
+
+
 class JobExecutorTest(AsyncTestFixture):
 
-    actions: AsyncQueue[Action[FakeActionResult]]
+    actions: ActionQueue
     results: AsyncQueue[FakeActionResult]
 
     executor: JobExecutor
@@ -45,12 +66,12 @@ class JobExecutorTest(AsyncTestFixture):
 
     def setUp(self) -> None:
         super().setUp()
-        self.actions = AsyncQueue[Action[FakeActionResult]]()
         self.results = AsyncQueue[FakeActionResult]()
 
         self.clock = MockClock()
         self.decision_store = FakeDecisionStore()
         self.name = NamespacedName(name="test", namespace="testns")
+        self.actions = ActionQueue(self.clock)
 
         self.executor_context = ExecutorContext(
             application_controller_client=None,  # type: ignore
@@ -59,7 +80,13 @@ class JobExecutorTest(AsyncTestFixture):
             clock=self.clock,
             decision_store=self.decision_store,
         )
-        self.executor = JobExecutor(self.executor_context, self.actions, self.results, self.terminated)  # type: ignore
+        self.executor = JobExecutor(
+            self.executor_context,
+            self.actions,
+            self.results,  # type: ignore
+            self.terminated,
+            ExecutorSettings(max_workers=4, action_concurrency={"SlowAction": 1}),
+        )
 
         self.task = self.loop.create_task(self.executor.run())
 
@@ -71,7 +98,7 @@ class JobExecutorTest(AsyncTestFixture):
         action = FakeAction(1, self.name, "1")
         expected = FakeActionResult(1, self.name, "1")
 
-        self.actions.put_nowait(action)
+        self.actions.put_nowait(action)  # type: ignore
 
         def action_result_check() -> bool:
             action_result = self.results.get_nowait()
@@ -81,3 +108,47 @@ class JobExecutorTest(AsyncTestFixture):
                 return False
 
         self.wait_for_condition(2, action_result_check)
+
+    def test_timed_out_action_has_no_result(self) -> None:
+        action = SlowAction(1, self.name, "1", timeout_seconds=1)
+
+        self.actions.put_nowait(action)  # type: ignore
+
+        self.wait_for_condition(2, lambda: action.started.is_set())
+        self.wait_for_condition(3, lambda: len(self.executor.in_progress) == 0)
+        self.assertIsNone(self.results.get_nowait())
+
+    def test_superseded_action_is_cancelled(self) -> None:
+        previous = SlowAction(1, self.name, "1")
+        current = FakeAction(2, self.name, "1")
+
+        self.actions.put_nowait(previous)  # type: ignore
+        self.wait_for_condition(2, lambda: previous.started.is_set())
+        self.actions.put_nowait(current)  # type: ignore
+
+        def action_result_check() -> bool:
+            action_result = self.results.get_nowait()
+            return action_result is not None and action_result.result == 2
+
+        self.wait_for_condition(2, action_result_check)
+        self.wait_for_condition(2, lambda: len(self.executor.in_progress) == 0)
+        previous.release.set()
+        self.loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertIsNone(self.results.get_nowait())
+
+    def test_action_type_concurrency_limit(self) -> None:
+        first = SlowAction(1, self.name, "1")
+        second = SlowAction(2, NamespacedName(name="other", namespace="testns"), "2")
+
+        self.actions.put_nowait(first)  # type: ignore
+        self.actions.put_nowait(second)  # type: ignore
+        self.wait_for_condition(2, lambda: first.started.is_set() and len(self.actions) == 1)
+        self.assertFalse(second.started.is_set())
+        self.assertEqual([first], self.executor.list_in_progress())
+
+        first.release.set()
+        second.release.set()
+        self.wait_for_condition(2, lambda: second.started.is_set() and len(self.executor.in_progress) == 0)
+        results = [self.results.get_nowait(), self.results.get_nowait()]
+        self.assertEqual([1, 2], [result.result for result in results if result is not None])
+        self.assertEqual(0, self.executor.running)
@@ -0,0 +1,90 @@
+from typing import List
+
+import asyncio
+
+from application_client import models
+
+from placement_controller.api.model import ErrorResponse
+from placement_controller.async_fixture import AsyncTestFixture
+from placement_controller.clients.k8s.client import NamespacedName
+from placement_controller.jobs.spec_cache import SpecCache, SpecOrError
+from placement_controller.util.mock_clock import MockClock
+
+
+class SpecCacheTest(AsyncTestFixture):
+    loads: List[str]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.loads = []
+
+    def make_spec(self, name: str) -> models.ApplicationSpec:
+        return models.ApplicationSpec(id=models.ResourceId(name=name, namespace="test"), resources=[])
+
+    def test_entry_valid_for_version(self) -> None:
+        cache = SpecCache()
+        name = NamespacedName(name="app1", namespace="test")
+        spec = self.make_spec("app1")
+        cache.put(name, 1, spec)
+
+        self.assertEqual(spec, cache.get(name, 1))
+        self.assertIsNone(cache.get(name, 2))
+        # the outdated entry is dropped
+        self.assertIsNone(cache.get(name, 1))
+
+    def test_entry_expires(self) -> None:
+        clock = MockClock()
+        cache = SpecCache(max_age_seconds=60, clock=clock)
+        name = NamespacedName(name="app1", namespace="test")
+        cache.put(name, 1, self.make_spec("app1"))
+
+        clock.set_seconds(59)
+        self.assertIsNotNone(cache.get(name, 1))
+        # the workloads may have changed within the same generation
+        clock.set_seconds(61)
+        self.assertIsNone(cache.get(name, 1))
+
+    def test_least_recently_used_evicted(self) -> None:
+        cache = SpecCache(max_size=2)
+        names = [NamespacedName(name=f"app{i}", namespace="test") for i in range(3)]
+        cache.put(names[0], 1, self.make_spec("app0"))
+        cache.put(names[1], 1, self.make_spec("app1"))
+        cache.get(names[0], 1)
+        cache.put(names[2], 1, self.make_spec("app2"))
+
+        self.assertIsNotNone(cache.get(names[0], 1))
+        self.assertIsNone(cache.get(names[1], 1))
+        self.assertIsNotNone(cache.get(names[2], 1))
+
+    def test_concurrent_fetches_share_request(self) -> None:
+        cache = SpecCache()
+        name = NamespacedName(name="app1", namespace="test")
+        spec = self.make_spec("app1")
+
+        async def load() -> SpecOrError:
+            self.loads.append(name.name)
+            await asyncio.sleep(0.01)
+            return spec
+
+        async def run() -> List[SpecOrError]:
+            return await asyncio.gather(*[cache.fetch(name, 1, load) for _ in range(3)])
+
+        responses = self.loop.run_until_complete(run())
+
+        self.assertEqual([spec, spec, spec], responses)
+        self.assertEqual(["app1"], self.loads)
+        self.assertEqual(spec, self.loop.run_until_complete(cache.fetch(name, 1, load)))
+        self.assertEqual(["app1"], self.loads)
+
+    def test_errors_not_cached(self) -> None:
+        cache = SpecCache()
+        name = NamespacedName(name="app1", namespace="test")
+
+        async def load() -> SpecOrError:
+            self.loads.append(name.name)
+            return ErrorResponse(status=500, code="INTERNAL_ERROR", msg="failure")
+
+        self.loop.run_until_complete(cache.fetch(name, 1, load))
+        self.loop.run_until_complete(cache.fetch(name, 1, load))
+
+        self.assertEqual(["app1", "app1"], self.loads)
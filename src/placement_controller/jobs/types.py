@@ -1,10 +1,12 @@
-from typing import Generic, TypeVar
+from typing import Generic, Optional, TypeVar
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from application_client.client import Client
 
 from placement_controller.clients.k8s.client import KubeClient, NamespacedName
+from placement_controller.core.scheduling_state import ScaleDirection
+from placement_controller.jobs.spec_cache import SpecCache
 from placement_controller.store.types import DecisionStore
 from placement_controller.util.clock import Clock
 from placement_controller.zone.types import ZoneApiFactory
@@ -39,6 +41,7 @@ class ExecutorContext:
     kube_client: KubeClient
     clock: Clock
     decision_store: DecisionStore
+    spec_cache: SpecCache = field(default_factory=SpecCache)
 
 
 T = TypeVar("T", bound="ActionResult")
@@ -47,10 +50,13 @@ T = TypeVar("T", bound="ActionResult")
 class Action(Generic[T]):
     action_id: ActionId
     name: NamespacedName
+    # direction of the operation the action belongs to, used to prioritize execution
+    direction: Optional[ScaleDirection]
 
-    def __init__(self, name: NamespacedName, action_id: ActionId):
+    def __init__(self, name: NamespacedName, action_id: ActionId, direction: Optional[ScaleDirection] = None):
         self.action_id = action_id
         self.name = name
+        self.direction = direction
 
     def get_application_name(self) -> NamespacedName:
         return self.name
@@ -58,6 +64,9 @@ class Action(Generic[T]):
     def get_id(self) -> ActionId:
         return self.action_id
 
+    def get_direction(self) -> Optional[ScaleDirection]:
+        return self.direction
+
     def get_timeout_seconds(self) -> int:
         return DEFAULT_TIMEOUT_SECONDS
 
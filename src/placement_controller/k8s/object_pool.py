@@ -1,4 +1,4 @@
-from typing import Dict, Generic, List, Type, TypeVar
+from typing import Callable, Dict, Generic, List, Optional, Set, Type, TypeVar
 
 import asyncio
 
@@ -10,6 +10,9 @@ from placement_controller.clients.k8s.resource import BaseResource
 
 T = TypeVar("T", bound="BaseResource")
 
+# (previous, current) - previous is None for new objects, current is None for deleted objects
+ObjectChangeListener = Callable[[Optional[T], Optional[T]], None]
+
 
 class ObjectPool(Generic[T]):
 
@@ -20,8 +23,19 @@ class ObjectPool(Generic[T]):
     cls: type[T]
     active: bool
     initialized: bool
+    on_change: Optional[ObjectChangeListener[T]]
+    # objects listed by the snapshot in progress
+    snapshot_names: Optional[Set[NamespacedName]]
+    snapshot_changes: int
 
-    def __init__(self, cls: Type[T], client: KubeClient, gvk: GroupVersionKind, is_terminated: asyncio.Event):
+    def __init__(
+        self,
+        cls: Type[T],
+        client: KubeClient,
+        gvk: GroupVersionKind,
+        is_terminated: asyncio.Event,
+        on_change: Optional[ObjectChangeListener[T]] = None,
+    ):
         self.cls = cls
         self.client = client
         self.gvk = gvk
@@ -29,6 +43,9 @@ class ObjectPool(Generic[T]):
         self.pool = dict()
         self.active = False
         self.initialized = False
+        self.on_change = on_change
+        self.snapshot_names = None
+        self.snapshot_changes = 0
 
     async def start(self) -> None:
         subscriber_id, queue = self.client.watch(self.gvk, None, 0, self.is_terminated)
@@ -44,31 +61,69 @@ class ObjectPool(Generic[T]):
         self.client.stop_watch(subscriber_id)
 
     async def handle_event(self, event: KubeEvent) -> None:
-        if event.event == EventType.SNAPSHOT:
-            if not self.initialized:
-                if not isinstance(event.object, list):
-                    logger.warning(f"ObjectPool{{{self.gvk.to_string()}}} Skipping snapshot event. List expected.")
-                    return
-                for event_object in event.object:
-                    object = self.cls(event_object)
-                    self.pool[object.get_namespaced_name()] = object
-                logger.info(f"ObjectPool{{{self.gvk.to_string()}}} initialized.")
-            self.initialized = True
+        if event.event == EventType.SNAPSHOT_BEGIN:
+            self.snapshot_names = set()
+            self.snapshot_changes = 0
+        elif event.event == EventType.SNAPSHOT:
+            if not isinstance(event.object, list):
+                logger.warning(f"ObjectPool{{{self.gvk.to_string()}}} Skipping snapshot event. List expected.")
+                return
+            for event_object in event.object:
+                self.load(self.cls(event_object))
+        elif event.event == EventType.SNAPSHOT_END:
+            self.complete_snapshot()
         elif event.event == EventType.ADDED or event.event == EventType.MODIFIED:
             if not isinstance(event.object, dict):
                 logger.warning(f"ObjectPool{{{self.gvk.to_string()}}} Skipping Update event. Dict expected.")
                 return
-            object = self.cls(event.object)
-            self.pool[object.get_namespaced_name()] = object
+            self.put(self.cls(event.object))
         elif event.event == EventType.DELETED:
             if not isinstance(event.object, dict):
                 logger.warning(f"ObjectPool{{{self.gvk.to_string()}}} Skipping Delete event. Dict expected.")
                 return
-            object = self.cls(event.object)
-            del self.pool[object.get_namespaced_name()]
+            self.remove(self.cls(event.object).get_namespaced_name())
         else:
             raise NotImplementedError(f"ObjectPool{{{self.gvk.to_string()}}} Unknown event type {event.event}")
 
+    def load(self, object: T) -> None:
+        """Loads an object of a snapshot, after the first snapshot only objects changed since are put."""
+        name = object.get_namespaced_name()
+        if self.snapshot_names is not None:
+            self.snapshot_names.add(name)
+        previous = self.pool.get(name)
+        if not self.initialized or previous is None or previous.get_resource_version() != object.get_resource_version():
+            self.put(object)
+            self.snapshot_changes += 1
+
+    def complete_snapshot(self) -> None:
+        """Removes objects missing in a re-listed snapshot, as if the missed delete events were received."""
+        if not self.initialized:
+            logger.info(f"ObjectPool{{{self.gvk.to_string()}}} initialized.")
+        elif self.snapshot_names is not None:
+            names = self.snapshot_names
+            deleted = [name for name in self.pool.keys() if name not in names]
+            for name in deleted:
+                self.remove(name)
+            changed = self.snapshot_changes
+            logger.info(f"ObjectPool{{{self.gvk.to_string()}}} reconciled, changed {changed}, deleted {len(deleted)}.")
+        self.snapshot_names = None
+        self.initialized = True
+
+    def put(self, object: T) -> None:
+        name = object.get_namespaced_name()
+        previous = self.pool.get(name)
+        self.pool[name] = object
+        self.notify(previous, object)
+
+    def remove(self, name: NamespacedName) -> None:
+        previous = self.pool.pop(name, None)
+        if previous is not None:
+            self.notify(previous, None)
+
+    def notify(self, previous: Optional[T], current: Optional[T]) -> None:
+        if self.on_change:
+            self.on_change(previous, current)
+
     def get_objects(self) -> List[T]:
         return list(self.pool.values())
 
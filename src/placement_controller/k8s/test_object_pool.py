@@ -1,9 +1,11 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 import asyncio
+import copy
 
 from placement_controller.async_fixture import AsyncTestFixture
 from placement_controller.clients.k8s.client import GroupVersionKind, NamespacedName
+from placement_controller.clients.k8s.event import EventType, KubeEvent
 from placement_controller.clients.k8s.fake_client import FakeClient
 from placement_controller.clients.k8s.resource import BaseResource
 from placement_controller.k8s.object_pool import ObjectPool
@@ -62,3 +64,38 @@ class ObjectPoolTest(AsyncTestFixture, ResourceTestFixture):
 
         self.loop.run_until_complete(self.client.delete(self.gvk, NamespacedName(name="nginx", namespace="test")))
         self.wait_for_condition(2, lambda: len(self.pool.get_objects()) == 0)
+
+    def load_snapshot(self, pool: ObjectPool[FakeResource], version: int, objects: List[Dict[str, Any]]) -> None:
+        # one page per object
+        events = [KubeEvent(EventType.SNAPSHOT_BEGIN, 0, [])]
+        events.extend(KubeEvent(EventType.SNAPSHOT, version, [object]) for object in objects)
+        events.append(KubeEvent(EventType.SNAPSHOT_END, version, []))
+        for event in events:
+            self.loop.run_until_complete(pool.handle_event(event))
+
+    def test_snapshot_reconciled(self) -> None:
+        changes: List[Tuple[Optional[str], Optional[str]]] = []
+
+        def on_change(previous: Optional[FakeResource], current: Optional[FakeResource]) -> None:
+            changes.append(
+                (
+                    previous.get_namespaced_name().name if previous else None,
+                    current.get_namespaced_name().name if current else None,
+                )
+            )
+
+        pool = ObjectPool[FakeResource](FakeResource, self.client, self.gvk, self.terminated, on_change)
+        unchanged, changed, deleted, added = [self.simple_pod() for _ in range(4)]
+        for i, object in enumerate([unchanged, changed, deleted, added]):
+            object["metadata"]["name"] = f"pod{i}"
+            object["metadata"]["resourceVersion"] = "1"
+        self.load_snapshot(pool, 1, [unchanged, changed, deleted])
+        self.assertTrue(pool.initialized)
+        changes.clear()
+
+        changed = copy.deepcopy(changed)
+        changed["metadata"]["resourceVersion"] = "2"
+        self.load_snapshot(pool, 2, [unchanged, changed, added])
+
+        self.assertEqual([("pod1", "pod1"), (None, "pod3"), ("pod2", None)], changes)
+        self.assertEqual(["pod0", "pod1", "pod3"], sorted(o.get_namespaced_name().name for o in pool.get_objects()))
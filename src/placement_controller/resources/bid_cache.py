@@ -0,0 +1,69 @@
+from typing import List, Optional, Tuple
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from placement_controller.api.model import BidCriteria, BidRequestModel, BidStatus, PlacementStrategy, TraceLogRowModel
+from placement_controller.clients.k8s.client import NamespacedName
+
+
+@dataclass(frozen=True)
+class BidCacheKey:
+    name: NamespacedName
+    spec_digest: str
+    # criteria order defines the node order, therefore it is part of the key
+    bid_criteria: Tuple[BidCriteria, ...]
+    strategy: PlacementStrategy
+
+    @staticmethod
+    def from_bid(bid: BidRequestModel, spec_digest: str, strategy: PlacementStrategy) -> "BidCacheKey":
+        return BidCacheKey(
+            name=bid.name.to_domain(),
+            spec_digest=spec_digest,
+            bid_criteria=tuple(bid.bid_criteria),
+            strategy=strategy,
+        )
+
+
+@dataclass(frozen=True)
+class CachedPlacement:
+    status: BidStatus
+    reason: Optional[str]
+    trace: List[TraceLogRowModel]
+
+
+class BidCache:
+    """
+    LRU cache of placement outcomes.
+    Entries are valid for a single resource tracking version, the cache is cleared once the version changes.
+    """
+
+    max_size: int
+    version: int
+    entries: "OrderedDict[BidCacheKey, CachedPlacement]"
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.version = 0
+        self.entries = OrderedDict()
+
+    def get(self, key: BidCacheKey, version: int) -> Optional[CachedPlacement]:
+        self.invalidate(version)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key: BidCacheKey, version: int, entry: CachedPlacement) -> None:
+        if self.max_size <= 0:
+            return
+        self.invalidate(version)
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, version: int) -> None:
+        if version != self.version:
+            self.entries.clear()
+            self.version = version
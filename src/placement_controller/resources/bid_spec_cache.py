@@ -0,0 +1,36 @@
+from typing import Optional
+
+from collections import OrderedDict
+
+from application_client.models.application_spec import ApplicationSpec
+
+SpecDigest = str
+
+
+class BidSpecCache:
+    """
+    LRU cache of the parsed specs received with bids, by spec digest.
+    Bids of a cached spec may reference it by digest instead of sending it again.
+    Placement only reads specs, therefore bids share the parsed instances.
+    """
+
+    max_size: int
+    entries: "OrderedDict[SpecDigest, ApplicationSpec]"
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+
+    def get(self, digest: SpecDigest) -> Optional[ApplicationSpec]:
+        spec = self.entries.get(digest)
+        if spec is not None:
+            self.entries.move_to_end(digest)
+        return spec
+
+    def put(self, digest: SpecDigest, spec: ApplicationSpec) -> None:
+        if self.max_size <= 0:
+            return
+        self.entries[digest] = spec
+        self.entries.move_to_end(digest)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
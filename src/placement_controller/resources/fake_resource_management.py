@@ -1,12 +1,17 @@
-from placement_controller.api.model import BidRequestModel, BidResponseModel
+from typing import List, Union
+
+from placement_controller.api.model import BidRequestModel, BidResponseModel, ErrorResponse
 from placement_controller.resources.types import ResourceManagement
 
 
 class FakeResourceManagement(ResourceManagement):
     response: BidResponseModel
 
-    def application_bid(self, bid: BidRequestModel) -> BidResponseModel:
+    def application_bid(self, bid: BidRequestModel) -> Union[BidResponseModel, ErrorResponse]:
         return self.response
 
+    def application_bids(self, bids: List[BidRequestModel]) -> List[Union[BidResponseModel, ErrorResponse]]:
+        return [self.response for _ in bids]
+
     def mock_response(self, response: BidResponseModel) -> None:
         self.response = response
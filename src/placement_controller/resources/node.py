@@ -1,22 +1,24 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from decimal import Decimal
 
-from kubernetes.utils.quantity import parse_quantity
-
 from placement_controller.clients.k8s.resource import BaseResource
+from placement_controller.resources.quantity import parse_quantities
 
 
 class Node(BaseResource):
+    resource_version: Optional[str]
+    allocatable: Dict[str, Decimal]
 
     def __init__(self, object: Dict[str, Any]):
         super().__init__(object)
+        metadata = object.get("metadata") or {}
+        status = object.get("status") or {}
+        self.resource_version = metadata.get("resourceVersion")
+        self.allocatable = parse_quantities(status.get("allocatable") or {})
 
     def get_name(self) -> str:
         return self.object["metadata"]["name"]  # type: ignore
 
     def get_allocatable(self) -> Dict[str, Decimal]:
-        status = self.object.get("status") or {}
-        allocatable = status.get("allocatable") or {}
-        quantities = {name: parse_quantity(q) for name, q in allocatable.items()}
-        return quantities
+        return self.allocatable
@@ -6,6 +6,7 @@ from decimal import Decimal
 from placement_controller.api.model import BidCriteria
 from placement_controller.resources.node import Node
 from placement_controller.resources.pod import Pod
+from placement_controller.resources.quantity import subtract_quantities, sum_quantities
 from placement_controller.resources.trace_log import TraceLog
 
 
@@ -15,37 +16,38 @@ class NodeInfo:
     allocatable: Dict[str, Decimal] = field(default_factory=dict)
     requests: Dict[str, Decimal] = field(default_factory=dict)
     limits: Dict[str, Decimal] = field(default_factory=dict)
+    labels: Dict[str, str] = field(default_factory=dict)
     free_resources: Optional[Dict[str, Decimal]] = None
 
     @staticmethod
     def from_node(node: Node) -> "NodeInfo":
-        return NodeInfo(name=node.get_name(), allocatable=node.get_allocatable())
+        return NodeInfo(name=node.get_name(), allocatable=node.get_allocatable(), labels=node.get_labels())
 
     def add(self, pod: Pod) -> None:
-        self.free_resources = None
-        NodeInfo.add_resources(self.requests, pod.get_requests())
-        NodeInfo.add_resources(self.limits, pod.get_limits())
+        self.add_pod_requests_limits(pod.get_requests(), pod.get_limits())
 
-    @staticmethod
-    def add_resources(totals: Dict[str, Decimal], resources_per_container: List[Dict[str, Dict[str, Decimal]]]) -> None:
-        for container in resources_per_container:
-            for _, container_resources in container.items():
-                for resource_name, quantity in container_resources.items():
-                    total = totals.get(resource_name, Decimal(0))
-                    total += quantity
-                    totals[resource_name] = total
+    def remove(self, pod: Pod) -> None:
+        self.remove_pod_requests_limits(pod.get_requests(), pod.get_limits())
+
+    def copy(self) -> "NodeInfo":
+        # allocatable and labels are replaced as a whole on node updates and never mutated in place, so they are shared
+        return NodeInfo(
+            name=self.name,
+            allocatable=self.allocatable,
+            requests=dict(self.requests),
+            limits=dict(self.limits),
+            labels=self.labels,
+        )
 
     def add_pod_requests_limits(self, requests: Dict[str, Decimal], limits: Dict[str, Decimal]) -> None:
         self.free_resources = None
-        for resource_name, quantity in requests.items():
-            total = self.requests.get(resource_name, Decimal(0))
-            total += quantity
-            self.requests[resource_name] = total
+        sum_quantities(self.requests, requests)
+        sum_quantities(self.limits, limits)
 
-        for resource_name, quantity in limits.items():
-            total = self.limits.get(resource_name, Decimal(0))
-            total += quantity
-            self.limits[resource_name] = total
+    def remove_pod_requests_limits(self, requests: Dict[str, Decimal], limits: Dict[str, Decimal]) -> None:
+        self.free_resources = None
+        subtract_quantities(self.requests, requests)
+        subtract_quantities(self.limits, limits)
 
     def get_free_resources(self) -> Dict[str, Decimal]:
         if self.free_resources is None:
@@ -63,14 +65,25 @@ class NodeInfo:
         criteria: List[BidCriteria],
         log: TraceLog,
     ) -> bool:
+        criterio = self.insufficient_resource(requests, limits, criteria)
+        if criterio is not None:
+            log.reject(self.name, criterio)
+            return False
+        return True
+
+    def insufficient_resource(
+        self,
+        requests: Dict[str, Decimal],
+        limits: Dict[str, Decimal],
+        criteria: List[BidCriteria],
+    ) -> Optional[BidCriteria]:
         free_resources = self.get_free_resources()
         for criterio in criteria:
             free = free_resources.get(str(criterio), Decimal(0))
             consume = requests.get(criterio, limits.get(criterio, Decimal(0)))
             if free - consume < 0:
-                log.log(msg=f"Node {self.name} placement rejected. Not enough {criterio}.")
-                return False
-        return True
+                return criterio
+        return None
 
 
 def node_info_comparator(criteria: List[BidCriteria]) -> Callable[[NodeInfo, NodeInfo], int]:
@@ -0,0 +1,75 @@
+from typing import Any, Callable, Iterator, List, Mapping, Optional, Tuple
+
+from sortedcontainers import SortedKeyList
+
+from placement_controller.api.model import BidCriteria
+from placement_controller.resources.trace_log import TraceLog
+
+NodeIndex = int
+# per criterion (0, free amount) for declared resources and (1, 0) for undeclared ones,
+# so nodes without a resource sort last; the trailing node index keeps ties in input order
+SortKey = Tuple[Any, ...]
+
+
+def free_resources_key(free: Mapping[str, Any], criteria: List[BidCriteria], node: NodeIndex) -> SortKey:
+    values = [free.get(criterio) for criterio in criteria]
+    return tuple((0, value) if value is not None else (1, 0) for value in values) + (node,)
+
+
+class NodeOrder:
+    """
+    Nodes sorted ascending by free resources on the bid criteria.
+    The order is kept up to date by re-keying a node after each binding, and the
+    primary criterion is used to skip all nodes that cannot fit with a single bisect.
+    """
+
+    criteria: List[BidCriteria]
+    keys: List[SortKey]
+    entries: SortedKeyList
+
+    def __init__(self, criteria: List[BidCriteria], keys: List[SortKey]):
+        self.criteria = criteria
+        self.keys = keys
+        self.entries = SortedKeyList(range(len(keys)), key=self.keys.__getitem__)
+
+    def update(self, node: NodeIndex, key: SortKey) -> None:
+        # the old key must still be in place to locate the entry
+        self.entries.remove(node)
+        self.keys[node] = key
+        self.entries.add(node)
+
+    def find(
+        self,
+        primary_consume: Any,
+        insufficient: Callable[[NodeIndex], Optional[BidCriteria]],
+        node_name: Callable[[NodeIndex], str],
+        log: TraceLog,
+        reverse: bool = False,
+    ) -> Optional[NodeIndex]:
+        return next(self.fitting(primary_consume, insufficient, node_name, log, reverse), None)
+
+    def fitting(
+        self,
+        primary_consume: Any,
+        insufficient: Callable[[NodeIndex], Optional[BidCriteria]],
+        node_name: Callable[[NodeIndex], str],
+        log: TraceLog,
+        reverse: bool = False,
+    ) -> Iterator[NodeIndex]:
+        """
+        Yields nodes with enough free resources, from the least free (or the most free when reversed).
+        The iterator must not be resumed after the order has been updated.
+        """
+        start = 0
+        if len(self.criteria) > 0:
+            start = self.entries.bisect_key_left(((0, primary_consume),))
+            if start > 0:
+                log.reject(node_name(self.entries[0]), self.criteria[0], start)
+
+        node: NodeIndex
+        for node in self.entries.islice(start, reverse=reverse):
+            criterio = insufficient(node)
+            if criterio is None:
+                yield node
+            else:
+                log.reject(node_name(node), criterio)
@@ -1,22 +1,31 @@
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, Iterator, List, Optional, Set, override
 
-import functools
 from dataclasses import dataclass, field
 from decimal import Decimal
+from enum import StrEnum
 
 from application_client.models.application_spec import ApplicationSpec
 from application_client.models.pod_resources import PodResources
 from application_client.models.resource_id import ResourceId
-from kubernetes.utils.quantity import parse_quantity
 
-from placement_controller.api.model import BidCriteria
-from placement_controller.resources.node_info import NodeInfo, node_info_comparator
+from placement_controller.api.model import BidCriteria, PlacementStrategy
+from placement_controller.resources.node_info import NodeInfo
+from placement_controller.resources.node_order import NodeIndex, NodeOrder, free_resources_key
+from placement_controller.resources.quantity import parse_quantities
+from placement_controller.resources.resource_matrix import ResourceMatrix
 from placement_controller.resources.trace_log import TraceLog
 
 PodName = str
 NodeName = str
 
 
+class PlacementMode(StrEnum):
+    # reference implementation on Decimal resource dictionaries
+    DECIMAL = "decimal"
+    # fixed-point integer resource matrix, see ResourceMatrix
+    FIXED_POINT = "fixed_point"
+
+
 @dataclass
 class PodBinding:
     id: ResourceId
@@ -44,17 +53,35 @@ class PlacementResult:
         self.trace.log("-- placement result --")
         for pod, nodes in self.bound_pods.items():
             nodes_str = ",".join(nodes)
-            self.trace.log(f" - pod {pod} is bound to nodes: {nodes_str}")
+            self.trace.log(" - pod %s is bound to nodes: %s", pod, nodes_str)
         if len(self.unbound_pods) > 0:
             unbouned_pods_str = ",".join(self.unbound_pods)
-            self.trace.log(f" - unbounded pods {unbouned_pods_str}")
+            self.trace.log(" - unbounded pods %s", unbouned_pods_str)
+
+
+@dataclass
+class ReplicaRequest:
+    pod: PodName
+    instance: int
+    requests: Dict[str, Decimal]
+    limits: Dict[str, Decimal]
 
 
 class GreedyPlacement:
+    """
+    Best-fit placement: pods are placed in spec order and every replica is bound
+    to the node with the least free resources that can still host it.
+    """
+
     trace: TraceLog
     nodes: List[NodeInfo]
     spec: ApplicationSpec
     bid_criteria: List[BidCriteria]
+    mode: PlacementMode
+    matrix: Optional[ResourceMatrix]
+    order: NodeOrder
+    # try nodes with the most free resources first
+    reverse: bool = False
 
     def __init__(
         self,
@@ -62,52 +89,192 @@ class GreedyPlacement:
         nodes: List[NodeInfo],
         spec: ApplicationSpec,
         bid_criteria: List[BidCriteria],
+        mode: PlacementMode = PlacementMode.FIXED_POINT,
     ):
         self.trace = trace
-        self.nodes = sorted(nodes, key=functools.cmp_to_key(node_info_comparator(bid_criteria)))
         self.spec = spec
         self.bid_criteria = bid_criteria
+        self.mode = mode
+        self.nodes = nodes
+        if mode == PlacementMode.FIXED_POINT:
+            self.matrix = ResourceMatrix.from_nodes(nodes, bid_criteria)
+        else:
+            self.matrix = None
+            self.order = NodeOrder(
+                bid_criteria,
+                [free_resources_key(node.get_free_resources(), bid_criteria, i) for i, node in enumerate(nodes)],
+            )
 
     def try_place(self) -> PlacementResult:
         placement_result = PlacementResult(self.trace)
         trace = placement_result.trace
-        for resource in self.spec.resources:
-            if isinstance(resource, PodResources):
-                instance = 0
-                requests = {
-                    resource_name: parse_quantity(resource.requests[resource_name])
-                    for resource_name in resource.requests.additional_keys
-                }
-                limits = {
-                    resource_name: parse_quantity(resource.limits[resource_name])
-                    for resource_name in resource.limits.additional_keys
-                }
-                while instance < resource.replica:
-                    node_info = self.find_node(requests, limits, trace)
-                    if node_info is not None:
-                        node_info.add_pod_requests_limits(requests, limits)
-                        placement_result.bind_pod(namespaced_name(resource.id), node_info.name)
-                        trace.log(
-                            f"Instance {instance} of pod {namespaced_name(resource.id)} "
-                            + f"is assigned to node {node_info.name}.",
-                        )
-                    else:
-                        placement_result.unbind_pod(namespaced_name(resource.id))
-                        trace.log(
-                            f"Failed to bind replica #{instance} of pod {namespaced_name(resource.id)}.",
-                        )
-                    instance += 1
+        for replica in self.replicas():
+            node_name = self.place_replica(replica.pod, replica.requests, replica.limits, trace)
+            trace.flush_rejections()
+            if node_name is not None:
+                placement_result.bind_pod(replica.pod, node_name)
+                trace.log("Instance %d of pod %s is assigned to node %s.", replica.instance, replica.pod, node_name)
+            else:
+                placement_result.unbind_pod(replica.pod)
+                trace.log("Failed to bind replica #%d of pod %s.", replica.instance, replica.pod)
         placement_result.log_result_placement()
         return placement_result
 
+    def replicas(self) -> List[ReplicaRequest]:
+        replicas = []
+        for resource in self.spec.resources:
+            if isinstance(resource, PodResources):
+                pod = namespaced_name(resource.id)
+                requests = parse_quantities(resource.requests.additional_properties)
+                limits = parse_quantities(resource.limits.additional_properties)
+                for instance in range(resource.replica):
+                    replicas.append(ReplicaRequest(pod, instance, requests, limits))
+        return replicas
+
+    def place_replica(
+        self, pod: PodName, requests: Dict[str, Decimal], limits: Dict[str, Decimal], trace: TraceLog
+    ) -> Optional[NodeName]:
+        node = self.find_node(pod, requests, limits, trace)
+        if node is None:
+            return None
+        return self.bind(pod, node, requests, limits)
+
     def find_node(
+        self, pod: PodName, requests: Dict[str, Decimal], limits: Dict[str, Decimal], trace: TraceLog
+    ) -> Optional[NodeIndex]:
+        return next(self.fitting_nodes(requests, limits, trace), None)
+
+    def fitting_nodes(
         self, requests: Dict[str, Decimal], limits: Dict[str, Decimal], trace: TraceLog
-    ) -> Optional[NodeInfo]:
-        for node_info in self.nodes:
-            can_place = node_info.try_place(requests, limits, self.bid_criteria, trace)
-            if can_place:
-                return node_info
-        return None
+    ) -> Iterator[NodeIndex]:
+        if self.matrix is not None:
+            return self.matrix.fitting(requests, limits, trace, self.reverse)
+        primary_consume = Decimal(0)
+        if len(self.bid_criteria) > 0:
+            primary = self.bid_criteria[0]
+            primary_consume = requests.get(primary, limits.get(primary, Decimal(0)))
+        return self.order.fitting(
+            primary_consume,
+            lambda node: self.nodes[node].insufficient_resource(requests, limits, self.bid_criteria),
+            lambda node: self.nodes[node].name,
+            trace,
+            self.reverse,
+        )
+
+    def bind(self, pod: PodName, node: NodeIndex, requests: Dict[str, Decimal], limits: Dict[str, Decimal]) -> NodeName:
+        if self.matrix is not None:
+            return self.matrix.bind(node, requests, limits)
+        node_info = self.nodes[node]
+        node_info.add_pod_requests_limits(requests, limits)
+        self.order.update(node, free_resources_key(node_info.get_free_resources(), self.bid_criteria, node))
+        return node_info.name
+
+
+class WorstFitPlacement(GreedyPlacement):
+    """
+    Pods are placed in spec order and every replica is bound to the node with the most free resources.
+    """
+
+    reverse = True
+
+
+class FirstFitDecreasingPlacement(GreedyPlacement):
+    """
+    Bin packing over all pods of the spec: replicas are placed largest first,
+    ordered by their consumption of the bid criteria in criteria order.
+    """
+
+    @override
+    def replicas(self) -> List[ReplicaRequest]:
+        def size(replica: ReplicaRequest) -> List[Decimal]:
+            return [
+                replica.requests.get(criterio, replica.limits.get(criterio, Decimal(0)))
+                for criterio in self.bid_criteria
+            ]
+
+        # sorting is stable, equally sized replicas keep spec order
+        return sorted(super().replicas(), key=size, reverse=True)
+
+
+HOSTNAME_LABEL = "kubernetes.io/hostname"
+
+
+class SpreadPlacement(GreedyPlacement):
+    """
+    Replicas of every pod are spread over topology domains, the values of the topology label of the nodes.
+    A replica goes to the fitting domain with the fewest replicas of the same pod,
+    nodes with more free resources are preferred within equally used domains.
+    Nodes without the label form a domain of their own.
+    """
+
+    reverse = True
+    topology_key: str
+    domain_replicas: Dict[PodName, Dict[str, int]]
+
+    def __init__(
+        self,
+        trace: TraceLog,
+        nodes: List[NodeInfo],
+        spec: ApplicationSpec,
+        bid_criteria: List[BidCriteria],
+        mode: PlacementMode = PlacementMode.FIXED_POINT,
+        topology_key: str = HOSTNAME_LABEL,
+    ):
+        super().__init__(trace, nodes, spec, bid_criteria, mode)
+        self.topology_key = topology_key
+        self.domain_replicas = dict()
+
+    def domain(self, node: NodeIndex) -> str:
+        node_info = self.nodes[node]
+        return node_info.labels.get(self.topology_key, node_info.name)
+
+    @override
+    def find_node(
+        self, pod: PodName, requests: Dict[str, Decimal], limits: Dict[str, Decimal], trace: TraceLog
+    ) -> Optional[NodeIndex]:
+        replicas = self.domain_replicas.get(pod, {})
+        best_node: Optional[NodeIndex] = None
+        best_count = 0
+        for node in self.fitting_nodes(requests, limits, trace):
+            count = replicas.get(self.domain(node), 0)
+            if best_node is None or count < best_count:
+                best_node, best_count = node, count
+            if best_count == 0:
+                break
+        return best_node
+
+    @override
+    def bind(self, pod: PodName, node: NodeIndex, requests: Dict[str, Decimal], limits: Dict[str, Decimal]) -> NodeName:
+        replicas = self.domain_replicas.setdefault(pod, {})
+        domain = self.domain(node)
+        replicas[domain] = replicas.get(domain, 0) + 1
+        return super().bind(pod, node, requests, limits)
+
+
+PlacementFactory = Callable[[TraceLog, List[NodeInfo], ApplicationSpec, List[BidCriteria]], GreedyPlacement]
+
+PLACEMENT_STRATEGIES: Dict[PlacementStrategy, PlacementFactory] = {
+    PlacementStrategy.best_fit: GreedyPlacement,
+    PlacementStrategy.worst_fit: WorstFitPlacement,
+    PlacementStrategy.first_fit_decreasing: FirstFitDecreasingPlacement,
+    PlacementStrategy.spread: SpreadPlacement,
+}
+
+
+def create_placement(
+    strategy: PlacementStrategy,
+    trace: TraceLog,
+    nodes: List[NodeInfo],
+    spec: ApplicationSpec,
+    bid_criteria: List[BidCriteria],
+    topology_key: str = HOSTNAME_LABEL,
+) -> GreedyPlacement:
+    if strategy == PlacementStrategy.spread:
+        return SpreadPlacement(trace, nodes, spec, bid_criteria, topology_key=topology_key)
+    factory = PLACEMENT_STRATEGIES.get(strategy)
+    if factory is None:
+        raise ValueError(f"Unknown placement strategy {strategy}")
+    return factory(trace, nodes, spec, bid_criteria)
 
 
 def namespaced_name(id: ResourceId) -> str:
@@ -1,33 +1,44 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
+from dataclasses import dataclass, field
 from decimal import Decimal
 
-from kubernetes.utils.quantity import parse_quantity
-
 from placement_controller.clients.k8s.resource import BaseResource
+from placement_controller.resources.quantity import parse_quantities, sum_quantities
+
+
+@dataclass(frozen=True)
+class PodQuantities:
+    resource_version: Optional[str]
+    # totals over all containers of the pod
+    requests: Dict[str, Decimal] = field(default_factory=dict)
+    limits: Dict[str, Decimal] = field(default_factory=dict)
+
+    @staticmethod
+    def parse(object: Dict[str, Any]) -> "PodQuantities":
+        metadata = object.get("metadata") or {}
+        spec = object.get("spec") or {}
+        containers = spec.get("containers") or []
+        quantities = PodQuantities(resource_version=metadata.get("resourceVersion"))
+        for container in containers:
+            resources = container.get("resources") or {}
+            sum_quantities(quantities.requests, parse_quantities(resources.get("requests") or {}))
+            sum_quantities(quantities.limits, parse_quantities(resources.get("limits") or {}))
+        return quantities
 
 
 class Pod(BaseResource):
+    quantities: PodQuantities
+
     def __init__(self, object: Dict[str, Any]):
         super().__init__(object)
+        self.quantities = PodQuantities.parse(object)
 
     def get_node_name(self) -> Optional[str]:
         return self.object["spec"].get("nodeName")  # type: ignore
 
-    def get_requests(self) -> List[Dict[str, Dict[str, Decimal]]]:
-        return self.get_resources("requests")
+    def get_requests(self) -> Dict[str, Decimal]:
+        return self.quantities.requests
 
-    def get_limits(self) -> List[Dict[str, Dict[str, Decimal]]]:
-        return self.get_resources("limits")
-
-    def get_resources(self, resource_bound: str) -> List[Dict[str, Dict[str, Decimal]]]:
-        spec = self.object.get("spec") or {}
-        containers = spec.get("containers") or {}
-        quantities: List[Dict[str, Dict[str, Decimal]]] = []
-        for container in containers:
-            name = container["name"]
-            resources = container.get("resources") or {}
-            requests = resources.get(resource_bound) or {}
-            parsed = {resource: parse_quantity(q) for resource, q in requests.items()}
-            quantities.append({name: parsed})
-        return quantities
+    def get_limits(self) -> Dict[str, Decimal]:
+        return self.quantities.limits
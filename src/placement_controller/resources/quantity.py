@@ -0,0 +1,33 @@
+from typing import Any, Dict, Mapping
+
+import functools
+from decimal import Decimal
+
+from kubernetes.utils.quantity import parse_quantity as kube_parse_quantity
+
+# the number of distinct quantity literals in a cluster is small ("100m", "128Mi", ...),
+# so memoizing the parser turns repeated parsing into a dictionary lookup
+QUANTITY_CACHE_SIZE: int = 4096
+
+
+@functools.lru_cache(maxsize=QUANTITY_CACHE_SIZE, typed=True)
+def parse_quantity(quantity: str | int | float) -> Decimal:
+    return kube_parse_quantity(quantity)  # type: ignore[no-any-return]
+
+
+def parse_quantities(quantities: Mapping[str, Any]) -> Dict[str, Decimal]:
+    return {resource: parse_quantity(quantity) for resource, quantity in quantities.items()}
+
+
+def sum_quantities(totals: Dict[str, Decimal], quantities: Mapping[str, Decimal]) -> None:
+    for resource, quantity in quantities.items():
+        totals[resource] = totals.get(resource, Decimal(0)) + quantity
+
+
+def subtract_quantities(totals: Dict[str, Decimal], quantities: Mapping[str, Decimal]) -> None:
+    for resource, quantity in quantities.items():
+        total = totals.get(resource, Decimal(0)) - quantity
+        if total > 0:
+            totals[resource] = total
+        else:
+            totals.pop(resource, None)
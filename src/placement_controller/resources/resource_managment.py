@@ -1,13 +1,24 @@
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import json
 
 from application_client.models.application_spec import ApplicationSpec
 
-from placement_controller.api.model import BidRequestModel, BidResponseModel, BidStatus, TraceLogRowModel
+from placement_controller.api.model import (
+    SPEC_NOT_FOUND,
+    BidRequestModel,
+    BidResponseModel,
+    BidStatus,
+    ErrorResponse,
+    PlacementStrategy,
+    TraceLogRowModel,
+)
 from placement_controller.clients.k8s.client import KubeClient
-from placement_controller.resources.placement import GreedyPlacement
-from placement_controller.resources.trace_log import TraceLog
+from placement_controller.resources.bid_cache import BidCache, BidCacheKey, CachedPlacement
+from placement_controller.resources.bid_spec_cache import BidSpecCache
+from placement_controller.resources.node_info import NodeInfo
+from placement_controller.resources.placement import HOSTNAME_LABEL, create_placement
+from placement_controller.resources.trace_log import TraceLog, TraceSettings
 from placement_controller.resources.types import ResourceManagement, ResourceMetrics, ResourceTracking
 from placement_controller.util.clock import Clock
 
@@ -18,6 +29,11 @@ class ResourceManagementImpl(ResourceManagement):
     client: KubeClient
     resource_tracking: ResourceTracking
     resource_metrics: ResourceMetrics
+    strategy: PlacementStrategy
+    spread_topology_key: str
+    bid_cache: BidCache
+    spec_cache: BidSpecCache
+    trace_settings: TraceSettings
 
     def __init__(
         self,
@@ -26,30 +42,89 @@ class ResourceManagementImpl(ResourceManagement):
         client: KubeClient,
         resource_tracking: ResourceTracking,
         resource_metrics: ResourceMetrics,
+        strategy: PlacementStrategy = PlacementStrategy.best_fit,
+        bid_cache_size: int = 0,
+        trace_settings: Optional[TraceSettings] = None,
+        spec_cache_size: int = 0,
+        spread_topology_key: str = HOSTNAME_LABEL,
     ):
         self.zone = zone
         self.client = client
         self.clock = clock
         self.resource_tracking = resource_tracking
         self.resource_metrics = resource_metrics
+        self.strategy = strategy
+        self.spread_topology_key = spread_topology_key
+        self.bid_cache = BidCache(bid_cache_size)
+        self.spec_cache = BidSpecCache(spec_cache_size)
+        self.trace_settings = trace_settings or TraceSettings()
 
-    def application_bid(self, bid: BidRequestModel) -> BidResponseModel:
-        nodes = self.resource_tracking.list_nodes()
-        app_spec: Dict[str, Any] = json.loads(bid.spec)
-        spec = ApplicationSpec.from_dict(app_spec)
-        name = bid.name.to_domain()
-        trace_log = TraceLog(self.zone, name, clock=self.clock)
-        placement = GreedyPlacement(trace_log, nodes, spec, bid.bid_criteria)
+    def application_bid(self, bid: BidRequestModel) -> Union[BidResponseModel, ErrorResponse]:
+        return self.bid(bid, self.resource_tracking.get_version(), self.resource_tracking.list_nodes)
 
-        result = placement.try_place()
-        status = BidStatus.accepted if result.is_success() else BidStatus.rejected
+    def application_bids(self, bids: List[BidRequestModel]) -> List[Union[BidResponseModel, ErrorResponse]]:
+        version = self.resource_tracking.get_version()
+        snapshot: Optional[List[NodeInfo]] = None
+
+        def list_nodes() -> List[NodeInfo]:
+            nonlocal snapshot
+            # nodes are listed once per batch, placement mutates node infos, therefore every bid gets a copy
+            if snapshot is None:
+                snapshot = self.resource_tracking.list_nodes()
+            return [node_info.copy() for node_info in snapshot]
 
+        responses: List[Union[BidResponseModel, ErrorResponse]] = []
+        for bid in bids:
+            try:
+                responses.append(self.bid(bid, version, list_nodes))
+            except Exception as e:
+                responses.append(ErrorResponse(status=500, code="INTERNAL_ERROR", msg=str(e)))
+        return responses
+
+    def bid(
+        self, bid: BidRequestModel, version: int, list_nodes: Callable[[], List[NodeInfo]]
+    ) -> Union[BidResponseModel, ErrorResponse]:
+        digest = bid.get_spec_digest()
+        spec = self.resolve_spec(bid, digest)
+        if spec is None:
+            return ErrorResponse(
+                status=404, code=SPEC_NOT_FOUND, msg=f"Spec {digest} is not known, send it with the bid."
+            )
+        strategy = bid.strategy or self.strategy
+
+        key = BidCacheKey.from_bid(bid, digest, strategy)
+        placement = self.bid_cache.get(key, version)
+        if placement is None:
+            placement = self.place(bid, spec, strategy, list_nodes())
+            self.bid_cache.put(key, version, placement)
+
+        # metric estimates follow live metric values, therefore they are not cached
         estimates = self.resource_metrics.estimate(spec, list(bid.metrics))
-        trace_rows = [TraceLogRowModel.from_domain(log_row) for log_row in result.trace.get_raw()]
         return BidResponseModel(
             id=bid.id,
-            status=status,
-            reason=result.reason,
-            trace=trace_rows,
+            status=placement.status,
+            reason=placement.reason,
+            trace=list(placement.trace),
             metrics=estimates,
+            spec_digest=digest if self.spec_cache.max_size > 0 else None,
         )
+
+    def resolve_spec(self, bid: BidRequestModel, digest: str) -> Optional[ApplicationSpec]:
+        spec = self.spec_cache.get(digest)
+        if spec is None and bid.spec is not None:
+            app_spec: Dict[str, Any] = json.loads(bid.spec)
+            spec = ApplicationSpec.from_dict(app_spec)
+            self.spec_cache.put(digest, spec)
+        return spec
+
+    def place(
+        self, bid: BidRequestModel, spec: ApplicationSpec, strategy: PlacementStrategy, nodes: List[NodeInfo]
+    ) -> CachedPlacement:
+        name = bid.name.to_domain()
+        trace_log = TraceLog.from_settings(self.zone, name, self.clock, self.trace_settings)
+        placement = create_placement(strategy, trace_log, nodes, spec, bid.bid_criteria, self.spread_topology_key)
+
+        result = placement.try_place()
+        status = BidStatus.accepted if result.is_success() else BidStatus.rejected
+        trace_rows = [TraceLogRowModel.from_domain(log_row) for log_row in result.trace.get_raw()]
+        return CachedPlacement(status=status, reason=result.reason, trace=trace_rows)
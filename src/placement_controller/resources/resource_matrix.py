@@ -0,0 +1,110 @@
+from typing import Dict, Iterator, List, Optional
+
+from dataclasses import dataclass
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
+
+from placement_controller.api.model import BidCriteria
+from placement_controller.resources.node_info import NodeInfo
+from placement_controller.resources.node_order import NodeIndex, NodeOrder, SortKey, free_resources_key
+from placement_controller.resources.trace_log import TraceLog
+
+MILLI: int = 1000
+
+
+def to_milli(quantity: Decimal, rounding: str) -> int:
+    return int((quantity * MILLI).to_integral_value(rounding=rounding))
+
+
+def to_milli_or_none(quantity: Optional[Decimal], rounding: str) -> Optional[int]:
+    return to_milli(quantity, rounding) if quantity is not None else None
+
+
+@dataclass
+class ResourceMatrix:
+    """
+    Fixed-point (milli-unit) view of node resources restricted to the bid criteria.
+    Every column holds one value per node; nodes are selected through a NodeOrder on the free columns.
+
+    Allocatable amounts are rounded down and requested amounts are rounded up,
+    which keeps decisions identical to the Decimal path for milli-precision quantities
+    and conservative otherwise.
+    """
+
+    criteria: List[BidCriteria]
+    nodes: List[NodeInfo]
+    # [criterion][node]; None means the node does not declare the resource
+    allocatable: List[List[Optional[int]]]
+    requests: List[List[Optional[int]]]
+    limits: List[List[Optional[int]]]
+    free: List[List[int]]
+    order: NodeOrder
+
+    @staticmethod
+    def from_nodes(nodes: List[NodeInfo], criteria: List[BidCriteria]) -> "ResourceMatrix":
+        allocatable = [[to_milli_or_none(node.allocatable.get(c), ROUND_FLOOR) for node in nodes] for c in criteria]
+        requests = [[to_milli_or_none(node.requests.get(c), ROUND_CEILING) for node in nodes] for c in criteria]
+        limits = [[to_milli_or_none(node.limits.get(c), ROUND_CEILING) for node in nodes] for c in criteria]
+        matrix = ResourceMatrix(
+            criteria=criteria,
+            nodes=nodes,
+            allocatable=allocatable,
+            requests=requests,
+            limits=limits,
+            free=[[0] * len(nodes) for _ in criteria],
+            order=NodeOrder(criteria, []),
+        )
+        for column in range(len(criteria)):
+            for node in range(len(nodes)):
+                matrix.update_free(column, node)
+        matrix.order = NodeOrder(criteria, [matrix.sort_key(node) for node in range(len(nodes))])
+        return matrix
+
+    def update_free(self, column: int, node: NodeIndex) -> None:
+        allocatable = self.allocatable[column][node]
+        if allocatable is None:
+            self.free[column][node] = 0
+            return
+        requested = self.requests[column][node]
+        used = requested if requested is not None else self.limits[column][node]
+        self.free[column][node] = allocatable - (used or 0)
+
+    def sort_key(self, node: NodeIndex) -> SortKey:
+        free = {
+            str(c): self.free[column][node]
+            for column, c in enumerate(self.criteria)
+            if self.allocatable[column][node] is not None
+        }
+        return free_resources_key(free, self.criteria, node)
+
+    def consumption(self, requests: Dict[str, Decimal], limits: Dict[str, Decimal]) -> List[int]:
+        return [to_milli(requests.get(c, limits.get(c, Decimal(0))), ROUND_CEILING) for c in self.criteria]
+
+    def first_insufficient(self, node: NodeIndex, consume: List[int]) -> Optional[BidCriteria]:
+        for column, amount in enumerate(consume):
+            if self.free[column][node] < amount:
+                return self.criteria[column]
+        return None
+
+    def bind(self, node: NodeIndex, requests: Dict[str, Decimal], limits: Dict[str, Decimal]) -> str:
+        for column, criterio in enumerate(self.criteria):
+            request = requests.get(criterio)
+            if request is not None:
+                self.requests[column][node] = (self.requests[column][node] or 0) + to_milli(request, ROUND_CEILING)
+            limit = limits.get(criterio)
+            if limit is not None:
+                self.limits[column][node] = (self.limits[column][node] or 0) + to_milli(limit, ROUND_CEILING)
+            self.update_free(column, node)
+        self.order.update(node, self.sort_key(node))
+        return self.nodes[node].name
+
+    def fitting(
+        self, requests: Dict[str, Decimal], limits: Dict[str, Decimal], log: TraceLog, reverse: bool = False
+    ) -> Iterator[NodeIndex]:
+        consume = self.consumption(requests, limits)
+        return self.order.fitting(
+            consume[0] if len(consume) > 0 else 0,
+            lambda node: self.first_insufficient(node, consume),
+            lambda node: self.nodes[node].name,
+            log,
+            reverse,
+        )
@@ -1,6 +1,7 @@
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import asyncio
+import re
 from dataclasses import dataclass
 from decimal import Decimal
 from enum import StrEnum
@@ -9,13 +10,13 @@ from time import time
 from application_client.models.application_spec import ApplicationSpec
 from application_client.models.pod_resources import PodResources
 from application_client.models.pvc_resources import PVCResources
-from kubernetes.utils.quantity import parse_quantity
 from loguru import logger
 from pydantic import field_validator
 from pydantic_settings import BaseSettings
 
 from placement_controller.api.model import Metric, MetricValue
-from placement_controller.clients.metrics.types import MetricsClient
+from placement_controller.clients.metrics.types import Labels, MetricsClient
+from placement_controller.resources.quantity import parse_quantities
 from placement_controller.resources.types import ResourceMetrics
 
 ResourceName = str
@@ -49,6 +50,10 @@ class PrometheusMetricDefinition:
 class MetricSettings(BaseSettings):
     static_metrics: List[MetricDefinition]
     prometheus_metrics: Optional[List[PrometheusMetricDefinition]] = None
+    # prometheus queries running at the same time
+    prometheus_max_concurrency: int = 4
+    # refresh interval of series that do not change backs off up to this value
+    prometheus_max_update_interval: float = 30.0
 
 
 class ResourceMetricsImpl(ResourceMetrics):
@@ -61,25 +66,13 @@ class ResourceMetricsImpl(ResourceMetrics):
         estimates: Dict[Metric, Decimal] = {m: Decimal(0.0) for m in metrics}
         for resource in spec.resources:
             if isinstance(resource, PodResources):
-                requests = {
-                    resource_name: parse_quantity(resource.requests[resource_name])
-                    for resource_name in resource.requests.additional_keys
-                }
-                limits = {
-                    resource_name: parse_quantity(resource.limits[resource_name])
-                    for resource_name in resource.limits.additional_keys
-                }
+                requests = parse_quantities(resource.requests.additional_properties)
+                limits = parse_quantities(resource.limits.additional_properties)
 
                 self.estimate_metric(estimates, requests, limits, resource.replica)
             elif isinstance(resource, PVCResources):
-                requests = {
-                    resource_name: parse_quantity(resource.requests[resource_name])
-                    for resource_name in resource.requests.additional_keys
-                }
-                limits = {
-                    resource_name: parse_quantity(resource.limits[resource_name])
-                    for resource_name in resource.limits.additional_keys
-                }
+                requests = parse_quantities(resource.requests.additional_properties)
+                limits = parse_quantities(resource.limits.additional_properties)
 
                 self.estimate_metric(estimates, requests, limits, resource.replica)
             else:
@@ -132,14 +125,77 @@ class CachedMetricValue:
     query_time: float
 
 
+@dataclass
+class DefinitionState:
+    """Freshness of a single prometheus definition"""
+
+    definition: PrometheusMetricDefinition
+    # current refresh interval, doubled while the value does not change
+    interval: float
+    last_attempt: Optional[float] = None
+    last_success: Optional[float] = None
+    last_value: Optional[Decimal] = None
+    is_refreshing: bool = False
+
+    def is_due(self, now: float) -> bool:
+        if self.is_refreshing:
+            return False
+        return self.last_attempt is None or now - self.last_attempt >= self.interval
+
+
+PLAIN_METRIC_NAME = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+
+
+def batch_definitions(states: List[DefinitionState]) -> List[List[DefinitionState]]:
+    """
+    Groups definitions that select the same metric by name, so they can be fetched with one query.
+    Definitions with any other PromQL expression are queried on their own.
+    """
+    batches: Dict[str, List[DefinitionState]] = {}
+    singles: List[List[DefinitionState]] = []
+    for state in states:
+        query = state.definition.query
+        if PLAIN_METRIC_NAME.match(query):
+            batches.setdefault(query, []).append(state)
+        else:
+            singles.append([state])
+    return list(batches.values()) + singles
+
+
+def batch_matchers(batch: List[DefinitionState]) -> Dict[str, List[str]]:
+    # only labels used by every definition can narrow the query, the rest is matched after the query
+    common = set.intersection(*[set(state.definition.labels.keys()) for state in batch])
+    return {label: sorted({state.definition.labels[label] for state in batch}) for label in sorted(common)}
+
+
+def select_series(series: List[Tuple[Labels, float]], labels: Dict[str, str]) -> Optional[float]:
+    for series_labels, value in series:
+        if all(series_labels.get(label) == label_value for label, label_value in labels.items()):
+            return value
+    return None
+
+
 class DynamicResourceMetrics(ResourceMetrics):
+    """
+    Estimates read only from the cache, prometheus is queried in the background by prometheus_update_loop.
+    Definitions selecting the same metric name are fetched with one query, queries run concurrently up to
+    prometheus_max_concurrency, and series that do not change are refreshed less often.
+
+    A cached value is fresh for cache_ttl_seconds. Afterwards it is still served for up to
+    stale_ttl_seconds while a refresh is triggered, and the static estimate is used once it is older.
+    """
+
     static_metrics: ResourceMetricsImpl
     client: MetricsClient
     prometheus_definitions: List[PrometheusMetricDefinition]
+    definition_states: List[DefinitionState]
     cache: Dict[str, CachedMetricValue]
     cache_ttl_seconds: int = 60
-    last_update: Optional[float] = None
+    stale_ttl_seconds: int = 300
     prometheus_update_interval: float = 1.0
+    max_update_interval: float
+    query_slots: asyncio.Semaphore
+    revalidation: Optional[asyncio.Task[None]]
     is_terminated: asyncio.Event
 
     def __init__(
@@ -153,27 +209,29 @@ class DynamicResourceMetrics(ResourceMetrics):
         self.static_metrics = ResourceMetricsImpl(config=static_config)
         self.client = client
         self.prometheus_definitions = prometheus_definitions
+        self.definition_states = [
+            DefinitionState(definition, interval=prometheus_update_interval) for definition in prometheus_definitions
+        ]
         self.cache = dict()
         self.prometheus_update_interval = prometheus_update_interval
+        # backing off beyond the cache ttl would let unchanged values expire
+        self.max_update_interval = min(static_config.prometheus_max_update_interval, self.cache_ttl_seconds / 2)
+        self.query_slots = asyncio.Semaphore(max(static_config.prometheus_max_concurrency, 1))
+        self.revalidation = None
         self.is_terminated = is_terminated
 
     def estimate(self, spec: ApplicationSpec, metrics: List[Metric]) -> List[MetricValue]:
         static_estimates = self.static_metrics.estimate(spec, metrics)
 
-        self._update_prometheus_metrics()
-
         results = []
+        now = time()
         for metric in metrics:
-            if metric in self.cache:
-                cache_entry = self.cache[metric]
-                if self._is_cache_valid(cache_entry):
-                    results.append(cache_entry.value)
-                else:
-                    static_value = next((v for v in static_estimates if v.id == metric), None)
-                    if static_value:
-                        results.append(static_value)
-                    else:
-                        results.append(MetricValue(id=metric, value=Decimal(0), unit=metric.unit()))
+            cache_entry = self.cache.get(metric)
+            age = now - cache_entry.query_time if cache_entry is not None else None
+            if cache_entry is not None and age is not None and self._is_servable(age):
+                if not self._is_fresh(age):
+                    self._revalidate()
+                results.append(cache_entry.value)
             else:
                 static_value = next((v for v in static_estimates if v.id == metric), None)
                 if static_value:
@@ -183,57 +241,77 @@ class DynamicResourceMetrics(ResourceMetrics):
 
         return results
 
-    def _should_update_prometheus(self) -> bool:
-        if self.last_update is None:
-            return True
-        return time() - self.last_update >= self.prometheus_update_interval
+    def _is_fresh(self, age: float) -> bool:
+        return self.cache_ttl_seconds <= 0 or age < self.cache_ttl_seconds
+
+    def _is_servable(self, age: float) -> bool:
+        return self._is_fresh(age) or age < self.cache_ttl_seconds + self.stale_ttl_seconds
 
-    def _update_prometheus_metrics(self) -> None:
-        if not self._should_update_prometheus():
+    def _revalidate(self) -> None:
+        if self.revalidation is not None and not self.revalidation.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # no loop to refresh on, the update loop will catch up
             return
-        current_time = time()
-        for prom_def in self.prometheus_definitions:
-            result = self.client.get_metric_sync(prom_def.query, prom_def.labels)
-            if result and "value" in result:
-                value = Decimal(str(result["value"]))
-                metric_value = MetricValue(
-                    id=prom_def.metric, value=value.quantize(Decimal("1.0001")), unit=prom_def.metric.unit()
-                )
-                self.cache[prom_def.metric] = CachedMetricValue(value=metric_value, query_time=current_time)
-            elif prom_def.default_value is not None:
-                metric_value = MetricValue(
-                    id=prom_def.metric,
-                    value=prom_def.default_value.quantize(Decimal("1.0001")),
-                    unit=prom_def.metric.unit(),
-                )
-                self.cache[prom_def.metric] = CachedMetricValue(value=metric_value, query_time=current_time)
-        self.last_update = current_time
-
-    def _is_cache_valid(self, entry: CachedMetricValue) -> bool:
-        if self.cache_ttl_seconds <= 0:
-            return True
-        return time() - entry.query_time < self.cache_ttl_seconds
+        self.revalidation = loop.create_task(self.refresh(force=True))
+
+    async def refresh(self, force: bool = False) -> None:
+        now = time()
+        due = [state for state in self.definition_states if (force and not state.is_refreshing) or state.is_due(now)]
+        await asyncio.gather(*[self._refresh_batch(batch) for batch in batch_definitions(due)])
+
+    async def _refresh_batch(self, batch: List[DefinitionState]) -> None:
+        for state in batch:
+            state.is_refreshing = True
+            state.last_attempt = time()
+        try:
+            async with self.query_slots:
+                values = await self._query_batch(batch)
+            current_time = time()
+            for state, value in zip(batch, values):
+                self._store(state, value, current_time)
+        except Exception as e:
+            queries = ", ".join({state.definition.query for state in batch})
+            logger.warning(f"Failed to query prometheus metrics {queries}: {e}")
+        finally:
+            for state in batch:
+                state.is_refreshing = False
+
+    async def _query_batch(self, batch: List[DefinitionState]) -> List[Optional[float]]:
+        if len(batch) == 1:
+            prom_def = batch[0].definition
+            result = await self.client.get_metric(prom_def.query, prom_def.labels)
+            return [result["value"] if result and "value" in result else None]
+        series = await self.client.get_series(batch[0].definition.query, batch_matchers(batch))
+        return [select_series(series, state.definition.labels) for state in batch]
+
+    def _store(self, state: DefinitionState, result: Optional[float], current_time: float) -> None:
+        prom_def = state.definition
+        value: Optional[Decimal] = None
+        if result is not None:
+            value = Decimal(str(result))
+        elif prom_def.default_value is not None:
+            value = prom_def.default_value
+        if value is not None:
+            metric_value = MetricValue(
+                id=prom_def.metric, value=value.quantize(Decimal("1.0001")), unit=prom_def.metric.unit()
+            )
+            self.cache[prom_def.metric] = CachedMetricValue(value=metric_value, query_time=current_time)
+
+        if value is not None and value == state.last_value:
+            state.interval = min(state.interval * 2, max(self.max_update_interval, self.prometheus_update_interval))
+        else:
+            state.interval = self.prometheus_update_interval
+        state.last_value = value
+        state.last_success = current_time
 
     async def prometheus_update_loop(self) -> None:
         while not self.is_terminated.is_set():
             try:
+                await self.refresh()
                 await asyncio.sleep(self.prometheus_update_interval)
-                current_time = time()
-                for prom_def in self.prometheus_definitions:
-                    result = await self.client.get_metric(prom_def.query, prom_def.labels)
-                    if result and "value" in result:
-                        value = Decimal(str(result["value"]))
-                        metric_value = MetricValue(
-                            id=prom_def.metric, value=value.quantize(Decimal("1.0001")), unit=prom_def.metric.unit()
-                        )
-                        self.cache[prom_def.metric] = CachedMetricValue(value=metric_value, query_time=current_time)
-                    elif prom_def.default_value is not None:
-                        metric_value = MetricValue(
-                            id=prom_def.metric,
-                            value=prom_def.default_value.quantize(Decimal("1.0001")),
-                            unit=prom_def.metric.unit(),
-                        )
-                        self.cache[prom_def.metric] = CachedMetricValue(value=metric_value, query_time=current_time)
             except asyncio.CancelledError:
                 logger.error("_prometheus_update_loop is cancelled")
                 break
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Optional
 
 import asyncio
 
@@ -9,6 +9,8 @@ from placement_controller.resources.node_info import NodeInfo
 from placement_controller.resources.pod import Pod
 from placement_controller.resources.types import ResourceTracking
 
+NodeName = str
+
 
 class ResourceTrackingImpl(ResourceTracking):
     node_pool: ObjectPool[Node]
@@ -17,9 +19,22 @@ class ResourceTrackingImpl(ResourceTracking):
     pod_task: asyncio.Task[None]
     is_terminated: asyncio.Event
 
+    # aggregated requests/limits per node name, including nodes that are not (yet) known to the node pool
+    node_usage: Dict[NodeName, NodeInfo]
+    # nodes known to the node pool, sharing NodeInfo instances with node_usage
+    nodes: Dict[NodeName, NodeInfo]
+    version: int
+
     def __init__(self, client: KubeClient, is_terminated: asyncio.Event):
-        self.node_pool = ObjectPool[Node](Node, client, GroupVersionKind("", "v1", "Node"), is_terminated)
-        self.pod_pool = ObjectPool[Pod](Pod, client, GroupVersionKind("", "v1", "Pod"), is_terminated)
+        self.node_usage = dict()
+        self.nodes = dict()
+        self.version = 0
+        self.node_pool = ObjectPool[Node](
+            Node, client, GroupVersionKind("", "v1", "Node"), is_terminated, self.on_node_change
+        )
+        self.pod_pool = ObjectPool[Pod](
+            Pod, client, GroupVersionKind("", "v1", "Pod"), is_terminated, self.on_pod_change
+        )
 
     async def start(self) -> None:
         await asyncio.gather(self.node_pool.start(), self.pod_pool.start())
@@ -28,11 +43,66 @@ class ResourceTrackingImpl(ResourceTracking):
         return all([self.node_pool.is_subscription_active(), self.pod_pool.is_subscription_active()])
 
     def list_nodes(self) -> List[NodeInfo]:
-        nodes = {node.get_name(): NodeInfo.from_node(node) for node in self.node_pool.get_objects()}
-        for pod in self.pod_pool.get_objects():
-            node_name = pod.get_node_name()
-            if node_name:
-                node_info = nodes.get(node_name)
-                if node_info:
-                    node_info.add(pod)
-        return list(nodes.values())
+        # placement mutates node infos while binding pods, therefore every bid gets its own copy
+        return [node_info.copy() for node_info in self.nodes.values()]
+
+    def get_version(self) -> int:
+        return self.version
+
+    def on_node_change(self, previous: Optional[Node], current: Optional[Node]) -> None:
+        if previous is not None and current is not None and is_same_node_resources(previous, current):
+            return
+        self.version += 1
+        if current is not None:
+            node_info = self.get_or_create_usage(current.get_name())
+            node_info.allocatable = current.get_allocatable()
+            node_info.labels = current.get_labels()
+            node_info.free_resources = None
+            self.nodes[node_info.name] = node_info
+        elif previous is not None:
+            node_info = self.nodes.pop(previous.get_name())
+            node_info.allocatable = dict()
+            node_info.labels = dict()
+            node_info.free_resources = None
+            self.drop_if_unused(node_info)
+
+    def on_pod_change(self, previous: Optional[Pod], current: Optional[Pod]) -> None:
+        previous_node_name = previous.get_node_name() if previous is not None else None
+        current_node_name = current.get_node_name() if current is not None else None
+        if not previous_node_name and not current_node_name:
+            # pending pods do not use node resources
+            return
+        if previous is not None and current is not None and is_same_pod_usage(previous, current):
+            return
+        self.version += 1
+        if previous is not None and previous_node_name:
+            node_info = self.get_or_create_usage(previous_node_name)
+            node_info.remove(previous)
+            self.drop_if_unused(node_info)
+        if current is not None and current_node_name:
+            self.get_or_create_usage(current_node_name).add(current)
+
+    def get_or_create_usage(self, node_name: NodeName) -> NodeInfo:
+        node_info = self.node_usage.get(node_name)
+        if node_info is None:
+            node_info = NodeInfo(name=node_name)
+            self.node_usage[node_name] = node_info
+        return node_info
+
+    def drop_if_unused(self, node_info: NodeInfo) -> None:
+        is_known_node = node_info.name in self.nodes
+        if not is_known_node and len(node_info.requests) == 0 and len(node_info.limits) == 0:
+            del self.node_usage[node_info.name]
+
+
+def is_same_node_resources(previous: Node, current: Node) -> bool:
+    # status heartbeats modify nodes without changing anything placement depends on
+    return previous.get_allocatable() == current.get_allocatable() and previous.get_labels() == current.get_labels()
+
+
+def is_same_pod_usage(previous: Pod, current: Pod) -> bool:
+    return (
+        previous.get_node_name() == current.get_node_name()
+        and previous.get_requests() == current.get_requests()
+        and previous.get_limits() == current.get_limits()
+    )
@@ -30,5 +30,28 @@ class NodeInfoTest(TestCase, ResourceTestFixture):
             node_info.get_free_resources(),
         )
 
+    def test_pod_quantities_summed_over_containers(self):
+        object = self.simple_pod()
+        object["metadata"]["resourceVersion"] = "42"
+        sidecar = {"name": "sidecar", "resources": {"requests": {"cpu": "50m"}, "limits": {"memory": "1Gi"}}}
+        object["spec"]["containers"].append(sidecar)
+        pod = Pod(object)
+
+        self.assertEqual("42", pod.quantities.resource_version)
+        self.assertEqual({"cpu": Decimal("0.150"), "memory": Decimal("104857600")}, pod.get_requests())
+        self.assertEqual({"cpu": Decimal("0.200"), "memory": Decimal("1283457024")}, pod.get_limits())
+
+    def test_remove_pod(self):
+        node = Node(self.simple_node())
+        pod = Pod(self.simple_pod())
+
+        node_info = NodeInfo.from_node(node)
+        node_info.add(pod)
+        node_info.remove(pod)
+
+        self.assertEqual({}, node_info.requests)
+        self.assertEqual({}, node_info.limits)
+        self.assertEqual(node.get_allocatable(), node_info.get_free_resources())
+
 
 # TODO sort nodes
@@ -1,3 +1,6 @@
+from typing import List
+
+from decimal import Decimal
 from unittest import TestCase
 
 from application_client.models.application_spec import ApplicationSpec
@@ -6,12 +9,17 @@ from application_client.models.pod_resources_limits import PodResourcesLimits
 from application_client.models.pod_resources_requests import PodResourcesRequests
 from application_client.models.resource_id import ResourceId
 
-from placement_controller.api.model import BidCriteria
+from placement_controller.api.model import BidCriteria, PlacementStrategy
 from placement_controller.clients.k8s.client import NamespacedName
 from placement_controller.resource_fixture import ResourceTestFixture
 from placement_controller.resources.node import Node
 from placement_controller.resources.node_info import NodeInfo
-from placement_controller.resources.placement import GreedyPlacement
+from placement_controller.resources.placement import (
+    GreedyPlacement,
+    PlacementMode,
+    SpreadPlacement,
+    create_placement,
+)
 from placement_controller.resources.trace_log import TraceLog, TraceLogRow
 from placement_controller.util.mock_clock import MockClock
 
@@ -160,3 +168,171 @@ class PlacementTest(TestCase, ResourceTestFixture):
                 ),
             ],
         )
+
+    def test_fixed_point_matches_decimal(self):
+        spec = ApplicationSpec(
+            id=ResourceId(name="test", namespace="test"),
+            resources=[
+                self.make_pod_spec("pod1", 3, {"cpu": "500m", "memory": "1Gi"}, {"cpu": "1"}),
+                self.make_pod_spec("pod2", 4, {"cpu": "1500m"}, {"cpu": "2", "memory": "2Gi"}),
+                self.make_pod_spec("pod3", 2, {"nvidia.com/gpu": "1"}, {}),
+                self.make_pod_spec("pod4", 5, {"cpu": "3", "memory": "20Gi"}, {}),
+            ],
+        )
+        criteria = [BidCriteria.cpu, BidCriteria.memory, BidCriteria.gpu]
+
+        results = {}
+        for mode in [PlacementMode.DECIMAL, PlacementMode.FIXED_POINT]:
+            trace = TraceLog(zone="test", name=NamespacedName(name="test", namespace="test"), clock=self.clock)
+            placement = GreedyPlacement(trace, self.make_nodes(), spec, criteria, mode)
+            results[mode] = placement.try_place()
+
+        decimal, fixed_point = results[PlacementMode.DECIMAL], results[PlacementMode.FIXED_POINT]
+        self.assertFalse(decimal.is_success())
+        self.assertEqual(decimal.bound_pods, fixed_point.bound_pods)
+        self.assertEqual(decimal.unbound_pods, fixed_point.unbound_pods)
+        self.assertEqual(decimal.trace.get_raw(), fixed_point.trace.get_raw())
+
+    def make_nodes(self) -> List[NodeInfo]:
+        node1 = NodeInfo.from_node(Node(self.make_node("node1", 2, 32 * self.GIGA, 512 * self.GIGA, 0)))
+        node2 = NodeInfo.from_node(Node(self.make_node("node2", 4, 16 * self.GIGA, 512 * self.GIGA, 1)))
+        node3 = NodeInfo.from_node(Node(self.make_node("node3", 6, 8 * self.GIGA, 512 * self.GIGA, 0)))
+        node4 = NodeInfo.from_node(Node(self.make_node("node4", 8, 64 * self.GIGA, 512 * self.GIGA, 2)))
+        node3.add_pod_requests_limits({"cpu": Decimal("0.25")}, {"memory": Decimal(self.GIGA)})
+        node4.add_pod_requests_limits({}, {"cpu": Decimal("1.5")})
+        return [node1, node2, node3, node4]
+
+    def test_node_order_updated_after_binding(self):
+        node1 = NodeInfo.from_node(Node(self.make_node("node1", 2, 32 * self.GIGA, 512 * self.GIGA, 0)))
+        node2 = NodeInfo.from_node(Node(self.make_node("node2", 3, 32 * self.GIGA, 512 * self.GIGA, 0)))
+        spec = ApplicationSpec(
+            id=ResourceId(name="test", namespace="test"),
+            resources=[
+                self.make_pod_spec("pod1", 1, {"cpu": "2500m"}, {}),
+                self.make_pod_spec("pod2", 1, {"cpu": "500m"}, {}),
+            ],
+        )
+        for mode in [PlacementMode.DECIMAL, PlacementMode.FIXED_POINT]:
+            trace = TraceLog(zone="test", name=NamespacedName(name="test", namespace="test"), clock=self.clock)
+            placement = GreedyPlacement(trace, [node1.copy(), node2.copy()], spec, [BidCriteria.cpu], mode)
+
+            result = placement.try_place()
+
+            self.assertTrue(result.is_success())
+            # node2 has the least free cpu after pod1 is bound
+            self.assertEqual({"test/pod1": {"node2"}, "test/pod2": {"node2"}}, result.bound_pods)
+
+    def test_rejected_nodes_summary(self):
+        nodes = [
+            NodeInfo.from_node(Node(self.make_node(f"node{i}", i, 32 * self.GIGA, 512 * self.GIGA, 0)))
+            for i in range(1, 5)
+        ]
+        spec = ApplicationSpec(
+            id=ResourceId(name="test", namespace="test"),
+            resources=[self.make_pod_spec("pod1", 1, {"cpu": "4", "memory": "64Gi"}, {})],
+        )
+        for mode in [PlacementMode.DECIMAL, PlacementMode.FIXED_POINT]:
+            trace = TraceLog(zone="test", name=NamespacedName(name="test", namespace="test"), clock=self.clock)
+            placement = GreedyPlacement(trace, [node.copy() for node in nodes], spec, self.criteria(), mode)
+
+            result = placement.try_place()
+
+            self.assertFalse(result.is_success())
+            self.assertEqual(
+                [row.msg for row in result.trace.get_raw()][:3],
+                [
+                    "3 nodes placement rejected. Not enough cpu.",
+                    "Node node4 placement rejected. Not enough memory.",
+                    "Failed to bind replica #0 of pod test/pod1.",
+                ],
+            )
+
+    def test_worst_fit(self):
+        spec = ApplicationSpec(id=ResourceId(name="test", namespace="test"), resources=[self.pod3])
+
+        best_fit = create_placement(PlacementStrategy.best_fit, self.trace, self.nodes(), spec, self.criteria())
+        worst_fit = create_placement(PlacementStrategy.worst_fit, self.trace, self.nodes(), spec, self.criteria())
+
+        self.assertEqual({"test/pod3": {"node1"}}, best_fit.try_place().bound_pods)
+        self.assertEqual({"test/pod3": {"node3"}}, worst_fit.try_place().bound_pods)
+
+    def test_first_fit_decreasing_places_all_pods(self):
+        nodes = [
+            NodeInfo.from_node(Node(self.make_node("node1", 2, 32 * self.GIGA, 512 * self.GIGA, 0))),
+            NodeInfo.from_node(Node(self.make_node("node2", 3, 32 * self.GIGA, 512 * self.GIGA, 0))),
+        ]
+        spec = ApplicationSpec(
+            id=ResourceId(name="test", namespace="test"),
+            resources=[
+                self.make_pod_spec("pod1", 1, {"cpu": "1"}, {}),
+                self.make_pod_spec("pod2", 1, {"cpu": "2"}, {}),
+                self.make_pod_spec("pod3", 1, {"cpu": "2"}, {}),
+            ],
+        )
+        for mode in [PlacementMode.DECIMAL, PlacementMode.FIXED_POINT]:
+            best_fit = GreedyPlacement(self.trace, [node.copy() for node in nodes], spec, [BidCriteria.cpu], mode)
+            self.assertEqual({"test/pod3"}, best_fit.try_place().unbound_pods)
+
+            ffd = create_placement(
+                PlacementStrategy.first_fit_decreasing,
+                self.trace,
+                [node.copy() for node in nodes],
+                spec,
+                [BidCriteria.cpu],
+            )
+            result = ffd.try_place()
+
+            self.assertTrue(result.is_success())
+            self.assertEqual(
+                {"test/pod1": {"node2"}, "test/pod2": {"node1"}, "test/pod3": {"node2"}},
+                result.bound_pods,
+            )
+
+    def test_spread_over_nodes(self):
+        pod = self.make_pod_spec("pod1", 3, {"cpu": "1"}, {})
+        spec = ApplicationSpec(id=ResourceId(name="test", namespace="test"), resources=[pod])
+        for mode in [PlacementMode.DECIMAL, PlacementMode.FIXED_POINT]:
+            placement = SpreadPlacement(self.trace, self.nodes(), spec, self.criteria(), mode)
+
+            result = placement.try_place()
+
+            self.assertEqual({"test/pod1": {"node1", "node2", "node3"}}, result.bound_pods)
+
+    def test_spread_over_topology_domains(self):
+        nodes = []
+        for name, rack in [("node1", "a"), ("node2", "a"), ("node3", "b")]:
+            node = self.make_node(name, 4, 32 * self.GIGA, 512 * self.GIGA, 0)
+            node["metadata"]["labels"] = {"rack": rack}
+            nodes.append(NodeInfo.from_node(Node(node)))
+        pod = self.make_pod_spec("pod1", 2, {"cpu": "1"}, {})
+        spec = ApplicationSpec(id=ResourceId(name="test", namespace="test"), resources=[pod])
+
+        placement = SpreadPlacement(self.trace, nodes, spec, self.criteria(), topology_key="rack")
+        result = placement.try_place()
+
+        bound = result.bound_pods["test/pod1"]
+        self.assertEqual(2, len(bound))
+        self.assertIn("node3", bound)
+
+    def test_create_spread_placement_with_topology_key(self):
+        nodes = []
+        for name, zone in [("node1", "a"), ("node2", "a"), ("node3", "b")]:
+            node = self.make_node(name, 4, 32 * self.GIGA, 512 * self.GIGA, 0)
+            node["metadata"]["labels"] = {"topology.kubernetes.io/zone": zone}
+            nodes.append(NodeInfo.from_node(Node(node)))
+        pod = self.make_pod_spec("pod1", 2, {"cpu": "1"}, {})
+        spec = ApplicationSpec(id=ResourceId(name="test", namespace="test"), resources=[pod])
+
+        placement = create_placement(
+            PlacementStrategy.spread, self.trace, nodes, spec, self.criteria(), "topology.kubernetes.io/zone"
+        )
+        result = placement.try_place()
+
+        self.assertIsInstance(placement, SpreadPlacement)
+        self.assertIn("node3", result.bound_pods["test/pod1"])
+
+    def nodes(self) -> List[NodeInfo]:
+        return [self.node1.copy(), self.node2.copy(), self.node3.copy()]
+
+    def criteria(self) -> List[BidCriteria]:
+        return [BidCriteria.cpu, BidCriteria.memory]
@@ -8,13 +8,16 @@ from application_client.models.application_spec import ApplicationSpec
 from application_client.models.resource_id import ResourceId
 
 from placement_controller.api.model import (
+    SPEC_NOT_FOUND,
     BidCriteria,
     BidRequestModel,
     BidResponseModel,
     BidStatus,
+    ErrorResponse,
     Metric,
     MetricValue,
     NamespacedNameModel,
+    PlacementStrategy,
     TraceLogRowModel,
 )
 from placement_controller.async_fixture import AsyncTestFixture
@@ -107,5 +110,136 @@ class ResourceManagementTest(AsyncTestFixture, ResourceTestFixture):
             ),
         )
 
+    def test_application_bid_strategy(self):
+        spec = ApplicationSpec(
+            id=ResourceId(name="test", namespace="test"),
+            resources=[self.make_pod_spec("pod1", 1, {"cpu": "1", "memory": "200Mi"}, {})],
+        )
+        bid = BidRequestModel(
+            id="id",
+            name=NamespacedNameModel(name="test", namespace="test"),
+            spec=self.to_json_str(spec),
+            bid_criteria=[BidCriteria.cpu, BidCriteria.memory],
+            metrics=set(),
+            strategy=PlacementStrategy.worst_fit,
+        )
+        response = self.bid_response(self.resource_management, bid)
+
+        self.assertEqual(response.trace[0].msg, "Instance 0 of pod test/pod1 is assigned to node node2.")
+
+    def test_application_bid_cached_until_resources_change(self):
+        resource_management = ResourceManagementImpl(
+            "zone",
+            self.clock,
+            self.client,
+            self.tracking,
+            ResourceMetricsImpl(config=MetricSettings(static_metrics=[])),
+            bid_cache_size=16,
+        )
+        self.wait_for_condition(2, lambda: len(self.tracking.list_nodes()) == 2)
+        spec = ApplicationSpec(
+            id=ResourceId(name="test", namespace="test"),
+            resources=[self.make_pod_spec("pod1", 1, {"cpu": "2", "memory": "200Mi"}, {})],
+        )
+        bid = BidRequestModel(
+            id="id1",
+            name=NamespacedNameModel(name="test", namespace="test"),
+            spec=self.to_json_str(spec),
+            bid_criteria=[BidCriteria.cpu, BidCriteria.memory],
+            metrics={Metric.cost},
+        )
+        first = self.bid_response(resource_management, bid)
+
+        self.clock.set_seconds(2)
+        second = self.bid_response(resource_management, bid.model_copy(update={"id": "id2"}))
+
+        self.assertEqual(second.id, "id2")
+        self.assertEqual(second.trace, first.trace)
+
+        pod = self.make_pod("running", {"cpu": "1"}, {})
+        pod["spec"]["nodeName"] = "node1"
+        version = self.tracking.get_version()
+        self.loop.run_until_complete(self.client.patch(self.pod_gvk, pod))
+        self.wait_for_condition(2, lambda: self.tracking.get_version() > version)
+
+        third = self.bid_response(resource_management, bid)
+
+        self.assertEqual(third.trace[0].timestamp, 2000)
+        self.assertEqual(
+            [row.msg for row in third.trace[:2]],
+            [
+                "Node node1 placement rejected. Not enough cpu.",
+                "Instance 0 of pod test/pod1 is assigned to node node2.",
+            ],
+        )
+
+    def test_application_bids(self):
+        spec = ApplicationSpec(
+            id=ResourceId(name="test", namespace="test"),
+            resources=[self.make_pod_spec("pod1", 1, {"cpu": "2", "memory": "200Mi"}, {})],
+        )
+        bid = BidRequestModel(
+            id="id1",
+            name=NamespacedNameModel(name="test", namespace="test"),
+            spec=self.to_json_str(spec),
+            bid_criteria=[BidCriteria.cpu, BidCriteria.memory],
+            metrics=set(),
+        )
+        invalid = bid.model_copy(update={"id": "id2", "spec": "{}"})
+        second = bid.model_copy(update={"id": "id3"})
+
+        responses = self.resource_management.application_bids([bid, invalid, second])
+
+        self.assertEqual(3, len(responses))
+        first_response, error, second_response = responses
+        assert isinstance(first_response, BidResponseModel)
+        assert isinstance(second_response, BidResponseModel)
+        self.assertEqual("id1", first_response.id)
+        self.assertEqual("id3", second_response.id)
+        self.assertIsInstance(error, ErrorResponse)
+        # every bid is placed on its own copy of the nodes
+        self.assertEqual(first_response.trace[0].msg, second_response.trace[0].msg)
+        self.assertEqual(first_response.trace[0].msg, "Instance 0 of pod test/pod1 is assigned to node node1.")
+
+    def test_application_bid_spec_digest(self):
+        resource_management = ResourceManagementImpl(
+            "zone",
+            self.clock,
+            self.client,
+            self.tracking,
+            ResourceMetricsImpl(config=MetricSettings(static_metrics=[])),
+            spec_cache_size=16,
+        )
+        self.wait_for_condition(2, lambda: len(self.tracking.list_nodes()) == 2)
+        spec = ApplicationSpec(
+            id=ResourceId(name="test", namespace="test"),
+            resources=[self.make_pod_spec("pod1", 1, {"cpu": "2", "memory": "200Mi"}, {})],
+        )
+        bid = BidRequestModel(
+            id="id1",
+            name=NamespacedNameModel(name="test", namespace="test"),
+            spec=self.to_json_str(spec),
+            bid_criteria=[BidCriteria.cpu, BidCriteria.memory],
+            metrics=set(),
+        )
+        reference = bid.without_spec().model_copy(update={"id": "id2"})
+
+        missing = resource_management.application_bid(reference)
+
+        assert isinstance(missing, ErrorResponse)
+        self.assertEqual(SPEC_NOT_FOUND, missing.code)
+
+        first = self.bid_response(resource_management, bid)
+        second = self.bid_response(resource_management, reference)
+
+        self.assertEqual("id2", second.id)
+        self.assertEqual(bid.get_spec_digest(), first.spec_digest)
+        self.assertEqual(first.trace, second.trace)
+
+    def bid_response(self, resource_management: ResourceManagement, bid: BidRequestModel) -> BidResponseModel:
+        response = resource_management.application_bid(bid)
+        assert isinstance(response, BidResponseModel)
+        return response
+
     def to_json_str(self, spec: ApplicationSpec) -> str:
         return json.dumps(spec.to_dict())
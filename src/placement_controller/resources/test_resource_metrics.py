@@ -1,3 +1,5 @@
+from typing import Dict, List, Tuple
+
 import asyncio
 from decimal import Decimal
 from unittest import TestCase
@@ -13,6 +15,7 @@ from application_client.models.resource_id import ResourceId
 
 from placement_controller.api.model import Metric, MetricUnit, MetricValue
 from placement_controller.clients.metrics.fake_client import FakeMetricsClient
+from placement_controller.clients.metrics.types import Labels
 from placement_controller.resource_fixture import ResourceTestFixture
 from placement_controller.resources.resource_metrics import (
     DynamicResourceMetrics,
@@ -24,6 +27,22 @@ from placement_controller.resources.resource_metrics import (
 )
 
 
+class CountingMetricsClient(FakeMetricsClient):
+    queries: List[str]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.queries = []
+
+    async def get_metric(self, name: str, labels: Dict[str, str] | None = None) -> Dict[str, float] | None:
+        self.queries.append(name)
+        return await super().get_metric(name, labels)
+
+    async def get_series(self, name: str, matchers: Dict[str, List[str]]) -> List[Tuple[Labels, float]]:
+        self.queries.append(f"{name}{matchers}")
+        return await super().get_series(name, matchers)
+
+
 class ResourceMetricsTest(TestCase, ResourceTestFixture):
     resource_metrics: ResourceMetricsImpl
 
@@ -154,6 +173,7 @@ class ResourceMetricsTest(TestCase, ResourceTestFixture):
             limits=PodResourcesLimits.from_dict({"cpu": 2}),
         )
         spec = ApplicationSpec(id=ResourceId(name="test", namespace="test"), resources=[pod1])
+        asyncio.run(dynamic_metrics.refresh())
         results = dynamic_metrics.estimate(spec, [Metric.cost, Metric.energy])
 
         cost_result = next(r for r in results if r.id == Metric.cost)
@@ -199,6 +219,7 @@ class ResourceMetricsTest(TestCase, ResourceTestFixture):
             limits=PodResourcesLimits.from_dict({"cpu": 2}),
         )
         spec = ApplicationSpec(id=ResourceId(name="test", namespace="test"), resources=[pod1])
+        asyncio.run(dynamic_metrics.refresh())
         results = dynamic_metrics.estimate(spec, [Metric.energy])
 
         energy_result = next(r for r in results if r.id == Metric.energy)
@@ -237,8 +258,112 @@ class ResourceMetricsTest(TestCase, ResourceTestFixture):
             limits=PodResourcesLimits.from_dict({"cpu": 2}),
         )
         spec = ApplicationSpec(id=ResourceId(name="test", namespace="test"), resources=[pod1])
+        asyncio.run(dynamic_metrics.refresh())
         results = dynamic_metrics.estimate(spec, [Metric.energy])
 
         energy_result = next(r for r in results if r.id == Metric.energy)
 
         self.assertEqual(energy_result.value, Decimal("200.0000"))
+
+    def test_dynamic_metrics_stale_while_revalidate(self) -> None:
+        static_config = MetricSettings(
+            static_metrics=[
+                MetricDefinition(
+                    metric=Metric.energy,
+                    value_per_unit={"cpu": Decimal(0.5)},
+                    weight={"cpu": Decimal(1.0)},
+                    method=EstimateMethod.WEIGHTED_AVERAGE,
+                )
+            ],
+            prometheus_metrics=[PrometheusMetricDefinition(metric=Metric.energy, query="node_energy", labels={})],
+        )
+        fake_client = FakeMetricsClient()
+        fake_client.metrics = {"node_energy": {"value": 100.0}}
+        dynamic_metrics = DynamicResourceMetrics(
+            static_config=static_config,
+            client=fake_client,
+            prometheus_definitions=static_config.prometheus_metrics or [],
+            is_terminated=asyncio.Event(),
+        )
+        spec = ApplicationSpec(id=ResourceId(name="test", namespace="test"), resources=[self.pod1])
+
+        # nothing is queried while estimating, the static estimate is used until the cache is filled
+        self.assertEqual(dynamic_metrics.estimate(spec, [Metric.energy])[0].value, Decimal("0.5000"))
+
+        asyncio.run(dynamic_metrics.refresh())
+        fake_client.metrics = {"node_energy": {"value": 200.0}}
+        dynamic_metrics.cache[Metric.energy].query_time -= dynamic_metrics.cache_ttl_seconds + 1
+
+        async def estimate_stale() -> Decimal:
+            value = dynamic_metrics.estimate(spec, [Metric.energy])[0].value
+            revalidation = dynamic_metrics.revalidation
+            self.assertIsNotNone(revalidation)
+            if revalidation is not None:
+                await revalidation
+            return value
+
+        self.assertEqual(asyncio.run(estimate_stale()), Decimal("100.0000"))
+        self.assertEqual(dynamic_metrics.estimate(spec, [Metric.energy])[0].value, Decimal("200.0000"))
+
+        dynamic_metrics.cache[Metric.energy].query_time -= (
+            dynamic_metrics.cache_ttl_seconds + dynamic_metrics.stale_ttl_seconds
+        )
+        self.assertEqual(dynamic_metrics.estimate(spec, [Metric.energy])[0].value, Decimal("0.5000"))
+
+    def test_dynamic_metrics_batched_by_metric_name(self) -> None:
+        static_config = MetricSettings(
+            static_metrics=[],
+            prometheus_metrics=[
+                PrometheusMetricDefinition(metric=Metric.cost, query="node_value", labels={"kind": "cost"}),
+                PrometheusMetricDefinition(metric=Metric.energy, query="node_value", labels={"kind": "energy"}),
+            ],
+        )
+        client = CountingMetricsClient()
+        client.metrics = {
+            "node_value{kind=cost,zone=zone1}": {"value": 1.5},
+            "node_value{kind=energy,zone=zone1}": {"value": 120.0},
+        }
+        dynamic_metrics = DynamicResourceMetrics(
+            static_config=static_config,
+            client=client,
+            prometheus_definitions=static_config.prometheus_metrics or [],
+            is_terminated=asyncio.Event(),
+        )
+
+        asyncio.run(dynamic_metrics.refresh())
+
+        self.assertEqual(client.queries, ["node_value{'kind': ['cost', 'energy']}"])
+        spec = ApplicationSpec(id=ResourceId(name="test", namespace="test"), resources=[self.pod1])
+        self.assertEqual(
+            dynamic_metrics.estimate(spec, [Metric.cost, Metric.energy]),
+            [
+                MetricValue(id=Metric.cost, value=Decimal("1.5000"), unit=MetricUnit.eur),
+                MetricValue(id=Metric.energy, value=Decimal("120.0000"), unit=MetricUnit.watt),
+            ],
+        )
+
+    def test_dynamic_metrics_adaptive_interval(self) -> None:
+        static_config = MetricSettings(
+            static_metrics=[],
+            prometheus_metrics=[PrometheusMetricDefinition(metric=Metric.energy, query="node_energy", labels={})],
+            prometheus_max_update_interval=4.0,
+        )
+        client = FakeMetricsClient()
+        client.metrics = {"node_energy": {"value": 100.0}}
+        dynamic_metrics = DynamicResourceMetrics(
+            static_config=static_config,
+            client=client,
+            prometheus_definitions=static_config.prometheus_metrics or [],
+            is_terminated=asyncio.Event(),
+        )
+        state = dynamic_metrics.definition_states[0]
+
+        intervals = []
+        for _ in range(4):
+            asyncio.run(dynamic_metrics.refresh(force=True))
+            intervals.append(state.interval)
+        client.metrics = {"node_energy": {"value": 101.0}}
+        asyncio.run(dynamic_metrics.refresh(force=True))
+        intervals.append(state.interval)
+
+        self.assertEqual(intervals, [1.0, 2.0, 4.0, 4.0, 1.0])
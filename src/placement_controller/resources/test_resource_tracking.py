@@ -1,7 +1,10 @@
+from typing import Dict
+
 import asyncio
 from decimal import Decimal
 
 from placement_controller.async_fixture import AsyncTestFixture
+from placement_controller.clients.k8s.client import NamespacedName
 from placement_controller.clients.k8s.fake_client import FakeClient
 from placement_controller.resource_fixture import ResourceTestFixture
 from placement_controller.resources.node_info import NodeInfo
@@ -65,3 +68,88 @@ class ResourceTrackingImplTest(AsyncTestFixture, ResourceTestFixture):
             free_resources,
             {"cpu": Decimal("9.900"), "ephemeral-storage": Decimal("134950129664"), "memory": Decimal("8113176576")},
         )
+
+    def test_list_nodes_pod_deleted(self):
+        node = self.simple_node()
+        pod = self.simple_pod()
+        pod["spec"]["nodeName"] = node["metadata"]["name"]
+
+        self.loop.run_until_complete(self.client.patch(self.node_gvk, node))
+        self.loop.run_until_complete(self.client.patch(self.pod_gvk, pod))
+        self.wait_for_condition(2, lambda: len(self.tracking.list_nodes()[0].requests) > 0)
+
+        self.loop.run_until_complete(self.client.delete(self.pod_gvk, NamespacedName(name="nginx", namespace="test")))
+        self.wait_for_condition(2, lambda: len(self.tracking.list_nodes()[0].requests) == 0)
+
+        free_resources = self.tracking.list_nodes()[0].get_free_resources()
+        self.assertEqual(
+            free_resources,
+            {"cpu": Decimal("10"), "ephemeral-storage": Decimal("134950129664"), "memory": Decimal("8218034176")},
+        )
+
+    def test_list_nodes_pod_rescheduled(self):
+        node1 = self.make_node("node1", 2, 2 * self.GIGA, 512 * self.GIGA, 0)
+        node2 = self.make_node("node2", 4, 4 * self.GIGA, 512 * self.GIGA, 0)
+        pod = self.make_pod("pod", {"cpu": "1"}, {"cpu": "2"})
+
+        self.loop.run_until_complete(self.client.patch(self.node_gvk, node1))
+        self.loop.run_until_complete(self.client.patch(self.node_gvk, node2))
+        self.loop.run_until_complete(self.client.patch(self.pod_gvk, pod))
+
+        pod["spec"]["nodeName"] = "node1"
+        self.loop.run_until_complete(self.client.patch(self.pod_gvk, pod))
+        self.wait_for_condition(2, lambda: self.free_cpu() == {"node1": Decimal("1"), "node2": Decimal("4")})
+
+        pod["spec"]["nodeName"] = "node2"
+        self.loop.run_until_complete(self.client.patch(self.pod_gvk, pod))
+        self.wait_for_condition(2, lambda: self.free_cpu() == {"node1": Decimal("2"), "node2": Decimal("3")})
+
+    def test_list_nodes_pod_before_node(self):
+        node = self.simple_node()
+        pod = self.simple_pod()
+        pod["spec"]["nodeName"] = node["metadata"]["name"]
+
+        self.loop.run_until_complete(self.client.patch(self.pod_gvk, pod))
+        self.loop.run_until_complete(self.client.patch(self.node_gvk, node))
+        self.wait_for_condition(2, lambda: len(self.tracking.list_nodes()) == 1)
+
+        self.assertEqual(self.free_cpu(), {"node1": Decimal("9.900")})
+
+        self.loop.run_until_complete(
+            self.client.delete(self.node_gvk, NamespacedName(name="node1", namespace="default"))
+        )
+        self.wait_for_condition(2, lambda: len(self.tracking.list_nodes()) == 0)
+
+    def test_list_nodes_returns_copies(self):
+        node = self.simple_node()
+        self.loop.run_until_complete(self.client.patch(self.node_gvk, node))
+        self.wait_for_condition(2, lambda: len(self.tracking.list_nodes()) == 1)
+
+        snapshot = self.tracking.list_nodes()
+        snapshot[0].add_pod_requests_limits({"cpu": Decimal("1")}, {})
+
+        self.assertEqual(self.free_cpu(), {"node1": Decimal("10")})
+
+    def test_version_changes_with_usage_only(self):
+        node = self.make_node("node1", 4, 4 * self.GIGA, 512 * self.GIGA, 0)
+        pod1 = self.make_pod("pod1", {"cpu": "1"}, {})
+        pod1["spec"]["nodeName"] = "node1"
+
+        self.loop.run_until_complete(self.client.patch(self.node_gvk, node))
+        self.loop.run_until_complete(self.client.patch(self.pod_gvk, pod1))
+        self.wait_for_condition(2, lambda: self.free_cpu() == {"node1": Decimal("3")})
+        version = self.tracking.get_version()
+
+        pod1["metadata"]["labels"] = {"app": "test"}
+        self.loop.run_until_complete(self.client.patch(self.pod_gvk, pod1))
+        pending = self.make_pod("pending", {"cpu": "1"}, {})
+        self.loop.run_until_complete(self.client.patch(self.pod_gvk, pending))
+        pod2 = self.make_pod("pod2", {"cpu": "1"}, {})
+        pod2["spec"]["nodeName"] = "node1"
+        self.loop.run_until_complete(self.client.patch(self.pod_gvk, pod2))
+        self.wait_for_condition(2, lambda: self.free_cpu() == {"node1": Decimal("2")})
+
+        self.assertEqual(self.tracking.get_version(), version + 1)
+
+    def free_cpu(self) -> Dict[str, Decimal]:
+        return {node.name: node.get_free_resources()["cpu"] for node in self.tracking.list_nodes()}
@@ -0,0 +1,74 @@
+from typing import List
+
+import unittest
+
+from placement_controller.clients.k8s.client import NamespacedName
+from placement_controller.resources.trace_log import TraceLevel, TraceLog
+from placement_controller.util.mock_clock import MockClock
+
+
+class Unformattable:
+    def __str__(self) -> str:
+        raise AssertionError("message must not be formatted")
+
+
+class TraceLogTest(unittest.TestCase):
+    clock: MockClock
+    name: NamespacedName
+
+    def setUp(self) -> None:
+        self.clock = MockClock()
+        self.name = NamespacedName(name="test", namespace="test")
+
+    def messages(self, trace: TraceLog) -> List[str]:
+        return [row.msg for row in trace.get_raw()]
+
+    def test_rejections_aggregated_per_reason(self) -> None:
+        trace = TraceLog("zone1", self.name, self.clock)
+
+        trace.reject("node1", "cpu", 3)
+        trace.reject("node4", "memory")
+        for i in range(5, 10):
+            trace.reject(f"node{i}", "cpu")
+        trace.flush_rejections()
+        trace.flush_rejections()
+
+        self.assertEqual(
+            [
+                "8 nodes placement rejected. Not enough cpu.",
+                "Node node4 placement rejected. Not enough memory.",
+            ],
+            self.messages(trace),
+        )
+
+    def test_rejections_per_node_on_debug_level(self) -> None:
+        trace = TraceLog("zone1", self.name, self.clock, level=TraceLevel.DEBUG)
+
+        trace.reject("node1", "cpu")
+        trace.reject("node2", "cpu")
+        trace.flush_rejections()
+
+        self.assertEqual(
+            [
+                "Node node1 placement rejected. Not enough cpu.",
+                "Node node2 placement rejected. Not enough cpu.",
+            ],
+            self.messages(trace),
+        )
+
+    def test_debug_rows_not_formatted_on_info_level(self) -> None:
+        trace = TraceLog("zone1", self.name, self.clock)
+
+        trace.log("value %s", Unformattable(), level=TraceLevel.DEBUG)
+
+        self.assertEqual([], self.messages(trace))
+
+    def test_rows_capped(self) -> None:
+        trace = TraceLog("zone1", self.name, self.clock, max_rows=2)
+
+        for i in range(5):
+            trace.log("row %d", i)
+
+        self.assertEqual(["row 0", "row 1", "3 trace rows dropped."], self.messages(trace))
+        # the dropped rows summary is not stored
+        self.assertEqual(2, len(trace.data))
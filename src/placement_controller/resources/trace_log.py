@@ -1,10 +1,32 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import sys
 from dataclasses import dataclass, field
+from enum import StrEnum
+
+from pydantic_settings import BaseSettings
 
 from placement_controller.clients.k8s.client import NamespacedName
 from placement_controller.util.clock import Clock
 
+DEFAULT_MAX_ROWS: int = 500
+
+
+class TraceLevel(StrEnum):
+    # every rejected node
+    DEBUG = "debug"
+    # rejected nodes aggregated per reason
+    INFO = "info"
+
+
+TRACE_LEVEL_ORDER: List[TraceLevel] = [TraceLevel.DEBUG, TraceLevel.INFO]
+
+
+class TraceSettings(BaseSettings):
+    level: TraceLevel = TraceLevel.INFO
+    # rows kept per trace, further rows are counted only
+    max_rows: int = DEFAULT_MAX_ROWS
+
 
 @dataclass
 class TraceLogRow:
@@ -15,34 +37,98 @@ class TraceLogRow:
     state: Optional[str] = None
 
 
+@dataclass
+class Rejections:
+    count: int
+    first_node: str
+
+
 @dataclass
 class TraceLog:
+    """
+    Trace of a placement or scheduling flow.
+    Rows below the trace level are skipped before formatting their message, rows beyond max_rows are
+    only counted. Rejected nodes are collected per reason and written as one summary row on flush.
+    """
+
     zone: str
     name: NamespacedName
     clock: Clock
     data: List[TraceLogRow] = field(default_factory=list)
+    level: TraceLevel = TraceLevel.INFO
+    max_rows: int = DEFAULT_MAX_ROWS
+    dropped: int = 0
+    rejections: Dict[str, Rejections] = field(default_factory=dict)
 
-    def log(self, msg: str) -> None:
-        row = TraceLogRow(
-            timestamp=self.clock.now_millis(),
-            zone=self.zone,
-            name=self.name,
-            msg=msg,
-        )
-        self.data.append(row)
+    def __post_init__(self) -> None:
+        # zone names are repeated in every row of every trace
+        self.zone = sys.intern(self.zone)
+
+    @staticmethod
+    def from_settings(zone: str, name: NamespacedName, clock: Clock, settings: TraceSettings) -> "TraceLog":
+        return TraceLog(zone, name, clock, level=settings.level, max_rows=settings.max_rows)
+
+    def is_enabled(self, level: TraceLevel) -> bool:
+        return TRACE_LEVEL_ORDER.index(level) >= TRACE_LEVEL_ORDER.index(self.level)
+
+    def log(self, msg: str, *args: Any, level: TraceLevel = TraceLevel.INFO) -> None:
+        """Logs msg formatted with args (printf style), the message is formatted only if the row is kept."""
+        if not self.is_enabled(level):
+            return
+        self.append(msg, args, None)
 
     def log_state(self, msg: str, state: str) -> None:
+        self.append(msg, (), state)
+
+    def reject(self, node: str, reason: str, count: int = 1) -> None:
+        """Records count rejected nodes starting with node, logged per node on debug level only."""
+        if self.is_enabled(TraceLevel.DEBUG):
+            if count == 1:
+                self.log("Node %s placement rejected. Not enough %s.", node, reason, level=TraceLevel.DEBUG)
+            else:
+                self.log("%d nodes placement rejected. Not enough %s.", count, reason, level=TraceLevel.DEBUG)
+            return
+        rejections = self.rejections.get(reason)
+        if rejections is None:
+            self.rejections[reason] = Rejections(count=count, first_node=node)
+        else:
+            rejections.count += count
+
+    def flush_rejections(self) -> None:
+        for reason, rejections in self.rejections.items():
+            if rejections.count == 1:
+                self.log("Node %s placement rejected. Not enough %s.", rejections.first_node, reason)
+            else:
+                self.log("%d nodes placement rejected. Not enough %s.", rejections.count, reason)
+        self.rejections.clear()
+
+    def append(self, msg: str, args: Tuple[Any, ...], state: Optional[str]) -> None:
+        if len(self.data) >= self.max_rows:
+            self.dropped += 1
+            return
         row = TraceLogRow(
             timestamp=self.clock.now_millis(),
             zone=self.zone,
             name=self.name,
-            msg=msg,
+            msg=msg % args if args else msg,
             state=state,
         )
         self.data.append(row)
 
     def get_raw(self) -> List[TraceLogRow]:
-        return self.data
+        rows = list(self.data)
+        if self.dropped > 0:
+            rows.append(
+                TraceLogRow(
+                    timestamp=self.clock.now_millis(),
+                    zone=self.zone,
+                    name=self.name,
+                    msg=f"{self.dropped} trace rows dropped.",
+                )
+            )
+        return rows
 
     def reset(self) -> None:
         self.data = []
+        self.dropped = 0
+        self.rejections = dict()
@@ -1,8 +1,8 @@
-from typing import List
+from typing import List, Union
 
 from application_client.models.application_spec import ApplicationSpec
 
-from placement_controller.api.model import BidRequestModel, BidResponseModel, Metric, MetricValue
+from placement_controller.api.model import BidRequestModel, BidResponseModel, ErrorResponse, Metric, MetricValue
 from placement_controller.resources.node_info import NodeInfo
 
 
@@ -14,13 +14,21 @@ class ResourceTracking:
     def list_nodes(self) -> List[NodeInfo]:
         raise NotImplementedError
 
+    def get_version(self) -> int:
+        """Increases whenever a node or pod event changes the tracked resources"""
+        raise NotImplementedError
+
     def is_subscription_active(self) -> bool:
         raise NotImplementedError
 
 
 class ResourceManagement:
 
-    def application_bid(self, bid: BidRequestModel) -> BidResponseModel:
+    def application_bid(self, bid: BidRequestModel) -> Union[BidResponseModel, ErrorResponse]:
+        raise NotImplementedError
+
+    def application_bids(self, bids: List[BidRequestModel]) -> List[Union[BidResponseModel, ErrorResponse]]:
+        """Evaluates the bids against one snapshot of the resources, in the order of the bids."""
         raise NotImplementedError
 
 
@@ -2,8 +2,16 @@ from typing import Dict, List, Optional
 
 from pydantic_settings import BaseSettings
 
+from placement_controller.api.encoding import DEFAULT_COMPRESSION_MIN_BYTES
+from placement_controller.api.model import PlacementStrategy
 from placement_controller.clients.k8s.settings import K8SSettings
+from placement_controller.core.event_coalescer import EventCoalescingSettings
+from placement_controller.jobs.bid_action import BidCollectionSettings
+from placement_controller.jobs.executor import ExecutorSettings
+from placement_controller.resources.placement import HOSTNAME_LABEL
 from placement_controller.resources.resource_metrics import MetricSettings
+from placement_controller.resources.trace_log import TraceSettings
+from placement_controller.zone.zone_health import ZoneHealthSettings
 
 
 class PrometheusSettings(BaseSettings):
@@ -18,12 +26,55 @@ class ApiSettings(BaseSettings):
     port: int = 8000
 
 
+class ZoneClientSettings(BaseSettings):
+    # connections kept per remote zone
+    max_connections: int = 10
+    max_keepalive_connections: int = 10
+    keepalive_expiry_seconds: float = 60.0
+    timeout_seconds: float = 5.0
+    # requires the h2 package (httpx[http2]), peers without HTTP/2 support fall back to HTTP/1.1
+    http2: bool = False
+    # bids to a zone within the window are sent as one batch, 0 sends every bid on its own
+    bid_batch_window_seconds: float = 0.05
+    max_bid_batch_size: int = 100
+    # specs are sent to a zone once and referenced by digest afterwards, 0 sends the spec with every bid
+    max_referenced_specs: int = 1024
+    # request bodies from compression_min_bytes on are gzip compressed, the api compresses its responses likewise
+    compression: bool = True
+    compression_min_bytes: int = DEFAULT_COMPRESSION_MIN_BYTES
+
+
 class PlacementSettings(BaseSettings):
     namespace: str
     available_zones: List[str]
     current_zone: str
     static_controller_endpoints: Optional[Dict[str, str]]
     application_controller_endpoint: str
+    # placement strategy for bids in the current zone, unless a bid request selects one
+    placement_strategy: PlacementStrategy = PlacementStrategy.best_fit
+    # node label whose values are the topology domains the spread strategy distributes replicas over
+    spread_topology_key: str = HOSTNAME_LABEL
+    # placement outcomes cached per resource tracking version, 0 disables the cache
+    bid_cache_size: int = 256
+    # application specs cached per application generation, 0 disables the cache
+    spec_cache_size: int = 1024
+    # workloads may change without a new generation, cached specs are fetched again after this age; 0 never
+    spec_cache_max_age_seconds: float = 60.0
+    # parsed specs of received bids, later bids may reference them by digest; 0 disables the cache
+    bid_spec_cache_size: int = 256
+    # previous scheduling states kept per application
+    history_depth: int = 32
+    # scheduling worker processes, applications are assigned to them by consistent hashing
+    shards: int = 1
+    trace: TraceSettings = TraceSettings()
+    # application watch events are coalesced per application and handled in batches
+    watch_events: EventCoalescingSettings = EventCoalescingSettings()
+    # bid collection per scheduling operation
+    bids: BidCollectionSettings = BidCollectionSettings()
+    zone_client: ZoneClientSettings = ZoneClientSettings()
+    # circuit breaking and adaptive timeouts of the remote zones
+    zone_health: ZoneHealthSettings = ZoneHealthSettings()
+    executor: ExecutorSettings = ExecutorSettings()
 
 
 class OrchestrationLibSettings(BaseSettings):
@@ -0,0 +1,74 @@
+from typing import Any
+
+import asyncio
+import signal
+
+from application_client.client import Client
+from loguru import logger
+
+from placement_controller.clients.k8s.client_impl import KubeClientImpl
+from placement_controller.clients.placement.remote import RemotePlacementClient
+from placement_controller.clients.placement.types import PlacementClient
+from placement_controller.core.shards import MessageQueue, ShardApplications, ShardId
+from placement_controller.jobs.spec_cache import SpecCache
+from placement_controller.jobs.types import ExecutorContext
+from placement_controller.settings import Settings
+from placement_controller.store.factory import new_decision_store
+from placement_controller.util.clock_impl import ClockImpl
+from placement_controller.zone.zone_api_factory import ZoneApiFactoryImpl
+
+
+class ShardContext:
+    """Scheduling of one shard in a worker process, bids in the current zone go through the api of the main process."""
+
+    loop: asyncio.AbstractEventLoop
+    terminated: asyncio.Event
+    kube_client: KubeClientImpl
+    zone_api_factory: ZoneApiFactoryImpl
+    local_client: RemotePlacementClient
+    applications: ShardApplications
+
+    def __init__(self, settings: Settings, shard: ShardId, inbox: MessageQueue, outbox: MessageQueue):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.terminated = asyncio.Event()
+
+        clock = ClockImpl()
+        self.kube_client = KubeClientImpl(settings.k8s, self.loop)
+        self.zone_api_factory = ZoneApiFactoryImpl(settings.placement, PlacementClient(), clock)
+        self.local_client = RemotePlacementClient(
+            self.zone_api_factory.new_client(f"http://127.0.0.1:{settings.api.port}")
+        )
+        self.zone_api_factory.set_local_client(self.local_client)
+        executor_context = ExecutorContext(
+            application_controller_client=Client(base_url=settings.placement.application_controller_endpoint),
+            zone_api_factory=self.zone_api_factory,
+            kube_client=self.kube_client,
+            clock=clock,
+            decision_store=new_decision_store(settings.orchestrationlib),
+            spec_cache=SpecCache(
+                settings.placement.spec_cache_size, settings.placement.spec_cache_max_age_seconds, clock
+            ),
+        )
+        self.applications = ShardApplications(
+            shard, inbox, outbox, clock, executor_context, self.kube_client, self.terminated, settings.placement
+        )
+
+    def start(self) -> None:
+        self.loop.run_until_complete(self.applications.run())
+        self.loop.run_until_complete(self.local_client.close())
+        self.loop.run_until_complete(self.zone_api_factory.close())
+        self.loop.run_until_complete(self.kube_client.close())
+
+    def exit_gracefully(self, _1: Any, _2: Any) -> None:
+        self.loop.call_soon_threadsafe(self.terminated.set)
+
+
+def run_shard(settings: Settings, shard: ShardId, inbox: MessageQueue, outbox: MessageQueue) -> None:
+    """Entrypoint of a shard worker process."""
+    context = ShardContext(settings, shard, inbox, outbox)
+    # the main process stops the workers
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, context.exit_gracefully)
+    context.start()
+    logger.info(f"Shard {shard} terminated.")
@@ -0,0 +1,12 @@
+from orchestrationlib_client.client import Client as OrchestrationLibClient
+
+from placement_controller.settings import OrchestrationLibSettings
+from placement_controller.store.decision_store import DecisionStoreImpl
+from placement_controller.store.fake_decision_store import FakeDecisionStore
+from placement_controller.store.types import DecisionStore
+
+
+def new_decision_store(settings: OrchestrationLibSettings) -> DecisionStore:
+    if settings.enabled:
+        return DecisionStoreImpl(OrchestrationLibClient(base_url=settings.base_url))
+    return FakeDecisionStore()
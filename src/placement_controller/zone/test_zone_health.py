@@ -0,0 +1,84 @@
+import unittest
+
+from prometheus_client import CollectorRegistry
+
+from placement_controller.util.mock_clock import MockClock
+from placement_controller.zone.zone_health import (
+    CircuitState,
+    ZoneHealthCollector,
+    ZoneHealthRegistry,
+    ZoneHealthSettings,
+)
+
+
+class ZoneHealthRegistryTest(unittest.TestCase):
+    clock: MockClock
+    registry: ZoneHealthRegistry
+
+    def setUp(self) -> None:
+        self.clock = MockClock()
+        settings = ZoneHealthSettings(failure_threshold=2, open_seconds=10, min_samples=3, min_timeout_seconds=0.1)
+        self.registry = ZoneHealthRegistry(settings, self.clock, max_timeout_seconds=5.0)
+
+    def test_circuit_opens_after_consecutive_failures(self) -> None:
+        self.registry.record_failure("zone1")
+        self.registry.record_success("zone1", 0.1)
+        self.registry.record_failure("zone1")
+
+        self.assertEqual(CircuitState.CLOSED, self.registry.state("zone1"))
+        self.assertTrue(self.registry.allow("zone1"))
+
+        self.registry.record_failure("zone1")
+
+        self.assertEqual(CircuitState.OPEN, self.registry.state("zone1"))
+        self.assertFalse(self.registry.allow("zone1"))
+        self.assertTrue(self.registry.allow("zone2"))
+
+    def test_half_open_probe(self) -> None:
+        self.registry.record_failure("zone1")
+        self.registry.record_failure("zone1")
+
+        self.clock.set_seconds(11)
+
+        # a single probe is let through
+        self.assertTrue(self.registry.allow("zone1"))
+        self.assertEqual(CircuitState.HALF_OPEN, self.registry.state("zone1"))
+        self.assertFalse(self.registry.allow("zone1"))
+
+        self.registry.record_failure("zone1")
+        self.assertEqual(CircuitState.OPEN, self.registry.state("zone1"))
+
+        self.clock.set_seconds(22)
+        self.assertTrue(self.registry.allow("zone1"))
+        self.registry.record_success("zone1", 0.1)
+
+        self.assertEqual(CircuitState.CLOSED, self.registry.state("zone1"))
+        self.assertTrue(self.registry.allow("zone1"))
+
+    def test_timeout_follows_latency(self) -> None:
+        self.assertEqual(5.0, self.registry.timeout_seconds("zone1"))
+
+        for latency in [0.1, 0.2, 0.3]:
+            self.registry.record_success("zone1", latency)
+
+        self.assertAlmostEqual(0.9, self.registry.timeout_seconds("zone1"))
+
+        self.registry.record_success("zone1", 10.0)
+        self.assertEqual(5.0, self.registry.timeout_seconds("zone1"))
+
+    def test_metrics_exported(self) -> None:
+        registry = CollectorRegistry()
+        registry.register(ZoneHealthCollector(self.registry))
+        self.registry.record_success("zone1", 0.2)
+        self.registry.record_failure("zone1")
+
+        self.assertEqual(0.5, registry.get_sample_value("placement_zone_error_rate", {"zone": "zone1"}))
+        self.assertEqual(
+            1.0, registry.get_sample_value("placement_zone_circuit_state", {"zone": "zone1", "state": "closed"})
+        )
+        self.assertEqual(
+            1.0, registry.get_sample_value("placement_zone_requests_total", {"zone": "zone1", "outcome": "failure"})
+        )
+        self.assertEqual(
+            0.2, registry.get_sample_value("placement_zone_latency_seconds", {"zone": "zone1", "quantile": "0.99"})
+        )
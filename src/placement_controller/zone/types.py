@@ -4,3 +4,7 @@ from placement_controller.clients.placement.types import PlacementClient
 class ZoneApiFactory:
     def create(self, zone: str) -> PlacementClient:
         raise NotImplementedError()
+
+    def is_available(self, zone: str) -> bool:
+        """False while the circuit of the zone is open, requests to it are skipped."""
+        return True
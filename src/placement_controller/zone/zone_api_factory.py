@@ -1,11 +1,18 @@
-from typing import Dict
+from typing import Dict, List, Optional
 
+import httpx
 from placement_client.client import Client
 
+from placement_controller.clients.placement.batching import BatchingPlacementClient
+from placement_controller.clients.placement.health import HealthTrackingPlacementClient
 from placement_controller.clients.placement.remote import RemotePlacementClient
+from placement_controller.clients.placement.transport import CompressingTransport
 from placement_controller.clients.placement.types import PlacementClient
-from placement_controller.settings import PlacementSettings
+from placement_controller.settings import PlacementSettings, ZoneClientSettings
+from placement_controller.util.clock import Clock
+from placement_controller.util.clock_impl import ClockImpl
 from placement_controller.zone.types import ZoneApiFactory
+from placement_controller.zone.zone_health import ZoneHealthRegistry
 
 ZoneId = str
 ZoneDomain = str
@@ -17,27 +24,79 @@ class ZoneApiFactoryImpl(ZoneApiFactory):
     zone_to_domain: Dict[ZoneId, ZoneDomain]
     static_zones: Dict[ZoneId, BaseUrl]
     local_zone: str
+    client_settings: ZoneClientSettings
+    # long-lived clients keep their connections alive between bids
+    remote_clients: Dict[ZoneId, PlacementClient]
+    # clients replaced by a new zone url, closed together with the active ones
+    retired_clients: List[PlacementClient]
+    health: ZoneHealthRegistry
 
-    def __init__(self, config: PlacementSettings, local_client: PlacementClient):
+    def __init__(self, config: PlacementSettings, local_client: PlacementClient, clock: Optional[Clock] = None):
         self.local_client = local_client
         self.local_zone = config.current_zone
         self.zone_to_domain = dict()
         self.static_zones = config.static_controller_endpoints or dict()
+        self.client_settings = config.zone_client
+        self.remote_clients = dict()
+        self.retired_clients = []
+        self.health = ZoneHealthRegistry(config.zone_health, clock or ClockImpl(), config.zone_client.timeout_seconds)
 
     def set_local_client(self, local_client: PlacementClient) -> None:
         self.local_client = local_client
 
     def add_static_zone(self, zone: ZoneId, url: BaseUrl) -> None:
         self.static_zones[zone] = url
+        client = self.remote_clients.pop(zone, None)
+        if client is not None:
+            self.retired_clients.append(client)
 
     def create(self, zone: ZoneId) -> PlacementClient:
         if self.local_zone == zone:
             return self.local_client
         else:
+            client = self.remote_clients.get(zone)
+            if client is not None:
+                return client
             base_url = self.static_zones.get(zone)
             if base_url:
-                return RemotePlacementClient(Client(base_url=base_url))
+                client = HealthTrackingPlacementClient(
+                    zone,
+                    RemotePlacementClient(self.new_client(base_url), self.client_settings.max_referenced_specs),
+                    self.health,
+                )
+                if self.client_settings.bid_batch_window_seconds > 0:
+                    client = BatchingPlacementClient(
+                        client, self.client_settings.bid_batch_window_seconds, self.client_settings.max_bid_batch_size
+                    )
+                self.remote_clients[zone] = client
+                return client
             else:
                 raise NotImplementedError(
                     f"static zone '{zone}' is not configured, zone-to-domain mapping is not implemented"
                 )
+
+    def is_available(self, zone: ZoneId) -> bool:
+        return self.local_zone == zone or self.health.allow(zone)
+
+    def new_client(self, base_url: BaseUrl) -> Client:
+        settings = self.client_settings
+        limits = httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry_seconds,
+        )
+        transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(limits=limits, http2=settings.http2)
+        if settings.compression:
+            transport = CompressingTransport(transport, settings.compression_min_bytes)
+        return Client(
+            base_url=base_url,
+            timeout=httpx.Timeout(settings.timeout_seconds),
+            httpx_args={"transport": transport},
+        )
+
+    async def close(self) -> None:
+        clients = list(self.remote_clients.values()) + self.retired_clients
+        self.remote_clients = dict()
+        self.retired_clients = []
+        for client in clients:
+            await client.close()
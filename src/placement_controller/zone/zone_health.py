@@ -0,0 +1,190 @@
+from typing import Deque, Dict, Iterator, List, Optional
+
+from collections import deque
+from enum import StrEnum
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+from pydantic_settings import BaseSettings
+
+from placement_controller.util.clock import Clock
+
+ZoneId = str
+
+LATENCY_QUANTILES: List[float] = [0.5, 0.9, 0.99]
+
+
+class ZoneHealthSettings(BaseSettings):
+    # latest requests per zone used for latency percentiles and the error rate
+    window_size: int = 100
+    # consecutive failures opening the circuit of a zone
+    failure_threshold: int = 3
+    # an open circuit lets a single probe request through after this time
+    open_seconds: float = 30.0
+    # request timeout of a zone is this latency percentile times timeout_factor,
+    # bounded by min_timeout_seconds and the zone client timeout
+    timeout_percentile: float = 0.99
+    timeout_factor: float = 3.0
+    min_timeout_seconds: float = 0.5
+    # latency samples needed before the timeout adapts
+    min_samples: int = 10
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class ZoneHealth:
+    """
+    Request outcomes of one zone and its circuit.
+    The circuit opens after failure_threshold consecutive failures. Once open_seconds have passed a single
+    probe request is let through; it closes the circuit on success and opens it again on failure.
+    """
+
+    settings: ZoneHealthSettings
+    state: CircuitState
+    # latencies of successful requests, in seconds
+    latencies: Deque[float]
+    outcomes: Deque[bool]
+    consecutive_failures: int
+    # open since, or probe sent at when half open
+    changed_at: int
+    successes: int
+    failures: int
+
+    def __init__(self, settings: ZoneHealthSettings):
+        self.settings = settings
+        self.state = CircuitState.CLOSED
+        self.latencies = deque(maxlen=max(settings.window_size, 1))
+        self.outcomes = deque(maxlen=max(settings.window_size, 1))
+        self.consecutive_failures = 0
+        self.changed_at = 0
+        self.successes = 0
+        self.failures = 0
+
+    def allow(self, now: int) -> bool:
+        if self.state == CircuitState.CLOSED:
+            return True
+        # a lost probe does not keep the circuit half open forever
+        if now - self.changed_at >= self.settings.open_seconds * 1000:
+            self.state = CircuitState.HALF_OPEN
+            self.changed_at = now
+            return True
+        return False
+
+    def record_success(self, latency_seconds: float) -> None:
+        self.successes += 1
+        self.latencies.append(latency_seconds)
+        self.outcomes.append(True)
+        self.consecutive_failures = 0
+        self.state = CircuitState.CLOSED
+
+    def record_failure(self, now: int) -> None:
+        self.failures += 1
+        self.outcomes.append(False)
+        self.consecutive_failures += 1
+        if self.state == CircuitState.HALF_OPEN or self.consecutive_failures >= self.settings.failure_threshold:
+            self.state = CircuitState.OPEN
+            self.changed_at = now
+
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def latency_percentile(self, quantile: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        latencies = sorted(self.latencies)
+        index = min(int(quantile * len(latencies)), len(latencies) - 1)
+        return latencies[index]
+
+    def timeout_seconds(self, max_timeout_seconds: float) -> float:
+        latency = self.latency_percentile(self.settings.timeout_percentile)
+        if latency is None or len(self.latencies) < self.settings.min_samples:
+            return max_timeout_seconds
+        timeout = max(latency * self.settings.timeout_factor, self.settings.min_timeout_seconds)
+        return min(timeout, max_timeout_seconds)
+
+
+class ZoneHealthRegistry:
+    """Health of the remote zones, fed by the zone clients and consulted before sending bids."""
+
+    settings: ZoneHealthSettings
+    clock: Clock
+    max_timeout_seconds: float
+    zones: Dict[ZoneId, ZoneHealth]
+
+    def __init__(self, settings: ZoneHealthSettings, clock: Clock, max_timeout_seconds: float):
+        self.settings = settings
+        self.clock = clock
+        self.max_timeout_seconds = max_timeout_seconds
+        self.zones = dict()
+
+    def get(self, zone: ZoneId) -> ZoneHealth:
+        health = self.zones.get(zone)
+        if health is None:
+            health = ZoneHealth(self.settings)
+            self.zones[zone] = health
+        return health
+
+    def allow(self, zone: ZoneId) -> bool:
+        return self.get(zone).allow(self.clock.now_millis())
+
+    def record_success(self, zone: ZoneId, latency_seconds: float) -> None:
+        self.get(zone).record_success(latency_seconds)
+
+    def record_failure(self, zone: ZoneId) -> None:
+        self.get(zone).record_failure(self.clock.now_millis())
+
+    def timeout_seconds(self, zone: ZoneId) -> float:
+        return self.get(zone).timeout_seconds(self.max_timeout_seconds)
+
+    def state(self, zone: ZoneId) -> CircuitState:
+        return self.get(zone).state
+
+
+class ZoneHealthCollector(Collector):
+    """Exports the zone health registry, evaluated on every scrape."""
+
+    registry: ZoneHealthRegistry
+
+    def __init__(self, registry: ZoneHealthRegistry):
+        self.registry = registry
+
+    def collect(self) -> Iterator[CounterMetricFamily | GaugeMetricFamily]:
+        requests = CounterMetricFamily(
+            "placement_zone_requests", "Bid requests sent to a zone by outcome.", labels=["zone", "outcome"]
+        )
+        state = GaugeMetricFamily(
+            "placement_zone_circuit_state",
+            "Circuit state of a zone, 1 for the current state.",
+            labels=["zone", "state"],
+        )
+        error_rate = GaugeMetricFamily(
+            "placement_zone_error_rate", "Share of failed requests within the window.", labels=["zone"]
+        )
+        latency = GaugeMetricFamily(
+            "placement_zone_latency_seconds", "Latency percentiles of successful requests.", labels=["zone", "quantile"]
+        )
+        timeout = GaugeMetricFamily("placement_zone_timeout_seconds", "Adaptive request timeout.", labels=["zone"])
+
+        for zone, health in sorted(self.registry.zones.items()):
+            requests.add_metric([zone, "success"], health.successes)
+            requests.add_metric([zone, "failure"], health.failures)
+            for circuit_state in CircuitState:
+                state.add_metric([zone, circuit_state.value], 1 if health.state == circuit_state else 0)
+            error_rate.add_metric([zone], health.error_rate())
+            for quantile in LATENCY_QUANTILES:
+                value = health.latency_percentile(quantile)
+                if value is not None:
+                    latency.add_metric([zone, str(quantile)], value)
+            timeout.add_metric([zone], health.timeout_seconds(self.registry.max_timeout_seconds))
+
+        yield requests
+        yield state
+        yield error_rate
+        yield latency
+        yield timeout